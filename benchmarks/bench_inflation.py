@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark inflation adjustment on a synthetic 10k-row award table.
+
+Compares the previous row-wise ``df.apply(calc)`` loop with the vectorised
+:class:`~tpsplots.processors.inflation_adjustment_processor.InflationAdjustmentProcessor`
+and checks both produce the same values.
+
+Usage:
+    python benchmarks/bench_inflation.py [--rows 10000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable, Mapping
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from tpsplots.data_sources.inflation import NNSI
+from tpsplots.processors.inflation_adjustment_processor import (
+    InflationAdjustmentConfig,
+    InflationAdjustmentProcessor,
+)
+
+MONEY_COLUMNS = ["Obligated", "Outlayed", "Ceiling"]
+
+
+class SyntheticNNSI(NNSI):
+    """NNSI with an in-memory table so the benchmark never touches the network."""
+
+    def _load_table(self) -> Mapping[str, float]:
+        table = {str(year): 1 + (int(self.year) - year) * 0.03 for year in range(1959, 2031)}
+        table["TQ"] = table["1976"]
+        table["1976 TQ"] = table["TQ"]
+        return table
+
+
+def make_awards(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Return a synthetic award table with datetime fiscal years and some gaps."""
+    rng = np.random.default_rng(seed)
+    years = rng.integers(1990, 2026, size=rows)
+    df = pd.DataFrame(
+        {
+            "Fiscal Year": [datetime(int(year), 1, 1) for year in years],
+            **{col: rng.gamma(2.0, 5e6, size=rows) for col in MONEY_COLUMNS},
+        }
+    )
+    df.loc[rng.random(rows) < 0.05, "Outlayed"] = np.nan
+    return df
+
+
+def row_wise(nnsi: NNSI, df: pd.DataFrame) -> pd.DataFrame:
+    """The per-row implementation the processor used before vectorisation."""
+    df = df.copy()
+    for col in MONEY_COLUMNS:
+        df[f"{col}_adjusted_nnsi"] = df.apply(
+            lambda row, c=col: (
+                nnsi.calc(row["Fiscal Year"], row[c]) if pd.notna(row[c]) else np.nan
+            ),
+            axis=1,
+        )
+    return df
+
+
+def best_of(fn: Callable[[], pd.DataFrame], repeat: int) -> tuple[float, pd.DataFrame]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_awards(args.rows)
+    processor = InflationAdjustmentProcessor(InflationAdjustmentConfig(target_year=2025))
+    processor.config.nnsi_columns = MONEY_COLUMNS
+    processor._nnsi = SyntheticNNSI(year="2025")
+
+    before, expected = best_of(lambda: row_wise(processor._nnsi, df), args.repeat)
+    after, actual = best_of(lambda: processor.process(df), args.repeat)
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False)
+    print(f"{args.rows} rows x {len(MONEY_COLUMNS)} columns (best of {args.repeat})")
+    print(f"  row-wise apply: {before * 1000:9.2f} ms")
+    print(f"  vectorised:     {after * 1000:9.2f} ms")
+    print(f"  speedup:        {before / after:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""Time every stage of the static render pipeline for each chart type.
+
+One case per ``VIEW_REGISTRY`` entry: the ``yaml/examples`` config where it
+reads a local CSV, otherwise a fixture in ``benchmarks/fixtures`` built on
+the same CSVs, so no case touches the network. Each case is timed stage by
+stage through ``YAMLChartProcessor``'s public step methods, mirroring
+``YAMLChartProcessor.generate_chart``:
+
+* ``yaml_load`` - ``load_yaml``: read and parse the YAML file
+* ``data_resolve`` - ``resolve_data``: ``DataResolver.resolve`` (uncached)
+* ``template_resolution`` - ``resolve_templates``: substitute ``{{...}}``
+  references in ``chart:`` (its data fetch is counted as ``data_resolve``)
+* ``validate`` - ``validate_config``: Pydantic validation of the resolved config
+* ``render_context`` - ``render_context``: ``build_render_context``
+* ``view_prepare`` - view construction plus the chart method's own
+  preprocessing, up to ``ChartView.generate_chart``
+* ``create.<device>`` - ``_create_chart_with_overlays`` for each device style
+  (layout passes, direct-label placement and annotations included)
+* ``save.<device>.<format>`` - ``_save_chart`` broken down by svg/png/pptx
+* ``total`` - everything above
+
+Results are written as JSON so runs can be compared across commits:
+
+    python benchmarks/bench_pipeline.py -o before.json
+    git switch my-branch
+    python benchmarks/bench_pipeline.py -o after.json --compare before.json
+
+Usage:
+    python benchmarks/bench_pipeline.py [--repeat 3] [--chart-type bar_plot ...]
+        [--output results.json] [--compare baseline.json] [--threshold 1.2] [--min-ms 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path("benchmarks/fixtures")
+EXAMPLES = Path("yaml/examples")
+
+# chart type -> config, relative to the repository root (CSV sources resolve from there)
+CASES: dict[str, Path] = {
+    "area_plot": EXAMPLES / "area_budget_composition.yaml",
+    "bar_plot": EXAMPLES / "bar.yaml",
+    "scatter_plot": EXAMPLES / "scatter.yaml",
+    "treemap_plot": EXAMPLES / "viking_cost_breakdown_treemap.yaml",
+    "us_map_pie_plot": EXAMPLES / "fy2025_nasa_drp_center_workforce_map.yaml",
+    "line_plot": FIXTURES / "line.yaml",
+    "donut_plot": FIXTURES / "donut.yaml",
+    "lollipop_plot": FIXTURES / "lollipop.yaml",
+    "stacked_bar_plot": FIXTURES / "stacked_bar.yaml",
+    "waffle_plot": FIXTURES / "waffle.yaml",
+    "line_subplots_plot": FIXTURES / "line_subplots.yaml",
+    "grouped_bar_plot": FIXTURES / "grouped_bar.yaml",
+}
+
+
+class StageTimer:
+    """Accumulates named wall-clock timings for one pipeline run.
+
+    Stages may nest. An ``exclusive`` stage leaves out the time spent in the
+    stages nested inside it, so a step that calls another timed step is not
+    counted twice.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        # Seconds spent in nested stages, one entry per open stage.
+        self._nested: list[float] = []
+
+    @contextmanager
+    def stage(self, name: str, exclusive: bool = False):
+        start = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            own = elapsed - nested if exclusive else elapsed
+            self.timings[name] = self.timings.get(name, 0.0) + own
+
+    def wrap(self, name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.stage(name):
+                return fn(*args, **kwargs)
+
+        return timed
+
+
+class _Captured(Exception):
+    """Raised from the patched ``generate_chart`` to stop after preprocessing."""
+
+    def __init__(self, metadata: dict, stem: str, kwargs: dict) -> None:
+        super().__init__(stem)
+        self.metadata, self.stem, self.kwargs = metadata, stem, kwargs
+
+
+def run_once(yaml_path: Path, outdir: Path) -> dict[str, float]:
+    """Run the full pipeline for ``yaml_path`` once and return per-stage seconds."""
+    from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+    from tpsplots.views.render_params import RenderParams
+
+    timer = StageTimer()
+
+    class TimedProcessor(YAMLChartProcessor):
+        """Times each pipeline step as the real processor runs it."""
+
+        def load_yaml(self):
+            with timer.stage("yaml_load"):
+                return super().load_yaml()
+
+        def resolve_data(self, data_source=None):
+            if self.data is not None:
+                return self.data
+            with timer.stage("data_resolve"):
+                return super().resolve_data(data_source)
+
+        def resolve_templates(self, raw_config):
+            with timer.stage("template_resolution", exclusive=True):
+                return super().resolve_templates(raw_config)
+
+        def validate_config(self, raw_config):
+            with timer.stage("validate"):
+                return super().validate_config(raw_config)
+
+        def render_context(self):
+            with timer.stage("render_context", exclusive=True):
+                return super().render_context()
+
+    start = time.perf_counter()
+    processor = TimedProcessor(yaml_path, outdir=outdir)
+    with timer.stage("view_prepare", exclusive=True):
+        ctx, view = processor.prepare_render()
+
+    def capture(metadata, stem, **kwargs):
+        raise _Captured(metadata, stem, kwargs)
+
+    view.generate_chart = capture
+    with timer.stage("view_prepare"):
+        try:
+            getattr(view, ctx.chart_type_v1)(
+                metadata=ctx.resolved_metadata, stem=ctx.output_name, **ctx.resolved_params
+            )
+        except _Captured as captured:
+            metadata, stem, kwargs = captured.metadata, captured.stem, captured.kwargs
+        else:
+            raise RuntimeError(f"{ctx.chart_type_v1} did not call generate_chart")
+        kwargs.pop("export_data", None)
+
+    view._create_pptx = timer.wrap("save.desktop.pptx", view._create_pptx)
+    params = RenderParams(kwargs)
+    for device, suffix, save_options in view._VARIANTS:
+        chart_kwargs = params.for_render()
+        chart_kwargs["style"] = view.device_style(device)
+        with timer.stage(f"create.{device}"):
+            fig = view._create_chart_with_overlays(metadata, **chart_kwargs)
+
+        savefig = fig.savefig
+
+        def timed_savefig(*args, format=None, _device=device, _savefig=savefig, **kw):
+            with timer.stage(f"save.{_device}.{format}"):
+                return _savefig(*args, format=format, **kw)
+
+        fig.savefig = timed_savefig
+        with timer.stage(f"save.{device}"):
+            view._save_chart(fig, f"{stem}{suffix}", metadata, **save_options)
+
+    timer.timings["total"] = time.perf_counter() - start
+    return timer.timings
+
+
+def summarize(runs: list[dict[str, float]]) -> dict[str, dict[str, Any]]:
+    stages: dict[str, dict[str, Any]] = {}
+    for name in runs[0]:
+        samples = [run[name] for run in runs if name in run]
+        stages[name] = {
+            "min": min(samples),
+            "median": statistics.median(samples),
+            "runs": samples,
+        }
+    return stages
+
+
+def environment() -> dict[str, Any]:
+    import matplotlib
+    import numpy as np
+    import pandas as pd
+
+    from tpsplots import __version__
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=REPO_ROOT
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "tpsplots": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "matplotlib": matplotlib.__version__,
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float, min_delta: float) -> list[str]:
+    """Print median ratios against ``baseline``; return the regressed stages.
+
+    A stage regresses when its median is at least ``threshold`` times the
+    baseline *and* at least ``min_delta`` seconds slower, so sub-millisecond
+    stages do not trip on timer noise.
+    """
+    regressions = []
+    print(f"\nCompared with {baseline['environment'].get('git_commit') or 'baseline'}:")
+    for chart_type, result in current["charts"].items():
+        base = baseline["charts"].get(chart_type)
+        if base is None:
+            continue
+        for stage, stats in result["stages"].items():
+            base_stats = base["stages"].get(stage)
+            if not base_stats or base_stats["median"] <= 0:
+                continue
+            ratio = stats["median"] / base_stats["median"]
+            regressed = ratio >= threshold and stats["median"] - base_stats["median"] >= min_delta
+            if stage == "total" or regressed:
+                flag = "  REGRESSION" if regressed else ""
+                print(
+                    f"  {chart_type:20s} {stage:24s} {base_stats['median'] * 1000:9.1f} ms -> "
+                    f"{stats['median'] * 1000:9.1f} ms  x{ratio:5.2f}{flag}"
+                )
+            if regressed:
+                regressions.append(f"{chart_type}:{stage}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per chart type")
+    parser.add_argument(
+        "--chart-type", action="append", choices=sorted(CASES), help="limit to these types"
+    )
+    parser.add_argument("-o", "--output", type=Path, help="write JSON results here")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to compare medians against")
+    parser.add_argument(
+        "--threshold", type=float, default=1.2, help="slowdown ratio reported as a regression"
+    )
+    parser.add_argument(
+        "--min-ms", type=float, default=5.0, help="ignore slowdowns smaller than this"
+    )
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    from tpsplots.views import VIEW_REGISTRY
+
+    missing = sorted(set(VIEW_REGISTRY) - set(CASES))
+    if missing:
+        print(f"warning: no benchmark case for {', '.join(missing)}", file=sys.stderr)
+
+    results: dict[str, Any] = {"environment": environment(), "repeat": args.repeat, "charts": {}}
+    with tempfile.TemporaryDirectory(prefix="tpsplots-bench-") as tmp:
+        for chart_type in args.chart_type or list(CASES):
+            yaml_path = CASES[chart_type]
+            outdir = Path(tmp) / chart_type
+            run_once(yaml_path, outdir)  # warm-up: imports, fonts, caches
+            runs = [run_once(yaml_path, outdir) for _ in range(args.repeat)]
+            stages = summarize(runs)
+            results["charts"][chart_type] = {"config": str(yaml_path), "stages": stages}
+            print(f"{chart_type:20s} total {stages['total']['median'] * 1000:9.1f} ms (median)")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Wrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare(results, baseline, args.threshold, args.min_ms / 1000):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
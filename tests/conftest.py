@@ -24,6 +24,33 @@ def bump_mtime(path: Path) -> None:
     os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
 
 
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path_factory, monkeypatch):
+    """Point the shared HTTP cache at a throwaway directory for every test.
+
+    Keeps tests from reading or polluting the user's real ``~/.cache``.
+    """
+    from tpsplots.data_sources import http_cache
+
+    cache = http_cache.HTTPCache(tmp_path_factory.mktemp("http-cache"))
+    monkeypatch.setattr(http_cache, "_http_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_inflation_tables():
+    """Start every test with an empty inflation index registry.
+
+    Test doubles share a class and a ``None`` source but load different
+    in-memory tables, so memoized indexes must not leak between tests.
+    """
+    from tpsplots.data_sources.inflation import Inflation
+
+    Inflation.clear_cache()
+    yield
+    Inflation.clear_cache()
+
+
 @pytest.fixture
 def line_view(tmp_path):
     from tpsplots.views.line_chart import LineChartView
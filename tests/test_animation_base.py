@@ -134,6 +134,39 @@ def test_apply_global_maps_wall_clock_to_draw_clock(make_video_figure):
     assert animator.last_t == 0.0
 
 
+def test_frame_key_groups_holds_and_idle_stretches(make_video_figure):
+    fig = make_video_figure()
+    animator = _animator(fig, intro_hold=0.5, end_hold=1.0)
+    animator.prepare()
+
+    # Intro hold: every frame shows draw-phase t=0.
+    assert animator.frame_key(0.0) == animator.frame_key(0.5)
+    # The one window spans the whole draw phase: each frame differs.
+    assert animator.frame_key(0.75) != animator.frame_key(1.0)
+    # End hold: every frame shows the final state.
+    assert animator.frame_key(1.5) == animator.frame_key(2.5)
+
+
+class _GapAnimator(_NullAnimator):
+    """Two windows with an idle second between them."""
+
+    def build_timeline(self):
+        timeline = Timeline()
+        timeline.add("first", Window(0.0, 1.0))
+        timeline.add("second", Window(2.0, 1.0))
+        return timeline
+
+
+def test_frame_key_groups_idle_gap_between_windows(make_video_figure):
+    fig = make_video_figure()
+    animator = _GapAnimator(fig, resolve_animation(), CHOREOGRAPHY["line_plot"])
+    animator.prepare()
+
+    assert animator.frame_key(1.0) == animator.frame_key(1.5) == animator.frame_key(1.99)
+    assert animator.frame_key(1.99) != animator.frame_key(2.0)
+    assert animator.frame_key(0.5) != animator.frame_key(1.0)
+
+
 def test_total_duration_composition(make_video_figure):
     fig = make_video_figure()
     animator = _animator(fig, end_hold=2.0)
@@ -0,0 +1,146 @@
+"""Pixel-diff tests for blitted animation frames (tpsplots.animation.blit).
+
+Every blitted frame must be byte-identical to what ``FFMpegWriter.grab_frame``
+pipes to ffmpeg for the same animator time (a full ``savefig`` to raw RGBA),
+so z-order and alpha blending are checked for each animatable chart family.
+"""
+
+import io
+import types
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from tpsplots.animation.animators import get_animator
+from tpsplots.animation.blit import blitting, redraw_order
+from tpsplots.animation.config import CHOREOGRAPHY, resolve_animation
+from tpsplots.views import AreaChartView
+from tpsplots.views.bar_chart import BarChartView
+from tpsplots.views.grouped_bar_chart import GroupedBarChartView
+from tpsplots.views.lollipop_chart import LollipopChartView
+from tpsplots.views.stacked_bar_chart import StackedBarChartView
+
+CASES = {
+    "line_plot": {
+        "x": [2000, 2001, 2002, 2003],
+        "y": [[1, 3, 2, 4], [float("nan"), 2, 3, 1]],
+        "direct_line_labels": {"end_point": True},
+        "legend": True,
+    },
+    "area_plot": {
+        "view_cls": AreaChartView,
+        "x": [1, 2, 3, 4],
+        "y": [[1, 2, 1, 3], [2, 1, 3, 2]],
+        "legend": True,
+        "fiscal_year_ticks": False,
+    },
+    "bar_plot": {
+        "view_cls": BarChartView,
+        "categories": ["A", "B", "C"],
+        "values": [3, -5, 2],
+        "show_values": True,
+    },
+    "stacked_bar_plot": {
+        "view_cls": StackedBarChartView,
+        "categories": ["A", "B", "C"],
+        "values": {"X": [1, 2, 3], "Y": [4, 5, 6]},
+        "show_values": True,
+        "stack_labels": True,
+    },
+    "grouped_bar_plot": {
+        "view_cls": GroupedBarChartView,
+        "categories": ["A", "B"],
+        "groups": [
+            {"label": "G1", "values": [1, 2], "stacked_values": [3]},
+            {"label": "G2", "values": [3, 4]},
+        ],
+        "show_values": True,
+    },
+    "lollipop_plot": {
+        "view_cls": LollipopChartView,
+        "categories": ["A", "B"],
+        "start_values": [1, 2],
+        "end_values": [5, 6],
+    },
+}
+
+
+def _prepared(make_video_figure, chart_type):
+    fig = make_video_figure(**CASES[chart_type])
+    animator = get_animator(chart_type)(
+        fig, resolve_animation(intro_hold=0.2), CHOREOGRAPHY[chart_type]
+    )
+    animator.prepare()
+    return fig, animator
+
+
+def _grabbed(fig) -> bytes:
+    """The bytes ``FFMpegWriter.grab_frame`` would write for the current frame."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="rgba", dpi=fig.dpi)
+    return buffer.getvalue()
+
+
+def _writer(fig, **overrides):
+    width, height = fig.canvas.get_width_height()
+    attrs = {"frame_format": "rgba", "dpi": fig.dpi, "frame_size": (width, height)}
+    attrs.update(overrides)
+    return types.SimpleNamespace(**attrs)
+
+
+@pytest.mark.parametrize("chart_type", sorted(CASES))
+def test_blitted_frames_match_full_draw(make_video_figure, chart_type):
+    fig, animator = _prepared(make_video_figure, chart_type)
+    times = np.linspace(0.0, animator.total_duration, 7)
+
+    blitted = []
+    with blitting(fig, _writer(fig)) as blit:
+        assert blit is not None
+        for t in times:
+            animator.apply_global(t)
+            blitted.append(bytes(blit.render()))
+
+    for t, frame in zip(times, blitted, strict=True):
+        animator.apply_global(t)
+        full = _grabbed(fig)
+        diff = np.abs(
+            np.frombuffer(frame, np.uint8).astype(int) - np.frombuffer(full, np.uint8)
+        ).max()
+        assert diff == 0, f"{chart_type} frame at t={t:.2f} differs by {diff}"
+
+
+def test_redraw_starts_at_first_tagged_artist(make_video_figure):
+    fig, _animator = _prepared(make_video_figure, "bar_plot")
+    redraw = redraw_order(fig)
+    ax = fig.axes[0]
+
+    # Axis artists (ticks, gridlines, labels) are drawn below the bars and stay cached.
+    assert ax.xaxis not in redraw and ax.yaxis not in redraw
+    assert all(spine in redraw for spine in ax.spines.values())
+
+
+def test_release_restores_normal_drawing(make_video_figure):
+    fig, _animator = _prepared(make_video_figure, "line_plot")
+    redraw = redraw_order(fig)
+
+    with blitting(fig, _writer(fig)):
+        assert all(artist.get_animated() for artist in redraw)
+
+    assert not any(artist.get_animated() for artist in redraw)
+
+
+def test_untagged_figure_is_not_blitted():
+    fig = plt.figure()
+    try:
+        with blitting(fig, _writer(fig)) as blit:
+            assert blit is None
+    finally:
+        plt.close(fig)
+
+
+def test_frame_size_mismatch_falls_back(make_video_figure):
+    fig, _animator = _prepared(make_video_figure, "line_plot")
+
+    with blitting(fig, _writer(fig, frame_size=(2, 2))) as blit:
+        assert blit is None
@@ -19,10 +19,16 @@ import pytest
 from tpsplots.animation.encoder import (
     BT709_ARGS,
     QUALITY_ARGS,
+    SEGMENT_ARGS,
+    SEGMENT_CODEC,
     FFmpegUnavailableError,
+    concat_segments,
+    frame_count,
     resolve_ffmpeg,
     write_mp4,
+    write_segment,
 )
+from tpsplots.exceptions import RenderingError
 
 
 def _fake_imageio(monkeypatch, *, exe=None, error=None):
@@ -81,7 +87,11 @@ class TestResolveFfmpeg:
 
 
 class _StubWriter:
-    """Records init kwargs, provides a context-manager saving(), counts frames."""
+    """Records init kwargs, provides a context-manager saving(), counts frames.
+
+    ``saving()`` also sets the attributes the held-frame path reads from a real
+    ``FFMpegWriter``, with a byte sink standing in for ffmpeg's stdin.
+    """
 
     last: _StubWriter | None = None
 
@@ -89,33 +99,45 @@ class _StubWriter:
         self.kwargs = kwargs
         self.grab_count = 0
         self.saving_args = None
+        self.frames_written = 0
         _StubWriter.last = self
 
     @contextmanager
     def saving(self, fig, path, dpi):
         self.saving_args = (fig, path, dpi)
+        self.fig, self.dpi, self.frame_format = fig, dpi, "rgba"
+        self._w, self._h = fig.get_size_inches()
+        self._proc = types.SimpleNamespace(stdin=self)
         yield self
 
+    def write(self, data):
+        self.frames_written += 1
+
     def grab_frame(self, **kwargs):
         self.grab_count += 1
+        self.frames_written += 1
 
 
 class _FakeAnimator:
     total_duration = 1.0
 
-    def __init__(self):
+    def __init__(self, still_until=0.0):
         self.ts: list[float] = []
+        self.still_until = still_until
 
     def apply_global(self, t):
         self.ts.append(t)
 
+    def frame_key(self, t):
+        return "still" if t < self.still_until else t
+
 
 class TestWriteMp4:
-    def _run(self, tmp_path, monkeypatch, *, quality="high", on_frame=None):
+    def _run(self, tmp_path, monkeypatch, *, quality="high", on_frame=None, still_until=0.0):
         monkeypatch.setattr(matplotlib.animation, "FFMpegWriter", _StubWriter)
         _StubWriter.last = None
         fig = plt.figure()
-        animator = _FakeAnimator()
+        animator = _FakeAnimator(still_until)
         out_path = tmp_path / "sub" / "clip.mp4"
         try:
             result = write_mp4(fig, animator, out_path, fps=10, quality=quality, on_frame=on_frame)
@@ -161,3 +183,93 @@ class TestWriteMp4:
         assert len(calls) == 11
         assert calls[0] == (1, 11)
         assert calls[-1] == (11, 11)
+
+    def test_static_frames_drawn_once_and_repeated(self, tmp_path, monkeypatch):
+        calls: list[tuple[int, int]] = []
+        _result, animator, writer, _out = self._run(
+            tmp_path,
+            monkeypatch,
+            still_until=0.45,
+            on_frame=lambda cur, total: calls.append((cur, total)),
+        )
+        # Frames at t=0.0..0.4 share one key: applied once, then 6 distinct frames.
+        assert animator.ts == pytest.approx([0.0, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0])
+        assert writer.grab_count == 6
+        assert writer.frames_written == 11
+        # Progress still ticks once per frame.
+        assert calls == [(i, 11) for i in range(1, 12)]
+
+
+class TestWriteSegment:
+    def test_renders_only_its_frame_range(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(matplotlib.animation, "FFMpegWriter", _StubWriter)
+        fig = plt.figure()
+        animator = _FakeAnimator()
+        calls: list[tuple[int, int]] = []
+        try:
+            write_segment(
+                fig,
+                animator,
+                tmp_path / "seg" / "0001.mkv",
+                fps=10,
+                frames=range(4, 7),
+                on_frame=lambda cur, total: calls.append((cur, total)),
+            )
+        finally:
+            plt.close(fig)
+
+        writer = _StubWriter.last
+        assert writer.grab_count == 3
+        assert animator.ts == pytest.approx([0.4, 0.5, 0.6])
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+        # Lossless intermediate — no x264 args until the final join.
+        assert writer.kwargs["codec"] == SEGMENT_CODEC
+        assert writer.kwargs["extra_args"] == SEGMENT_ARGS
+
+    def test_frame_count_is_inclusive(self):
+        assert frame_count(_FakeAnimator(), 10) == 11
+
+
+class TestConcatSegments:
+    def _segments(self, tmp_path):
+        segments = [tmp_path / "0000.mkv", tmp_path / "0001.mkv"]
+        for segment in segments:
+            segment.write_bytes(b"")
+        return segments
+
+    def test_joins_with_serial_encode_args(self, tmp_path, monkeypatch):
+        import subprocess
+
+        monkeypatch.setattr("tpsplots.animation.encoder.resolve_ffmpeg", lambda: "/fake/bin/ffmpeg")
+        runs: list[list[str]] = []
+
+        def fake_run(args, **kwargs):
+            runs.append(args)
+            return subprocess.CompletedProcess(args, 0, "", "")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        segments = self._segments(tmp_path)
+
+        concat_segments(segments, tmp_path / "out" / "clip.mp4", fps=60, quality="draft")
+
+        args = runs[0]
+        assert args[0] == "/fake/bin/ffmpeg"
+        assert args[args.index("-f") + 1] == "concat"
+        assert args[args.index("-r") + 1] == "60"
+        start = args.index("-vcodec") + 2
+        assert args[start:-2] == [*BT709_ARGS, *QUALITY_ARGS["draft"]]
+        listing = (tmp_path / "segments.txt").read_text(encoding="utf-8").splitlines()
+        assert listing == [f"file '{segment.resolve()}'" for segment in segments]
+
+    def test_ffmpeg_failure_raises_rendering_error(self, tmp_path, monkeypatch):
+        import subprocess
+
+        monkeypatch.setattr("tpsplots.animation.encoder.resolve_ffmpeg", lambda: "ffmpeg")
+        monkeypatch.setattr(
+            subprocess,
+            "run",
+            lambda args, **kwargs: subprocess.CompletedProcess(args, 1, "", "bad segment"),
+        )
+
+        with pytest.raises(RenderingError, match="bad segment"):
+            concat_segments(self._segments(tmp_path), tmp_path / "clip.mp4", fps=30)
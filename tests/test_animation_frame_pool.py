@@ -0,0 +1,86 @@
+"""Tests for the animation process pools (no worker processes, no ffmpeg)."""
+
+from __future__ import annotations
+
+import queue
+from concurrent.futures import Future
+
+import pytest
+
+from tpsplots.animation.frame_pool import (
+    _relay_format_progress,
+    _relay_progress,
+    shard_frames,
+)
+
+
+class TestShardFrames:
+    def test_contiguous_cover_of_all_frames(self):
+        shards = shard_frames(181, 4)
+
+        assert [i for shard in shards for i in shard] == list(range(181))
+        assert [len(shard) for shard in shards] == [46, 45, 45, 45]
+
+    def test_never_more_shards_than_frames(self):
+        assert shard_frames(2, 8) == [range(0, 1), range(1, 2)]
+
+    @pytest.mark.parametrize("shards", [0, 1])
+    def test_single_shard(self, shards):
+        assert shard_frames(5, shards) == [range(0, 5)]
+
+
+def _finished(exc: BaseException | None = None) -> Future:
+    future: Future = Future()
+    if exc is None:
+        future.set_result(None)
+    else:
+        future.set_exception(exc)
+    return future
+
+
+class TestRelayProgress:
+    def test_one_call_per_frame_ending_at_total(self):
+        ticks: queue.Queue = queue.Queue()
+        for _ in range(5):
+            ticks.put(1)
+        calls: list[tuple[int, int]] = []
+
+        _relay_progress(ticks, [_finished()], 5, lambda cur, total: calls.append((cur, total)))
+
+        assert calls == [(1, 5), (2, 5), (3, 5), (4, 5), (5, 5)]
+
+    def test_stops_when_a_worker_fails(self):
+        ticks: queue.Queue = queue.Queue()
+        ticks.put(1)
+        calls: list[tuple[int, int]] = []
+
+        _relay_progress(
+            ticks,
+            [_finished(RuntimeError("boom")), _finished()],
+            10,
+            lambda cur, total: calls.append((cur, total)),
+        )
+
+        assert calls == [(1, 10)]
+
+
+class TestRelayFormatProgress:
+    def test_forwards_interleaved_ticks_with_their_format(self):
+        ticks: queue.Queue = queue.Queue()
+        for tick in [("square", 1, 2), ("landscape", 1, 3), ("square", 2, 2)]:
+            ticks.put(tick)
+        calls: list[tuple[int, int, str]] = []
+
+        _relay_format_progress(ticks, [_finished(), _finished()], lambda *args: calls.append(args))
+
+        assert calls == [(1, 2, "square"), (1, 3, "landscape"), (2, 2, "square")]
+
+    def test_stops_when_a_worker_fails(self):
+        ticks: queue.Queue = queue.Queue()
+        calls: list[tuple[int, int, str]] = []
+
+        _relay_format_progress(
+            ticks, [_finished(RuntimeError("boom"))], lambda *args: calls.append(args)
+        )
+
+        assert calls == []
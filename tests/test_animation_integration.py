@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import subprocess
 import textwrap
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
@@ -98,3 +99,129 @@ def test_encode_dimensions_are_1080_square(encoded_line):
         check=False,
     )
     assert "1080x1080" in proc.stderr
+
+
+def _decoded_frames(mp4: Path) -> bytes:
+    proc = subprocess.run(
+        [resolve_ffmpeg(), "-loglevel", "error", "-i", str(mp4), "-f", "rawvideo", "-"],
+        capture_output=True,
+        check=True,
+    )
+    return proc.stdout
+
+
+def test_sharded_encode_matches_serial(encoded_line):
+    """``jobs=2`` renders frame shards in workers; the decoded video is identical."""
+    _outputs, outdir = encoded_line
+    yaml_path = outdir / "anim_line.yaml"
+    sharded_dir = outdir / "sharded"
+    calls: list[tuple[int, int]] = []
+
+    animate_yaml(
+        yaml_path,
+        outdir=sharded_dir,
+        fps=10,
+        duration=0.5,
+        intro_hold=0.0,
+        end_hold=0.1,
+        quality="draft",
+        jobs=2,
+        on_frame=lambda current, total: calls.append((current, total)),
+    )
+
+    total = calls[-1][1]
+    assert calls == [(i, total) for i in range(1, total + 1)]
+    assert _decoded_frames(sharded_dir / "anim_line_square.mp4") == _decoded_frames(
+        outdir / "anim_line_square.mp4"
+    )
+    # Segments are cleaned up with their temporary directory.
+    assert sorted(p.name for p in sharded_dir.iterdir()) == [
+        "anim_line_square.mp4",
+        "anim_line_square_poster.png",
+    ]
+
+
+def test_parallel_formats_match_serial(encoded_line):
+    """Formats encoded in their own workers keep their names, frames and posters."""
+    _outputs, outdir = encoded_line
+    yaml_path = outdir / "anim_line.yaml"
+    parallel_dir = outdir / "parallel"
+    calls: dict[str, list[tuple[int, int]]] = {}
+
+    def on_format_frame(current: int, total: int, fmt: str) -> None:
+        calls.setdefault(fmt, []).append((current, total))
+
+    outputs = animate_yaml(
+        yaml_path,
+        outdir=parallel_dir,
+        formats=("square", "landscape"),
+        fps=10,
+        duration=0.5,
+        intro_hold=0.0,
+        end_hold=0.1,
+        quality="draft",
+        parallel_formats=True,
+        on_format_frame=on_format_frame,
+    )
+
+    assert outputs == [
+        parallel_dir / "anim_line_square.mp4",
+        parallel_dir / "anim_line_square_poster.png",
+        parallel_dir / "anim_line_landscape.mp4",
+        parallel_dir / "anim_line_landscape_poster.png",
+    ]
+    for fmt_calls in calls.values():
+        total = fmt_calls[-1][1]
+        assert fmt_calls == [(i, total) for i in range(1, total + 1)]
+    assert set(calls) == {"square", "landscape"}
+    assert _decoded_frames(parallel_dir / "anim_line_square.mp4") == _decoded_frames(
+        outdir / "anim_line_square.mp4"
+    )
+    assert (parallel_dir / "anim_line_square_poster.png").read_bytes() == (
+        outdir / "anim_line_square_poster.png"
+    ).read_bytes()
+
+
+def test_held_frames_match_full_redraw(encoded_line, monkeypatch):
+    """Intro/end holds drawn once and repeated decode to the same video."""
+    import tpsplots.animation.encoder as encoder
+
+    _outputs, outdir = encoded_line
+    yaml_path = outdir / "anim_line.yaml"
+    settings = {"fps": 10, "duration": 0.3, "intro_hold": 0.3, "end_hold": 0.5, "quality": "draft"}
+
+    animate_yaml(yaml_path, outdir=outdir / "held", **settings)
+    monkeypatch.setattr(
+        encoder, "frame_runs", lambda animator, frames, fps: [(i, 1) for i in frames]
+    )
+    animate_yaml(yaml_path, outdir=outdir / "redrawn", **settings)
+
+    assert _decoded_frames(outdir / "held" / "anim_line_square.mp4") == _decoded_frames(
+        outdir / "redrawn" / "anim_line_square.mp4"
+    )
+
+
+def test_blitted_encode_matches_full_draw(encoded_line, monkeypatch):
+    """The default (blitted) encode decodes to the same video as full redraws."""
+    import tpsplots.animation.blit as blit
+
+    _outputs, outdir = encoded_line
+
+    @contextmanager
+    def no_blitting(fig, writer):
+        yield None
+
+    monkeypatch.setattr(blit, "blitting", no_blitting)
+    animate_yaml(
+        outdir / "anim_line.yaml",
+        outdir=outdir / "full_draw",
+        fps=10,
+        duration=0.5,
+        intro_hold=0.0,
+        end_hold=0.1,
+        quality="draft",
+    )
+
+    assert _decoded_frames(outdir / "full_draw" / "anim_line_square.mp4") == _decoded_frames(
+        outdir / "anim_line_square.mp4"
+    )
@@ -0,0 +1,66 @@
+"""Tests for editor animation previews: keyframe sampling and GIF packing."""
+
+from __future__ import annotations
+
+import io
+
+import matplotlib.pyplot as plt
+import pytest
+from PIL import Image
+
+from tpsplots.animation.preview import keyframes, write_gif
+
+
+class _StepAnimator:
+    """Holds still for its first and last third, moving in between."""
+
+    total_duration = 1.0
+
+    def __init__(self, fig):
+        self.fig = fig
+        self.applied: list[float] = []
+
+    def frame_key(self, t):
+        return min(max(t, 1 / 3), 2 / 3)
+
+    def apply_global(self, t):
+        self.applied.append(t)
+        self.fig.set_facecolor((self.frame_key(t),) * 3)
+
+
+@pytest.fixture
+def fig():
+    fig = plt.figure(figsize=(1, 1), dpi=20)
+    yield fig
+    plt.close(fig)
+
+
+def test_still_runs_collapse_into_one_keyframe(fig):
+    animator = _StepAnimator(fig)
+
+    frames = list(keyframes(fig, animator, fps=6))
+
+    # Frames 0-2 hold still, 3 moves, 4-6 hold the end state.
+    assert [(f.start_ms, f.duration_ms) for f in frames] == [(0, 500), (500, 167), (667, 500)]
+    assert animator.applied == [0.0, 0.5, 4 / 6]
+    assert {f.count for f in frames} == {3}
+    assert Image.open(io.BytesIO(frames[0].png)).size == (20, 20)
+
+
+def test_write_gif_keeps_frames_and_timing(fig):
+    frames = list(keyframes(fig, _StepAnimator(fig), fps=6))
+
+    gif = Image.open(io.BytesIO(write_gif(frames)))
+
+    assert gif.n_frames == 3
+    durations = []
+    for index in range(gif.n_frames):
+        gif.seek(index)
+        durations.append(gif.info["duration"])
+    # GIF delays are whole centiseconds.
+    assert durations == pytest.approx([500, 167, 500], abs=10)
+
+
+def test_write_gif_needs_a_frame():
+    with pytest.raises(ValueError):
+        write_gif([])
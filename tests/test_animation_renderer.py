@@ -69,6 +69,8 @@ def _patch_common(monkeypatch) -> _Recorders:
     monkeypatch.setattr(renderer, "write_mp4", spy_write_mp4)
 
     class FakeAnimator:
+        total_duration = 1.0
+
         def __init__(self, fig, anim, choreo, expected_px=None):
             rec.animator_records.append(
                 {"expected_px": expected_px, "anim": anim, "choreo": choreo}
@@ -202,3 +204,121 @@ def test_all_formats_produce_paired_outputs(tmp_path, monkeypatch):
     ]
     # Devices resolved per format.
     assert [c["device"] for c in rec.create_calls] == ["video_square", "video_landscape"]
+
+
+def test_jobs_routes_encode_to_frame_shards(tmp_path, monkeypatch):
+    rec = _patch_common(monkeypatch)
+    monkeypatch.setattr(renderer, "picklable", lambda *payload: True)
+    sharded: list[dict] = []
+
+    def spy_sharded(scene, out_path, *, frames, fps, quality, workers, on_frame=None):
+        sharded.append({"scene": scene, "out_path": out_path, "frames": frames, "workers": workers})
+
+    monkeypatch.setattr(renderer, "write_mp4_sharded", spy_sharded)
+    yaml_path = _line_yaml(tmp_path, output="sharded")
+
+    outputs = animate_yaml(yaml_path, outdir=tmp_path, jobs=4)
+
+    assert rec.write_calls == []
+    # total_duration 1.0 at the default 60fps -> 61 frames.
+    assert sharded[0]["frames"] == 61
+    assert sharded[0]["workers"] == 4
+    assert sharded[0]["scene"].device == "video_square"
+    assert outputs == [tmp_path / "sharded_square.mp4", tmp_path / "sharded_square_poster.png"]
+
+
+def test_jobs_falls_back_to_serial_when_unpicklable(tmp_path, monkeypatch):
+    rec = _patch_common(monkeypatch)
+    # The locally-defined fake animator class cannot be pickled.
+    yaml_path = _line_yaml(tmp_path)
+
+    animate_yaml(yaml_path, outdir=tmp_path, jobs=4)
+
+    assert len(rec.write_calls) == 1
+
+
+def test_parallel_formats_routes_to_concurrent_encode(tmp_path, monkeypatch, caplog):
+    rec = _patch_common(monkeypatch)
+    monkeypatch.setattr(renderer, "picklable", lambda *payload: True)
+    concurrent: list[dict] = []
+
+    def spy_encode_formats(scenes, outdir, output_name, *, fps, quality, on_frame=None):
+        concurrent.append({"scenes": scenes, "output_name": output_name, "fps": fps})
+        return [outdir / f"{output_name}_{fmt}.mp4" for fmt in scenes]
+
+    monkeypatch.setattr(renderer, "encode_formats", spy_encode_formats)
+    yaml_path = _line_yaml(tmp_path, output="multi")
+
+    with caplog.at_level(logging.WARNING, logger="tpsplots.animation.renderer"):
+        outputs = animate_yaml(
+            yaml_path,
+            outdir=tmp_path,
+            formats=("square", "landscape"),
+            jobs=4,
+            parallel_formats=True,
+        )
+
+    # Nothing is built or encoded in-process.
+    assert rec.create_calls == []
+    assert rec.write_calls == []
+    assert concurrent[0]["output_name"] == "multi"
+    assert {fmt: s.device for fmt, s in concurrent[0]["scenes"].items()} == {
+        "square": "video_square",
+        "landscape": "video_landscape",
+    }
+    assert outputs == [tmp_path / "multi_square.mp4", tmp_path / "multi_landscape.mp4"]
+    assert "--jobs is ignored" in caplog.text
+
+
+def test_parallel_formats_single_format_encodes_in_process(tmp_path, monkeypatch):
+    rec = _patch_common(monkeypatch)
+    monkeypatch.setattr(renderer, "picklable", lambda *payload: True)
+    monkeypatch.setattr(renderer, "encode_formats", pytest.fail)
+    yaml_path = _line_yaml(tmp_path)
+
+    animate_yaml(yaml_path, outdir=tmp_path, parallel_formats=True)
+
+    assert len(rec.write_calls) == 1
+
+
+def test_parallel_formats_falls_back_to_serial_when_unpicklable(tmp_path, monkeypatch):
+    rec = _patch_common(monkeypatch)
+    monkeypatch.setattr(renderer, "encode_formats", pytest.fail)
+    yaml_path = _line_yaml(tmp_path, output="multi")
+
+    outputs = animate_yaml(
+        yaml_path, outdir=tmp_path, formats=("square", "landscape"), parallel_formats=True
+    )
+
+    assert [c["out_path"] for c in rec.write_calls] == [
+        tmp_path / "multi_square.mp4",
+        tmp_path / "multi_landscape.mp4",
+    ]
+    assert len(outputs) == 4
+
+
+def test_parallel_formats_keep_two_argument_on_frame(tmp_path, monkeypatch):
+    """Concurrent encodes call on_frame as (current, total); fmt goes to on_format_frame."""
+    _patch_common(monkeypatch)
+    monkeypatch.setattr(renderer, "picklable", lambda *payload: True)
+
+    def spy_encode_formats(scenes, outdir, output_name, *, fps, quality, on_frame=None):
+        for fmt in scenes:
+            on_frame(1, 2, fmt)
+        return []
+
+    monkeypatch.setattr(renderer, "encode_formats", spy_encode_formats)
+    frames: list[tuple[int, int]] = []
+    format_frames: list[tuple[int, int, str]] = []
+
+    animate_yaml(
+        _line_yaml(tmp_path),
+        outdir=tmp_path,
+        formats=("square", "landscape"),
+        parallel_formats=True,
+        on_frame=lambda current, total: frames.append((current, total)),
+        on_format_frame=lambda current, total, fmt: format_frames.append((current, total, fmt)),
+    )
+
+    assert frames == [(1, 2), (1, 2)]
+    assert format_frames == [(1, 2, "square"), (1, 2, "landscape")]
@@ -1,9 +1,11 @@
 """Tests for animation timeline windows."""
 
+import math
+
 import pytest
 
 from tpsplots.animation.easing import back_out, cubic_out, linear
-from tpsplots.animation.timeline import Timeline, Window
+from tpsplots.animation.timeline import Timeline, Window, idle_spans
 
 
 def test_window_progress_before_mid_after():
@@ -92,3 +94,21 @@ def test_timeline_re_adding_key_overwrites():
     timeline.add("a", Window(start=0.0, duration=1.0))
     assert timeline.window("a").duration == 1.0
     assert timeline.duration == pytest.approx(1.0)
+
+
+def test_idle_spans_are_the_gaps_between_windows():
+    """Spans cover the time before, between, and after the windows."""
+    timeline = Timeline()
+    timeline.add("a", Window(start=0.5, duration=1.0))
+    timeline.add("b", Window(start=1.0, duration=1.0))  # overlaps a
+    timeline.add("c", Window(start=3.0, duration=0.5))
+    assert timeline.idle_spans() == [(0.0, 0.5), (2.0, 3.0), (3.5, math.inf)]
+
+
+def test_idle_spans_split_at_zero_duration_step():
+    """A step window separates the 'before' and 'after' stills."""
+    assert idle_spans([Window(start=1.0, duration=0.0)]) == [(0.0, 1.0), (1.0, math.inf)]
+
+
+def test_idle_spans_empty_timeline_is_one_still():
+    assert Timeline().idle_spans() == [(0.0, math.inf)]
@@ -95,3 +95,86 @@ class TestAssets:
         import tpsplots
 
         assert tpsplots.STYLE_DIR.exists()
+
+
+class TestBatchJobs:
+    """Tests for the shared batch runner behind generate()."""
+
+    def test_run_chart_job_classifies_failures(self, tmp_path):
+        from tpsplots.exceptions import ConfigurationError, DataSourceError
+        from tpsplots.processors.batch import run_chart_job
+
+        def processor_raising(exc):
+            class Processor:
+                def __init__(self, *_args, **_kwargs):
+                    pass
+
+                def generate_chart(self):
+                    raise exc
+
+            return Processor
+
+        cases = {
+            "config_error": ConfigurationError("bad key"),
+            "error": DataSourceError("offline"),
+            "unexpected": KeyError("boom"),
+        }
+        for status, exc in cases.items():
+            outcome = run_chart_job(tmp_path / "x.yaml", tmp_path, processor_raising(exc))
+            assert outcome.status == status
+            assert outcome.error == str(exc)
+            assert "Traceback" in outcome.traceback
+
+    def test_run_chart_job_without_output(self, tmp_path):
+        from tpsplots.processors.batch import run_chart_job
+
+        class EmptyProcessor:
+            def __init__(self, *_args, **_kwargs):
+                pass
+
+            def generate_chart(self):
+                return None
+
+        outcome = run_chart_job(tmp_path / "x.yaml", tmp_path, EmptyProcessor)
+        assert outcome.status == "no_output"
+        assert outcome.files == []
+
+    def test_resolve_jobs(self):
+        from tpsplots.exceptions import ConfigurationError
+        from tpsplots.processors.batch import resolve_jobs
+
+        assert resolve_jobs(1, 10) == 1
+        assert resolve_jobs(8, 3) == 3
+        assert resolve_jobs(0, 1) == 1
+        assert resolve_jobs(0, 1000) >= 1
+        with pytest.raises(ConfigurationError):
+            resolve_jobs(-1, 3)
+
+    def test_generate_with_jobs_collects_files(self, tmp_path):
+        import tpsplots.api as api
+
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("Year,Value\n2020,1\n2021,3\n", encoding="utf-8")
+        yaml_dir = tmp_path / "yaml"
+        yaml_dir.mkdir()
+        for name in ("one", "two"):
+            (yaml_dir / f"{name}.yaml").write_text(
+                f"data:\n"
+                f"  source: csv:{csv_path}\n"
+                f"  params:\n"
+                f"    fiscal_year_column: false\n"
+                f"chart:\n"
+                f"  type: bar\n"
+                f"  output: {name}\n"
+                f"  title: Jobs\n"
+                f'  categories: "{{{{Year}}}}"\n'
+                f'  values: "{{{{Value}}}}"\n',
+                encoding="utf-8",
+            )
+
+        result = api.generate(yaml_dir, outdir=tmp_path / "charts", quiet=True, jobs=2)
+
+        assert result["succeeded"] == 2
+        assert result["failed"] == 0
+        assert str(tmp_path / "charts" / "one_desktop.svg") in result["files"]
+        assert str(tmp_path / "charts" / "two_social.png") in result["files"]
@@ -36,18 +36,12 @@ All values in thousands of dollars,,,,,,,,,,
 
 
 @pytest.fixture()
-def mock_response():
-    """Create a mock requests.Response returning the fixture CSV."""
-    resp = MagicMock()
-    resp.text = FIXTURE_CSV
-    resp.raise_for_status = MagicMock()
-    return resp
-
-
-@pytest.fixture()
-def apollo_instance(mock_response):
+def apollo_instance():
     """Create an Apollo instance with mocked network calls."""
-    with patch("tpsplots.data_sources.apollo_data_source.requests.get", return_value=mock_response):
+    with patch(
+        "tpsplots.data_sources.nasa_budget_data_source.NASABudget._fetch_url_content",
+        return_value=FIXTURE_CSV,
+    ):
         from tpsplots.data_sources.apollo_data_source import ApolloSpending
 
         instance = ApolloSpending()
@@ -236,15 +230,9 @@ Totals,"$67,400",$480,$0,"$67,880","$1,058,892",,
 @pytest.fixture()
 def robotic_lunar_instance():
     """Create a RoboticLunarPrograms instance with mocked network calls."""
-    resp = MagicMock()
-    resp.text = ROBOTIC_LUNAR_CSV
-    resp.raise_for_status = MagicMock()
-    with (
-        patch("tpsplots.data_sources.apollo_data_source.requests.get", return_value=resp),
-        patch(
-            "tpsplots.data_sources.nasa_budget_data_source.NASABudget._fetch_url_content",
-            return_value=ROBOTIC_LUNAR_CSV,
-        ),
+    with patch(
+        "tpsplots.data_sources.nasa_budget_data_source.NASABudget._fetch_url_content",
+        return_value=ROBOTIC_LUNAR_CSV,
     ):
         from tpsplots.data_sources.apollo_data_source import RoboticLunarProgramSpending
 
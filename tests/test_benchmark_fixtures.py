@@ -0,0 +1,35 @@
+"""Keep the pipeline benchmark's cases in step with the chart views."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from tpsplots.models.chart_config import chart_type_v1
+from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+from tpsplots.views import VIEW_REGISTRY
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_bench():
+    spec = importlib.util.spec_from_file_location(
+        "bench_pipeline", REPO_ROOT / "benchmarks" / "bench_pipeline.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+CASES = _load_bench().CASES
+
+
+def test_every_view_has_a_benchmark_case():
+    assert set(CASES) == set(VIEW_REGISTRY)
+
+
+@pytest.mark.parametrize("chart_type", sorted(CASES))
+def test_benchmark_case_validates_offline(chart_type, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    processor = YAMLChartProcessor(CASES[chart_type])
+    assert chart_type_v1(processor.config.chart.type) == chart_type
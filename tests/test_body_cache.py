@@ -0,0 +1,102 @@
+"""Tests for reusing chart bodies across metadata-only re-renders."""
+
+import io
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+from tpsplots.views.bar_chart import BarChartView
+from tpsplots.views.body_cache import ChartBodyCache
+from tpsplots.views.treemap_chart import TreemapChartView
+
+BAR_PARAMS = {"categories": ["Mars", "Moon", "Venus"], "values": [30, 20, 10], "dpi": 60}
+
+
+def _png(fig) -> np.ndarray:
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format="png", dpi="figure")
+    finally:
+        plt.close(fig)
+    return np.asarray(Image.open(io.BytesIO(buf.getvalue())))
+
+
+def _metadata(title):
+    return {"title": title, "subtitle": "Planetary funding", "source": "NASA budget requests"}
+
+
+@pytest.mark.parametrize("device", ["desktop", "mobile"])
+def test_metadata_edit_reuses_body_and_matches_fresh_render(tmp_path, device):
+    view = BarChartView(outdir=tmp_path)
+    cache = ChartBodyCache()
+
+    _png(view.create_figure(_metadata("First"), device, body_cache=cache, **BAR_PARAMS))
+    reused = _png(view.create_figure(_metadata("Second"), device, body_cache=cache, **BAR_PARAMS))
+    fresh = _png(view.create_figure(_metadata("Second"), device, **BAR_PARAMS))
+
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    np.testing.assert_array_equal(reused, fresh)
+
+
+def test_reused_body_is_not_modified_by_layout(tmp_path):
+    view = BarChartView(outdir=tmp_path)
+    cache = ChartBodyCache()
+    for title in ("One", "A much longer title that wraps onto a second line", "One"):
+        last = _png(view.create_figure(_metadata(title), body_cache=cache, **BAR_PARAMS))
+
+    np.testing.assert_array_equal(last, _png(view.create_figure(_metadata("One"), **BAR_PARAMS)))
+
+
+def test_body_metadata_from_chart_kwargs_is_reapplied(tmp_path):
+    view = BarChartView(outdir=tmp_path)
+    cache = ChartBodyCache()
+    params = {**BAR_PARAMS, "title": "From params"}
+
+    view.create_figure({}, body_cache=cache, **params)
+    fig = view.create_figure({}, body_cache=cache, **params)
+    texts = [t.get_text() for t in fig.texts]
+    plt.close(fig)
+
+    assert cache.hits == 1
+    assert "From params" in texts
+
+
+def test_parameter_or_device_change_misses(tmp_path):
+    view = BarChartView(outdir=tmp_path)
+    cache = ChartBodyCache()
+    for device, values in [("desktop", [1, 2, 3]), ("desktop", [1, 2, 4]), ("mobile", [1, 2, 4])]:
+        plt.close(
+            view.create_figure({}, device, body_cache=cache, **{**BAR_PARAMS, "values": values})
+        )
+
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+def test_treemap_bypasses_the_cache(tmp_path):
+    view = TreemapChartView(outdir=tmp_path)
+    cache = ChartBodyCache()
+    for title in ("One", "Two"):
+        plt.close(
+            view.create_figure(
+                _metadata(title), body_cache=cache, labels=["A", "B"], values=[2, 1], dpi=60
+            )
+        )
+
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_unpicklable_parameters_are_not_cached(tmp_path):
+    view = BarChartView(outdir=tmp_path)
+    assert ChartBodyCache.key_for(view, "desktop", {"formatter": lambda v: v}) is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    view = BarChartView(outdir=tmp_path)
+    cache = ChartBodyCache(max_entries=2)
+    for values in ([1], [2], [1], [3]):
+        plt.close(view.create_figure({}, body_cache=cache, categories=["A"], values=values, dpi=60))
+
+    assert len(cache) == 2
+    assert cache.stats() == {"entries": 2, "hits": 1, "misses": 3}
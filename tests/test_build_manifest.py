@@ -0,0 +1,130 @@
+"""Tests for incremental generation via the build manifest."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tpsplots.models import YAMLChartConfig
+from tpsplots.processors.batch import iter_chart_jobs
+from tpsplots.processors.build_manifest import (
+    MANIFEST_NAME,
+    BuildManifest,
+    ManifestEntry,
+    chart_fingerprint,
+)
+
+
+def _write_chart(tmp_path: Path, name: str = "chart", title: str = "Budget") -> Path:
+    csv_path = tmp_path / "data.csv"
+    if not csv_path.exists():
+        csv_path.write_text("Year,Value\n2020,1\n2021,3\n", encoding="utf-8")
+    yaml_path = tmp_path / f"{name}.yaml"
+    yaml_path.write_text(
+        f"data:\n"
+        f"  source: csv:{csv_path}\n"
+        f"  params:\n"
+        f"    fiscal_year_column: false\n"
+        f"chart:\n"
+        f"  type: bar\n"
+        f"  output: {name}\n"
+        f"  title: {title}\n"
+        f'  categories: "{{{{Year}}}}"\n'
+        f'  values: "{{{{Value}}}}"\n',
+        encoding="utf-8",
+    )
+    return yaml_path
+
+
+def _run(yaml_files, outdir, **kwargs):
+    return list(iter_chart_jobs(yaml_files, outdir, manifest=BuildManifest.load(outdir), **kwargs))
+
+
+class TestManifest:
+    """Tests for BuildManifest persistence and entry freshness."""
+
+    def test_round_trip(self, tmp_path):
+        manifest = BuildManifest.load(tmp_path)
+        manifest.record(tmp_path / "a.yaml", "abc", ["a.png"])
+        manifest.save()
+
+        loaded = BuildManifest.load(tmp_path)
+        assert loaded.entry_for(tmp_path / "a.yaml") == ManifestEntry("abc", ["a.png"])
+
+    def test_unreadable_manifest_is_empty(self, tmp_path):
+        (tmp_path / MANIFEST_NAME).write_text("{not json", encoding="utf-8")
+        assert BuildManifest.load(tmp_path).entries == {}
+
+    def test_entry_needs_matching_fingerprint_and_existing_files(self, tmp_path):
+        output = tmp_path / "a.png"
+        output.write_bytes(b"png")
+        entry = ManifestEntry("abc", [str(output)])
+
+        assert entry.is_current("abc")
+        assert not entry.is_current("def")
+        output.unlink()
+        assert not entry.is_current("abc")
+
+
+def test_fingerprint_tracks_config_and_data():
+    config = YAMLChartConfig.model_validate(
+        {"data": {"source": "data.csv"}, "chart": {"type": "bar", "output": "x", "title": "T"}}
+    )
+    data = {"data": pd.DataFrame({"Year": [2020, 2021]}), "Value": np.array([1.0, 2.0])}
+    same_data = {"data": pd.DataFrame({"Year": [2020, 2021]}), "Value": np.array([1.0, 2.0])}
+    changed = {"data": pd.DataFrame({"Year": [2020, 2021]}), "Value": np.array([1.0, 2.5])}
+    retitled = config.model_copy(
+        update={"chart": config.chart.model_copy(update={"title": "Other"})}
+    )
+
+    assert chart_fingerprint(config, data) == chart_fingerprint(config, same_data)
+    assert chart_fingerprint(config, data) != chart_fingerprint(config, changed)
+    assert chart_fingerprint(config, data) != chart_fingerprint(retitled, data)
+
+
+class TestIncrementalBatch:
+    """Tests for skipping unchanged charts in iter_chart_jobs."""
+
+    def test_second_run_skips_unchanged_chart(self, tmp_path):
+        yaml_path = _write_chart(tmp_path)
+        outdir = tmp_path / "out"
+
+        first = _run([yaml_path], outdir)
+        png = outdir / "chart_desktop.png"
+        mtime = png.stat().st_mtime_ns
+        second = _run([yaml_path], outdir)
+
+        assert [o.status for o in first] == ["ok"]
+        assert [o.status for o in second] == ["unchanged"]
+        assert second[0].files == first[0].files
+        assert png.stat().st_mtime_ns == mtime
+
+    @pytest.mark.parametrize("change", ["yaml", "data", "output"])
+    def test_changes_trigger_rerender(self, tmp_path, change):
+        yaml_path = _write_chart(tmp_path)
+        outdir = tmp_path / "out"
+        _run([yaml_path], outdir)
+
+        if change == "yaml":
+            _write_chart(tmp_path, title="Retitled")
+        elif change == "data":
+            (tmp_path / "data.csv").write_text("Year,Value\n2020,1\n2021,4\n", encoding="utf-8")
+        else:
+            (outdir / "chart_mobile.svg").unlink()
+
+        assert [o.status for o in _run([yaml_path], outdir)] == ["ok"]
+
+    def test_force_rerenders_and_failures_are_forgotten(self, tmp_path):
+        good = _write_chart(tmp_path, "good")
+        bad = tmp_path / "bad.yaml"
+        bad.write_text("chart: {type: nope}\n", encoding="utf-8")
+        outdir = tmp_path / "out"
+        _run([good, bad], outdir)
+
+        forced = _run([good, bad], outdir, force=True)
+
+        assert [o.status for o in forced] == ["ok", "config_error"]
+        manifest = BuildManifest.load(outdir)
+        assert manifest.entry_for(good) is not None
+        assert manifest.entry_for(bad) is None
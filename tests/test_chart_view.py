@@ -5,18 +5,21 @@ from pathlib import Path
 import matplotlib.pyplot as plt
 import pytest
 
+from tpsplots.exceptions import RenderingError
 from tpsplots.views.chart_view import ChartView
+from tpsplots.views.render_params import PANDAS_COW, RenderParams
 
 
 class MutatingChartView(ChartView):
-    """Minimal view that intentionally mutates nested kwargs in _create_chart."""
+    """Minimal view that changes nested kwargs in _create_chart."""
 
-    def __init__(self, outdir):
+    def __init__(self, outdir, copy_first=False):
         super().__init__(outdir=outdir, style_file=None)
+        self.copy_first = copy_first
         self.legend_snapshots = []
 
     def _create_chart(self, metadata, style, **kwargs):
-        legend = kwargs["legend"]
+        legend = dict(kwargs["legend"]) if self.copy_first else kwargs["legend"]
         legend["fontsize"] = style["legend_size"]
         legend.setdefault("rendered_for", []).append(style["type"])
         self.legend_snapshots.append(legend)
@@ -26,11 +29,22 @@ class MutatingChartView(ChartView):
         return []
 
 
-def test_generate_chart_isolates_nested_kwargs_between_renders(tmp_path):
-    """Desktop, mobile, and social renders should not share nested kwargs state."""
+def test_generate_chart_rejects_in_place_kwarg_mutation(tmp_path):
+    """Render parameters are shared between devices, so writing into them fails."""
     view = MutatingChartView(outdir=tmp_path)
     legend = {"ncol": 4}
 
+    with pytest.raises(RenderingError, match="read-only"):
+        view.generate_chart(metadata={}, stem="test", legend=legend)
+
+    assert legend == {"ncol": 4}
+
+
+def test_generate_chart_isolates_copied_kwargs_between_renders(tmp_path):
+    """A view that copies a nested kwarg before changing it gets its own per device."""
+    view = MutatingChartView(outdir=tmp_path, copy_first=True)
+    legend = {"ncol": 4}
+
     view.generate_chart(metadata={}, stem="test", legend=legend)
 
     # Caller-supplied kwargs should not be mutated by chart generation.
@@ -64,26 +78,45 @@ class FileTrackingChartView(ChartView):
         return Path(self.outdir / f"{stem}.csv")
 
 
-def test_clone_chart_kwargs_isolates_dataframes():
-    """Top-level DataFrame/Series kwargs must be deep-copied so device renders
-    cannot mutate a shared frame."""
+def test_render_params_share_dataframes_copy_on_write():
+    """Each render gets its own DataFrame/Series without copying their data,
+    and changing one cannot reach the caller's frame."""
+    import numpy as np
     import pandas as pd
 
     original_df = pd.DataFrame({"a": [1, 2, 3]})
     original_series = pd.Series([1, 2, 3])
 
-    cloned = ChartView._clone_chart_kwargs({"df": original_df, "s": original_series})
+    kwargs = RenderParams({"df": original_df, "s": original_series}).for_render()
 
-    assert cloned["df"] is not original_df
-    assert cloned["s"] is not original_series
+    assert kwargs["df"] is not original_df
+    assert kwargs["s"] is not original_series
+    if PANDAS_COW:
+        # Without copy-on-write, frames are deep-copied on purpose.
+        assert np.shares_memory(kwargs["df"]["a"].to_numpy(), original_df["a"].to_numpy())
 
-    cloned["df"].loc[0, "a"] = 999
-    cloned["s"].iloc[0] = 999
+    kwargs["df"].loc[0, "a"] = 999
+    kwargs["s"].iloc[0] = 999
 
     assert original_df.loc[0, "a"] == 1
     assert original_series.iloc[0] == 1
 
 
+def test_render_params_copy_nested_dataframes_per_render():
+    """Frames inside containers get their own copy per render too."""
+    import pandas as pd
+
+    params = RenderParams({"tables": {"main": pd.DataFrame({"a": [1, 2]})}, "y": [1, 2]})
+
+    first, second = params.for_render(), params.for_render()
+    first["tables"]["main"].loc[0, "a"] = 999
+
+    assert first["tables"]["main"] is not second["tables"]["main"]
+    assert second["tables"]["main"].loc[0, "a"] == 1
+    assert params["tables"]["main"].loc[0, "a"] == 1
+    assert first["y"] is params["y"]
+
+
 def test_generate_chart_returns_only_files(tmp_path):
     """generate_chart returns just the file list; device figures are saved and
     closed internally, not handed back to callers."""
@@ -110,6 +143,40 @@ def test_generate_chart_reports_generated_files(tmp_path):
     assert result["files"] == expected
 
 
+@pytest.fixture
+def variant_pool():
+    from tpsplots.views import variant_pool
+
+    yield variant_pool
+    variant_pool.reset_variant_pool()
+
+
+def test_parallel_variants_match_serial_outputs(tmp_path, variant_pool):
+    """Worker-rendered variants write the same files, reported in the same order."""
+    from tpsplots.views.bar_chart import BarChartView
+
+    params = {"categories": ["A", "B", "C"], "values": [3, 1, 2], "export_data": None}
+    serial = BarChartView(outdir=tmp_path / "serial").bar_plot(
+        metadata={"title": "Variants"}, stem="bars", **params
+    )
+    parallel_view = BarChartView(outdir=tmp_path / "parallel", parallel_variants=True)
+    parallel = parallel_view.bar_plot(metadata={"title": "Variants"}, stem="bars", **params)
+
+    assert variant_pool.variant_pool_active()
+    assert [Path(f).name for f in parallel["files"]] == [Path(f).name for f in serial["files"]]
+    assert all(Path(f).stat().st_size > 0 for f in parallel["files"])
+
+
+def test_parallel_variants_fall_back_in_process_for_unpicklable_kwargs(tmp_path, variant_pool):
+    view = FileTrackingChartView(outdir=tmp_path)
+    view.parallel_variants = True
+
+    result = view.generate_chart(metadata={}, stem="budget", formatter=lambda v: v)
+
+    assert not variant_pool.variant_pool_active()
+    assert [Path(f).name for f in result["files"]][-1] == "budget_social.png"
+
+
 class SingleDeviceChartView(ChartView):
     """Minimal view for testing create_figure."""
 
@@ -922,3 +989,51 @@ def test_coerce_annotation_x_parses_date_strings_else_passes_through(tmp_path):
     assert isinstance(view._coerce_annotation_x("2020-01-01"), pd.Timestamp)
     assert view._coerce_annotation_x(5.0) == 5.0
     assert view._coerce_annotation_x("not a date") == "not a date"
+
+
+# ---------------------------------------------------------------------------
+# Draw accounting: layout runs without rasterizing, savefig does the full draws
+# ---------------------------------------------------------------------------
+def test_render_does_one_full_draw_per_saved_format(tmp_path):
+    """Header wrapping, axes fitting and annotations use layout-only draws, so
+    each device figure is fully drawn only by its svg/png saves."""
+    from tpsplots.views.bar_chart import BarChartView
+
+    view = BarChartView(outdir=tmp_path)
+    view.bar_plot(
+        metadata={
+            "title": "A title long enough to wrap on the mobile layout",
+            "subtitle": "Subtitle",
+            "source": "NASA",
+            "annotations": [{"x": 1, "y": 1, "text": "note"}],
+        },
+        stem="bars",
+        categories=["A", "B", "C"],
+        values=[3, 1, 2],
+        export_data=None,
+    )
+
+    assert {device: stats.full for device, stats in view.draw_stats.items()} == {
+        "desktop": 2,
+        "mobile": 2,
+        "social": 1,
+    }
+    assert all(stats.layout > 0 for stats in view.draw_stats.values())
+
+
+def test_layout_pass_matches_full_draw_extents():
+    """Extents read after a layout pass equal the ones a full draw produces."""
+    from tpsplots.views.draw_stats import layout_pass, track_draws
+
+    fig, ax = plt.subplots(dpi=150)
+    ax.set_title("Layout")
+    ax.plot([0, 1000], [0, 1])
+    stats = track_draws(fig)
+
+    renderer = layout_pass(fig)
+    laid_out = ax.get_tightbbox(renderer).bounds
+    fig.canvas.draw()
+
+    assert ax.get_tightbbox(fig.canvas.get_renderer()).bounds == pytest.approx(laid_out)
+    assert (stats.layout, stats.full) == (1, 1)
+    plt.close(fig)
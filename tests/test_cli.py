@@ -123,7 +123,9 @@ class TestCLI:
             def generate_chart(self):
                 return {"files": []}
 
-        monkeypatch.setattr("tpsplots.cli.YAMLChartProcessor", DummyProcessor)
+        monkeypatch.setattr(
+            "tpsplots.processors.yaml_chart_processor.YAMLChartProcessor", DummyProcessor
+        )
 
         result = runner.invoke(app, ["generate", str(yaml_1), str(yaml_2)])
 
@@ -148,7 +150,9 @@ class TestCLI:
                 logging.getLogger("tpsplots.tests.verbose").info("verbose marker from processor")
                 return {"files": []}
 
-        monkeypatch.setattr("tpsplots.cli.YAMLChartProcessor", VerboseProcessor)
+        monkeypatch.setattr(
+            "tpsplots.processors.yaml_chart_processor.YAMLChartProcessor", VerboseProcessor
+        )
 
         result = runner.invoke(app, ["generate", "--verbose", str(yaml_1)])
 
@@ -171,7 +175,9 @@ class TestCLI:
                     raise DataSourceError("network failure")
                 return {"files": []}
 
-        monkeypatch.setattr("tpsplots.cli.YAMLChartProcessor", MixedProcessor)
+        monkeypatch.setattr(
+            "tpsplots.processors.yaml_chart_processor.YAMLChartProcessor", MixedProcessor
+        )
 
         result = runner.invoke(app, ["generate", str(good_yaml), str(bad_yaml)])
 
@@ -180,3 +186,151 @@ class TestCLI:
         assert "bad.yaml" in result.output
         assert "network failure" in result.output
         assert "Summary: 1 succeeded, 1 failed" in result.output
+
+    def test_generate_jobs_keeps_status_order_and_exit_codes(self, tmp_path):
+        """--jobs renders in worker processes but reports exactly like a serial run."""
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("Year,Value\n2020,1\n2021,3\n2022,2\n", encoding="utf-8")
+        for name in ("a", "c"):
+            (tmp_path / f"{name}.yaml").write_text(
+                f"data:\n"
+                f"  source: csv:{csv_path}\n"
+                f"  params:\n"
+                f"    fiscal_year_column: false\n"
+                f"chart:\n"
+                f"  type: bar\n"
+                f"  output: chart_{name}\n"
+                f"  title: Parallel\n"
+                f'  categories: "{{{{Year}}}}"\n'
+                f'  values: "{{{{Value}}}}"\n',
+                encoding="utf-8",
+            )
+        (tmp_path / "b.yaml").write_text("chart: {type: nope}\n", encoding="utf-8")
+        outdir = tmp_path / "out"
+
+        result = runner.invoke(app, ["generate", "--jobs", "2", "-o", str(outdir), str(tmp_path)])
+
+        assert result.exit_code == 2
+        lines = [line for line in result.output.splitlines() if line.startswith("[")]
+        assert lines[0] == "[1/3] a.yaml  OK"
+        assert lines[1].startswith("[2/3] b.yaml FAIL:")
+        assert lines[2] == "[3/3] c.yaml  OK"
+        assert "Summary: 2 succeeded, 0 failed, 1 config errors" in result.output
+        assert (outdir / "chart_a_desktop.png").exists()
+        assert (outdir / "chart_c_social.png").exists()
+
+    def test_generate_offline_reports_http_cache_activity(self, tmp_path, monkeypatch):
+        """--offline/--cache-ttl configure the shared cache; verbose prints its counters."""
+        from tpsplots.data_sources.http_cache import fetch_text, get_http_cache
+
+        yaml_1 = tmp_path / "remote.yaml"
+        yaml_1.write_text("chart: {}\n", encoding="utf-8")
+        url = "https://example.com/data.csv"
+        body_path, meta_path = get_http_cache()._entry_paths(url)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_text("Year,Value\n", encoding="utf-8")
+        meta_path.write_text(json.dumps({"url": url, "fetched_at": 0}), encoding="utf-8")
+
+        class RemoteProcessor:
+            def __init__(self, *_args, **_kwargs):
+                pass
+
+            def generate_chart(self):
+                settings = get_http_cache().settings()
+                assert (settings["offline"], settings["ttl"]) == (True, 60)
+                fetch_text(url)
+                return {"files": []}
+
+        monkeypatch.setattr(
+            "tpsplots.processors.yaml_chart_processor.YAMLChartProcessor", RemoteProcessor
+        )
+
+        result = runner.invoke(
+            app, ["generate", "--offline", "--cache-ttl", "60", "--verbose", str(yaml_1)]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "HTTP cache: 1 hits, 0 revalidated, 0 misses, 0 stale" in result.output
+
+    def test_generate_parallel_variants_reaches_processor(self, tmp_path, monkeypatch):
+        yaml_1 = tmp_path / "heavy.yaml"
+        yaml_1.write_text("chart: {}\n", encoding="utf-8")
+        seen = []
+
+        class RecordingProcessor:
+            def __init__(self, *_args, parallel_variants=False, **_kwargs):
+                seen.append(parallel_variants)
+
+            def generate_chart(self):
+                return {"files": []}
+
+        monkeypatch.setattr(
+            "tpsplots.processors.yaml_chart_processor.YAMLChartProcessor", RecordingProcessor
+        )
+
+        result = runner.invoke(app, ["generate", "--parallel-variants", str(yaml_1)])
+
+        assert result.exit_code == 0, result.output
+        assert seen == [True]
+
+    def test_generate_skips_unchanged_charts_unless_forced(self, tmp_path):
+        csv_path = tmp_path / "data.csv"
+        csv_path.write_text("Year,Value\n2020,1\n2021,3\n", encoding="utf-8")
+        yaml_path = tmp_path / "chart.yaml"
+        yaml_path.write_text(
+            f"data:\n"
+            f"  source: csv:{csv_path}\n"
+            f"  params:\n"
+            f"    fiscal_year_column: false\n"
+            f"chart:\n"
+            f"  type: bar\n"
+            f"  output: chart\n"
+            f"  title: Incremental\n"
+            f'  categories: "{{{{Year}}}}"\n'
+            f'  values: "{{{{Value}}}}"\n',
+            encoding="utf-8",
+        )
+        args = ["generate", "-o", str(tmp_path / "out"), str(yaml_path)]
+
+        assert runner.invoke(app, args).exit_code == 0
+        skipped = runner.invoke(app, args)
+        forced = runner.invoke(app, [*args, "--force"])
+
+        assert "[1/1] chart.yaml  SKIP: unchanged" in skipped.output
+        assert "Summary: 1 succeeded (1 unchanged), 0 failed" in skipped.output
+        assert "[1/1] chart.yaml  OK" in forced.output
+
+    def test_generate_watch_rebuilds_changed_charts(self, tmp_path, monkeypatch):
+        yaml_1 = tmp_path / "one.yaml"
+        yaml_2 = tmp_path / "two.yaml"
+        yaml_1.write_text("chart: {}\n", encoding="utf-8")
+        yaml_2.write_text("chart: {}\n", encoding="utf-8")
+
+        caches = []
+
+        class DummyProcessor:
+            def __init__(self, *_args, data_cache=None, **_kwargs):
+                caches.append(data_cache)
+
+            def generate_chart(self):
+                return {"files": []}
+
+        def fake_watch(collect, rebuild, *, input_dirs, invalidate):
+            assert collect() == [yaml_1, yaml_2]
+            assert input_dirs == [tmp_path]
+            invalidate({tmp_path / "data.csv"})
+            rebuild([yaml_2])
+
+        monkeypatch.setattr(
+            "tpsplots.processors.yaml_chart_processor.YAMLChartProcessor", DummyProcessor
+        )
+        monkeypatch.setattr("tpsplots.processors.watch.watch_charts", fake_watch)
+
+        result = runner.invoke(app, ["generate", "--watch", str(tmp_path)])
+
+        assert result.exit_code == 0, result.output
+        assert "Processing 2 YAML file(s)" in result.output
+        assert "Watching for changes" in result.output
+        assert "Processing 1 YAML file(s)" in result.output
+        # One resolution cache serves the initial build and every rebuild.
+        assert len(caches) == 3 and len({id(cache) for cache in caches}) == 1
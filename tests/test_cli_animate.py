@@ -141,3 +141,30 @@ def test_format_all_passes_through(tmp_path, monkeypatch, ffmpeg_ok):
 
     assert result.exit_code == 0
     assert captured[0]["formats"] == ["all"]
+
+
+def test_parallel_formats_passes_through_with_per_format_progress(tmp_path, monkeypatch, ffmpeg_ok):
+    """`--parallel-formats` reaches animate_yaml; interleaved ticks label each format once."""
+    captured: list[dict] = []
+
+    def fake_animate_yaml(yaml_path, outdir, on_frame=None, on_format_frame=None, **overrides):
+        captured.append(overrides)
+        assert on_frame is None
+        for current in (1, 2):
+            on_format_frame(current, 2, "square")
+            on_format_frame(current, 2, "landscape")
+        return []
+
+    monkeypatch.setattr("tpsplots.commands.animate.animate_yaml", fake_animate_yaml)
+
+    yaml_path = tmp_path / "chart.yaml"
+    yaml_path.write_text("chart: {}\n", encoding="utf-8")
+
+    result = runner.invoke(
+        app, ["animate", str(yaml_path), "--parallel-formats", "-o", str(tmp_path / "out")]
+    )
+
+    assert result.exit_code == 0
+    assert captured[0]["parallel_formats"] is True
+    assert result.output.count("encoding square") == 1
+    assert result.output.count("encoding landscape") == 1
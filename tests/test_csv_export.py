@@ -6,6 +6,8 @@ Tests the _export_csv method which handles:
 - Metadata header rows (author, license, source, notes)
 """
 
+import csv
+import io
 from datetime import date, datetime
 
 import numpy as np
@@ -13,6 +15,8 @@ import pandas as pd
 import pytest
 
 from tpsplots.views import BarChartView
+from tpsplots.views.csv_export import write_csv_rows
+from tpsplots.views.line_chart import LineChartView
 
 
 @pytest.fixture
@@ -332,3 +336,110 @@ class TestCSVBasicFunctionality:
         assert "Mercury" in content
         assert "Venus" in content
         assert "Earth" in content
+
+
+def _reference_rows(df) -> str:
+    """The original row-by-row export loop, kept as a byte-level reference."""
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf)
+    writer.writerow(df.columns)
+    for _, row in df.iterrows():
+        formatted_row = []
+        for val in row:
+            if pd.isna(val):
+                formatted_row.append("")
+            elif hasattr(val, "strftime"):
+                formatted_row.append(val.strftime("%Y-%m-%d"))
+            elif isinstance(val, (int, float, np.integer, np.floating)):
+                if val == int(val):
+                    formatted_row.append(int(val))
+                elif abs(val) > 1:
+                    formatted_row.append(round(val, 2))
+                else:
+                    formatted_row.append(val)
+            else:
+                formatted_row.append(val)
+        writer.writerow(formatted_row)
+    return buf.getvalue()
+
+
+def _rows(df, chunk_rows=7) -> str:
+    buf = io.StringIO(newline="")
+    write_csv_rows(csv.writer(buf), df, chunk_rows=chunk_rows)
+    return buf.getvalue()
+
+
+def _floats(n=60):
+    rng = np.random.default_rng(3)
+    values = rng.normal(0, 1, n) * 10.0 ** rng.integers(-6, 18, n)
+    # Decimal ties, whole numbers, signed zero and values near 1.
+    values[:12] = [2.675, 1.005, -2.675, 0.125, 1.0, -3.0, -0.0, 1e16, 0.5, 1.0000001, -1.5, 1e-7]
+    values[12:15] = np.nan
+    return values
+
+
+FRAMES = {
+    "mixed": lambda: pd.DataFrame(
+        {
+            "Fiscal Year": pd.to_datetime(["2020-10-01", None, "2022-10-01"] * 20),
+            "Mission": ["Cassini", None, 'Voyager, "1"'] * 20,
+            "Budget": _floats(),
+            "Count": np.arange(60),
+            "Flag": [True, False, True] * 20,
+        }
+    ),
+    "all_float": lambda: pd.DataFrame({"a": _floats(), "b": _floats()[::-1]}),
+    "int_and_float": lambda: pd.DataFrame({"year": np.arange(1990, 2050), "value": _floats()}),
+    "all_int": lambda: pd.DataFrame({"a": np.arange(-30, 30), "b": np.arange(60, dtype="uint8")}),
+    "all_bool": lambda: pd.DataFrame({"a": [True, False] * 30}),
+    "bool_and_int": lambda: pd.DataFrame({"a": [True, False] * 30, "b": np.arange(60)}),
+    "float32": lambda: pd.DataFrame({"a": _floats().astype(np.float32)}),
+    "dates_only": lambda: pd.DataFrame({"d": pd.to_datetime(["2024-01-31", None] * 30)}),
+    "tz_dates": lambda: pd.DataFrame(
+        {"d": pd.date_range("2024-01-01 23:00", periods=60, freq="D", tz="US/Pacific")}
+    ),
+    "nullable": lambda: pd.DataFrame(
+        {
+            "i": pd.array([1, None, 3] * 20, dtype="Int64"),
+            "f": pd.array([1.234, None, 0.5] * 20, dtype="Float64"),
+        }
+    ),
+    "nullable_no_missing": lambda: pd.DataFrame({"i": pd.array(range(60), dtype="Int64")}),
+    "objects": lambda: pd.DataFrame(
+        {
+            "o": [date(2024, 5, 1), np.float64(2.345), np.int64(7), 0.25, "x", None] * 10,
+            "cat": pd.Categorical(["a", "b", None] * 20),
+        }
+    ),
+    "duplicate_columns": lambda: pd.DataFrame([[1.5, "x"], [2.25, "y"]], columns=["v", "v"]),
+    "empty": lambda: pd.DataFrame({"a": pd.Series([], dtype=float), "b": []}),
+    "single_string_column": lambda: pd.DataFrame({"s": ["", "a", None]}),
+}
+
+
+@pytest.mark.parametrize("name", sorted(FRAMES))
+def test_rows_match_row_by_row_reference(name):
+    df = FRAMES[name]()
+    assert _rows(df) == _reference_rows(df)
+
+
+def test_export_csv_writes_metadata_header_then_data(tmp_path):
+    df = pd.DataFrame({"Year": [2024, 2025], "Value": [1.5, 12.3456]})
+    df.attrs["export_note"] = ["First note", "Second note"]
+
+    path = LineChartView(outdir=tmp_path)._export_csv(df, {"source": "NASA"}, "budget")
+
+    rows = list(csv.reader(path.open(newline="")))
+    assert rows[0] == ["Author", "Casey Dreier/The Planetary Society"]
+    assert [r[0] for r in rows[3:8]] == ["Data Source", "Note", "Note", "License", ""]
+    assert rows[8:] == [["Year", "Value"], ["2024", "1.5"], ["2025", "12.35"]]
+
+
+def test_export_csv_streams_large_frames_in_chunks(tmp_path, monkeypatch):
+    df = pd.DataFrame({"Year": np.arange(25), "Value": np.linspace(0, 3, 25)})
+    view = LineChartView(outdir=tmp_path)
+    monkeypatch.setattr(view, "CSV_CHUNK_ROWS", 4)
+
+    path = view._export_csv(df, {}, "chunked")
+
+    assert path.read_bytes().endswith(_reference_rows(df).encode())
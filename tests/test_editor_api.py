@@ -1,11 +1,17 @@
 """Integration tests for editor FastAPI endpoints."""
 
+import base64
+import hashlib
+import json
+import os
+
 import pytest
 import yaml
 from fastapi.testclient import TestClient
 
 from tests.conftest import bump_mtime
 from tpsplots.editor.app import create_editor_app
+from tpsplots.editor.preview_pool import DEFAULT_PREVIEW_WORKERS
 from tpsplots.editor.session import EditorSession
 from tpsplots.editor.ui_schema import get_available_chart_types
 
@@ -371,6 +377,28 @@ class TestRefreshDataEndpoint:
         assert resp.json() == {"status": "ok"}
         assert session._data_cache == {}
         assert session._profile_cache == {}
+        # Preview workers compare this to drop their own caches.
+        assert session.data_generation == 1
+
+
+class TestCacheStatsEndpoint:
+    def test_cache_stats_report_hits_misses_and_budget(self, yaml_dir):
+        session = EditorSession(yaml_dir=yaml_dir, cache_max_bytes=10_000_000)
+        client = TestClient(create_editor_app(session))
+        csv_path = yaml_dir / "stats.csv"
+        csv_path.write_text("Year,Value\n2024,10\n", encoding="utf-8")
+        data = {"source": f"csv:{csv_path}"}
+
+        for _ in range(2):
+            assert client.post("/api/data-profile", json={"data": data}).status_code == 200
+
+        stats = client.get("/api/cache-stats").json()
+        # The editor process keeps its share; preview workers get the rest.
+        processes = min(DEFAULT_PREVIEW_WORKERS, os.cpu_count() or 1) + 1
+        assert stats["data"]["max_bytes"] == 10_000_000 // processes
+        assert (stats["data"]["entries"], stats["data"]["misses"]) == (1, 1)
+        assert (stats["profile"]["hits"], stats["profile"]["misses"]) == (1, 1)
+        assert stats["data"]["bytes"] > 0
 
 
 class TestPreviewEndpoint:
@@ -395,6 +423,36 @@ class TestPreviewEndpoint:
         assert resp.headers["content-type"] == "image/png"
         assert resp.content.startswith(b"\x89PNG\r\n\x1a\n")
 
+    def test_preview_diagnostics_report_queue_and_latency(self, client, yaml_dir):
+        idle = client.get("/api/preview/diagnostics").json()
+        assert (idle["queued"], idle["running"], idle["submitted"]) == (0, 0, 0)
+        assert idle["pool_started"] is False
+        assert idle["render_ms"] is None
+
+        csv_path = yaml_dir / "diag.csv"
+        csv_path.write_text("Year,Value\n2024,10\n2025,20\n", encoding="utf-8")
+        config = {
+            "data": {"source": f"csv:{csv_path}"},
+            "chart": {
+                "type": "line",
+                "output": "diag",
+                "title": "Diag",
+                "x": "{{Year}}",
+                "y": "{{Value}}",
+            },
+        }
+        resp = client.post(
+            "/api/preview", json={"config": config, "device": "mobile", "client_id": "tab"}
+        )
+        assert resp.status_code == 200
+
+        stats = client.get("/api/preview/diagnostics").json()
+        assert (stats["submitted"], stats["completed"], stats["failed"]) == (1, 1, 0)
+        assert stats["queued"] == 0
+        assert stats["render_ms"]["samples"] == 1
+        [worker] = stats["worker_caches"]
+        assert worker["data"]["misses"] == 1
+
     def test_preview_typo_ref_returns_400(self, client):
         """A typo'd {{ref}} against a working data source returns 400 (with the
         resolver message), never a 500."""
@@ -412,6 +470,114 @@ class TestPreviewEndpoint:
         assert resp.status_code == 400
         assert "Available keys" in resp.json()["detail"]
 
+    @staticmethod
+    def _events(resp):
+        events = []
+        for block in resp.text.strip().split("\n\n"):
+            event, data = block.split("\n")
+            events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+        return events
+
+    def test_preview_stream_sends_final_frame_and_skips_unchanged(self, client, yaml_dir):
+        csv_path = yaml_dir / "stream.csv"
+        csv_path.write_text("Year,Value\n2024,10\n2025,20\n", encoding="utf-8")
+        config = {
+            "data": {"source": f"csv:{csv_path}"},
+            "chart": {
+                "type": "line",
+                "output": "stream",
+                "title": "Stream",
+                "x": "{{Year}}",
+                "y": "{{Value}}",
+            },
+        }
+        body = {"config": config, "device": "desktop", "client_id": "tab"}
+
+        resp = client.post("/api/preview/stream", json=body)
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = self._events(resp)
+        # A draft is sent only if it finished before the full frame.
+        assert [name for name, _ in events] in (["final"], ["draft", "final"])
+        final = events[-1][1]
+        png = base64.b64decode(final["png"])
+        assert png.startswith(b"\x89PNG\r\n\x1a\n")
+        assert final["hash"] == hashlib.sha256(png).hexdigest()
+        assert final["density"] == 1
+        if len(events) == 2:
+            assert events[0][1]["density"] < 1
+
+        again = self._events(
+            client.post("/api/preview/stream", json={**body, "known_hash": final["hash"]})
+        )
+        assert again[-1] == ("unchanged", {"phase": "final", "hash": final["hash"]})
+
+    def test_preview_stream_reports_errors_as_events(self, client):
+        config = {
+            "data": {"source": "csv:yaml/examples/data/nasa_authorizations.csv"},
+            "chart": {
+                "type": "line",
+                "output": "typo",
+                "title": "Typo",
+                "x": "{{Year}}",
+                "y": "{{Budgett}}",
+            },
+        }
+        resp = client.post("/api/preview/stream", json={"config": config, "device": "desktop"})
+
+        assert resp.status_code == 200
+        [(name, data)] = self._events(resp)
+        assert name == "error"
+        assert data["status"] == 400
+        assert "Available keys" in data["detail"]
+
+    def test_animation_preview_streams_frames_then_gif(self, client, yaml_dir):
+        csv_path = yaml_dir / "anim.csv"
+        csv_path.write_text("Year,Value\n2024,10\n2025,20\n2026,15\n", encoding="utf-8")
+        config = {
+            "data": {"source": f"csv:{csv_path}"},
+            "chart": {
+                "type": "line",
+                "output": "anim",
+                "title": "Anim",
+                "x": "{{Year}}",
+                "y": "{{Value}}",
+            },
+            "animation": {"duration": 0.5, "end_hold": 0.2},
+        }
+
+        resp = client.post(
+            "/api/preview/animation",
+            json={"config": config, "format": "landscape", "client_id": "tab"},
+        )
+
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = self._events(resp)
+        *frames, (name, final) = events
+        assert name == "final"
+        assert [data["index"] for _, data in frames] == list(range(frames[0][1]["count"]))
+        assert base64.b64decode(frames[0][1]["png"]).startswith(b"\x89PNG\r\n\x1a\n")
+        gif = base64.b64decode(final["gif"])
+        assert gif.startswith(b"GIF89a")
+        assert final["hash"] == hashlib.sha256(gif).hexdigest()
+
+    def test_animation_preview_reports_non_animatable_charts(self, client):
+        config = {
+            "data": {"source": "csv:yaml/examples/data/nasa_authorizations.csv"},
+            "chart": {
+                "type": "donut",
+                "output": "donut",
+                "title": "Donut",
+                "values": [1, 2, 3],
+                "labels": ["A", "B", "C"],
+            },
+        }
+        resp = client.post("/api/preview/animation", json={"config": config})
+
+        [(name, data)] = self._events(resp)
+        assert name == "error"
+        assert data["status"] == 400
+        assert "not animatable" in data["detail"]
+
 
 class TestSecurityHeaders:
     def test_csp_header_on_html(self, client):
@@ -0,0 +1,131 @@
+"""Tests for the editor's byte-bounded LRU data cache."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tpsplots.editor.data_cache import ByteBudgetLRU, estimate_nbytes
+from tpsplots.editor.session import EditorSession
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _blob(nbytes):
+    return np.zeros(nbytes, dtype=np.uint8)
+
+
+def test_estimate_counts_frame_and_exposed_column_arrays():
+    df = pd.DataFrame(
+        {"Year": np.arange(1000, dtype=np.int64), "Name": [f"mission-{i:04d}" for i in range(1000)]}
+    )
+    names = df["Name"].to_numpy(dtype=object)
+    result = {"data": df, "Year": df["Year"].to_numpy(), "Name": names}
+
+    frame_bytes = int(df.memory_usage(deep=True).sum())
+    assert estimate_nbytes(df) == frame_bytes
+    # Object arrays count the strings they point to, not just the pointers.
+    assert estimate_nbytes(names) > names.nbytes + 1000 * 12
+    assert estimate_nbytes(result) >= frame_bytes + 8000 + estimate_nbytes(names)
+
+
+def test_estimate_counts_shared_objects_once():
+    arr = _blob(10_000)
+    assert estimate_nbytes([arr, arr]) < 2 * 10_000
+
+
+def test_evicts_least_recently_used_over_budget():
+    cache = ByteBudgetLRU(max_bytes=25_000)
+    cache.put("a", _blob(10_000))
+    cache.put("b", _blob(10_000))
+    assert cache.get("a") is not None  # "b" is now least recently used
+
+    cache.put("c", _blob(10_000))
+
+    assert list(cache) == ["a", "c"]
+    assert cache.nbytes <= 25_000
+    assert cache.stats.evictions == 1
+
+
+def test_newest_entry_is_kept_even_when_over_budget():
+    cache = ByteBudgetLRU(max_bytes=1_000)
+    cache.put("small", _blob(100))
+    cache.put("huge", _blob(50_000))
+
+    assert list(cache) == ["huge"]
+
+
+def test_ttl_expires_entries_on_lookup():
+    clock = FakeClock()
+    cache = ByteBudgetLRU(clock=clock)
+    cache.put("url", "fetched", ttl=60)
+    cache.put("csv", "loaded")
+
+    clock.now = 59
+    assert cache.get("url") == "fetched"
+    clock.now = 61
+    assert cache.get("url") is None
+    assert cache.get("csv") == "loaded"
+
+    stats = cache.snapshot()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (2, 1, 1)
+    assert stats["entries"] == 1
+
+
+def test_clear_resets_size():
+    cache = ByteBudgetLRU()
+    cache.put("a", _blob(1_000))
+    cache.clear()
+    assert (len(cache), cache.nbytes) == (0, 0)
+
+
+@pytest.fixture
+def csv_config(tmp_path):
+    csv_path = tmp_path / "values.csv"
+    csv_path.write_text("Year,Value\n2024,10\n2025,20\n", encoding="utf-8")
+    return {"source": f"csv:{csv_path}"}
+
+
+def test_session_counts_hits_and_evicts_to_budget(tmp_path, csv_config):
+    session = EditorSession(tmp_path)
+    session._resolve_data(csv_config)
+    session._resolve_data(csv_config)
+    session.profile_data(csv_config)
+
+    stats = session.cache_stats()
+    assert (stats["data"]["hits"], stats["data"]["misses"]) == (2, 1)
+    assert stats["data"]["bytes"] > 0
+    assert stats["profile"]["entries"] == 1
+
+    tiny = EditorSession(tmp_path, cache_max_bytes=1)
+    tiny._resolve_data(csv_config)
+    tiny._resolve_data({**csv_config, "params": {"columns": ["Year"]}})
+    assert tiny.cache_stats()["data"]["entries"] == 1
+    assert tiny.cache_stats()["data"]["evictions"] == 1
+
+
+def test_session_shares_cache_budget_with_workers(tmp_path):
+    session = EditorSession(tmp_path, cache_max_bytes=4_000_000, url_ttl=60)
+
+    worker_settings = session.share_cache_budget(4)
+
+    assert worker_settings == {"cache_max_bytes": 1_000_000, "url_ttl": 60}
+    stats = session.cache_stats()
+    assert stats["data"]["max_bytes"] == stats["profile"]["max_bytes"] == 1_000_000
+    assert EditorSession(tmp_path, cache_max_bytes=None).share_cache_budget(4) == {
+        "cache_max_bytes": None,
+        "url_ttl": None,
+    }
+
+
+def test_session_applies_ttl_to_url_sources_only(tmp_path, csv_config):
+    session = EditorSession(tmp_path, url_ttl=300)
+    assert session._cache_ttl({"source": "https://example.com/sheet.csv"}) == 300
+    assert session._cache_ttl({"source": "url:example.com/sheet.csv"}) == 300
+    assert session._cache_ttl(csv_config) is None
+    assert EditorSession(tmp_path)._cache_ttl({"source": "https://example.com/x.csv"}) is None
@@ -0,0 +1,231 @@
+"""Tests for the editor's coalescing preview scheduler."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tpsplots.animation.preview import Keyframe
+from tpsplots.editor import preview_pool
+from tpsplots.editor.preview_pool import (
+    PreviewScheduler,
+    PreviewSuperseded,
+    _animate_in_worker,
+    _portable,
+    submit_animation,
+)
+
+
+class GatedRender:
+    """Render stand-in that blocks until released and records what it rendered."""
+
+    def __init__(self):
+        self.rendered = []
+        self.started = threading.Semaphore(0)
+        self.release = threading.Event()
+
+    def __call__(self, config):
+        self.rendered.append(config)
+        self.started.release()
+        assert self.release.wait(5)
+        return f"png:{config}".encode()
+
+
+@pytest.fixture
+def make_scheduler():
+    executors = []
+
+    def make(render, max_workers=3):
+        def factory():
+            executors.append(ThreadPoolExecutor(max_workers=max_workers))
+            return executors[-1]
+
+        return PreviewScheduler(factory, render, max_workers)
+
+    yield make
+    for executor in executors:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def test_newer_request_replaces_waiting_one_for_same_slot(make_scheduler):
+    render = GatedRender()
+    scheduler = make_scheduler(render)
+
+    first = scheduler.submit("tab", "desktop", "v1")
+    assert render.started.acquire(timeout=5)
+    stale = scheduler.submit("tab", "desktop", "v2")
+    latest = scheduler.submit("tab", "desktop", "v3")
+    assert scheduler.diagnostics()["queued"] == 1
+
+    with pytest.raises(PreviewSuperseded):
+        stale.result(timeout=5)
+    render.release.set()
+
+    assert first.result(timeout=5) == b"png:v1"
+    assert latest.result(timeout=5) == b"png:v3"
+    assert render.rendered == ["v1", "v3"]
+    stats = scheduler.diagnostics()
+    assert (stats["submitted"], stats["completed"], stats["superseded"]) == (3, 2, 1)
+    assert stats["render_ms"]["samples"] == 2
+
+
+def test_devices_and_clients_render_concurrently(make_scheduler):
+    render = GatedRender()
+    scheduler = make_scheduler(render)
+
+    futures = [
+        scheduler.submit("tab", "desktop", "d"),
+        scheduler.submit("tab", "mobile", "m"),
+        scheduler.submit("other-tab", "desktop", "o"),
+    ]
+    for _ in futures:
+        assert render.started.acquire(timeout=5)
+    assert scheduler.diagnostics()["running"] == 3
+
+    render.release.set()
+    assert [f.result(timeout=5) for f in futures] == [b"png:d", b"png:m", b"png:o"]
+    assert scheduler.diagnostics()["superseded"] == 0
+
+
+def test_waiting_slots_start_in_arrival_order_as_workers_free(make_scheduler):
+    render = GatedRender()
+    scheduler = make_scheduler(render, max_workers=1)
+
+    futures = [scheduler.submit("tab", device, device) for device in ("desktop", "mobile")]
+    futures.append(scheduler.submit("tab", "social", "social"))
+    assert render.started.acquire(timeout=5)
+    stats = scheduler.diagnostics()
+    assert (stats["running"], stats["queued"]) == (1, 2)
+
+    render.release.set()
+    for future in futures:
+        future.result(timeout=5)
+    assert render.rendered == ["desktop", "mobile", "social"]
+
+
+def test_cancel_drops_waiting_request_only(make_scheduler):
+    render = GatedRender()
+    scheduler = make_scheduler(render, max_workers=1)
+
+    running = scheduler.submit("tab", "desktop", "a")
+    assert render.started.acquire(timeout=5)
+    waiting = scheduler.submit("tab", "mobile", "b")
+
+    assert scheduler.cancel(waiting) is True
+    assert scheduler.cancel(running) is False
+    render.release.set()
+
+    assert running.result(timeout=5) == b"png:a"
+    assert waiting.cancelled()
+    assert render.rendered == ["a"]
+
+
+def test_render_errors_reach_the_caller(make_scheduler):
+    def render(config):
+        raise ValueError(f"bad {config}")
+
+    scheduler = make_scheduler(render)
+    with pytest.raises(ValueError, match="bad x"):
+        scheduler.submit("tab", "desktop", "x").result(timeout=5)
+    assert scheduler.diagnostics()["failed"] == 1
+
+
+class TwoArgError(ValueError):
+    def __init__(self, field, reason):
+        super().__init__(f"{field}: {reason}")
+
+
+def test_unpicklable_worker_errors_fall_back_to_a_picklable_base():
+    """An exception that cannot be rebuilt from its args still reaches the
+    route as its nearest picklable base, so it is answered with a 400."""
+    portable = _portable(TwoArgError("xlim", "too short"))
+
+    assert type(portable) is ValueError
+    assert str(portable) == "xlim: too short"
+    plain = ValueError("kept")
+    assert _portable(plain) is plain
+
+
+def test_per_job_render_overrides_the_default(make_scheduler):
+    render = GatedRender()
+    render.release.set()
+    scheduler = make_scheduler(render)
+
+    custom = scheduler.submit("tab", "animation", "a", render=lambda config: f"gif:{config}")
+    default = scheduler.submit("tab", "desktop", "d")
+
+    assert custom.result(timeout=5) == "gif:a"
+    assert default.result(timeout=5) == b"png:d"
+    assert render.rendered == ["d"]
+
+
+def _png(shade):
+    import io
+
+    from PIL import Image
+
+    buf = io.BytesIO()
+    Image.new("RGB", (4, 4), (shade, shade, shade)).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class FakeAnimationSession:
+    """Worker session stand-in yielding three keyframes and counting draws."""
+
+    def __init__(self):
+        self.drawn = 0
+
+    def render_animation_preview(self, config, fmt):
+        for index, shade in enumerate((0, 128, 255)):
+            self.drawn += 1
+            yield Keyframe(index, 3, index * 100, 100, _png(shade))
+
+    def cache_stats(self):
+        return {}
+
+
+@pytest.fixture
+def animation_worker(monkeypatch):
+    session = FakeAnimationSession()
+    monkeypatch.setattr(preview_pool, "_worker_session", session)
+    monkeypatch.setattr(preview_pool, "_worker_generation", 0)
+    return session
+
+
+def test_animation_worker_streams_frames_and_returns_a_gif(animation_worker):
+    frames: queue.Queue = queue.Queue()
+
+    gif, stats = _animate_in_worker({}, "square", 0, frames, threading.Event())
+
+    assert gif.startswith(b"GIF89a")
+    assert [frames.get_nowait().index for _ in range(3)] == [0, 1, 2]
+    assert "pid" in stats
+
+
+def test_animation_worker_stops_once_cancelled(animation_worker):
+    frames: queue.Queue = queue.Queue()
+    cancelled = threading.Event()
+    cancelled.set()
+
+    with pytest.raises(PreviewSuperseded):
+        _animate_in_worker({}, "square", 0, frames, cancelled)
+    assert animation_worker.drawn == 1
+    assert frames.empty()
+
+
+def test_animations_share_one_slot_per_client(make_scheduler):
+    render = GatedRender()
+    scheduler = make_scheduler(render)
+    # Occupy the client's animation slot so later requests have to wait.
+    running = scheduler.submit("tab", "animation", "busy")
+    assert render.started.acquire(timeout=5)
+
+    stale = submit_animation(scheduler, "tab", {}, "square", 0, None, threading.Event())
+    latest = submit_animation(scheduler, "tab", {}, "portrait", 0, None, threading.Event())
+
+    with pytest.raises(PreviewSuperseded):
+        stale.result(timeout=5)
+    assert scheduler.cancel(latest) is True
+    render.release.set()
+    assert running.result(timeout=5) == b"png:busy"
@@ -625,6 +625,75 @@ class TestRenderPreview:
         assert png.startswith(b"\x89PNG\r\n\x1a\n")
 
 
+class TestRenderAnimationPreview:
+    @staticmethod
+    def _config(tmp_path, **chart):
+        csv = tmp_path / "anim.csv"
+        csv.write_text("Year,Value\n2024,10\n2025,20\n2026,15\n", encoding="utf-8")
+        return {
+            "data": {"source": f"csv:{csv}"},
+            "chart": {
+                "type": "line",
+                "output": "anim_preview",
+                "title": "Anim",
+                "x": "{{Year}}",
+                "y": "{{Value}}",
+                **chart,
+            },
+            "animation": {"duration": 0.5, "end_hold": 0.5, "fps": 60},
+        }
+
+    def test_keyframes_cover_the_animation_at_draft_size(self, session, tmp_path):
+        import io
+        import itertools
+
+        import matplotlib.pyplot as plt
+        from PIL import Image
+
+        open_before = plt.get_fignums()
+        frames = list(session.render_animation_preview(self._config(tmp_path, dpi=300)))
+
+        assert [f.index for f in frames] == list(range(frames[0].count))
+        # Frames tile the timeline: 1s of animation plus the last frame's slot.
+        assert frames[0].start_ms == 0
+        for previous, frame in itertools.pairwise(frames):
+            assert frame.start_ms == previous.start_ms + previous.duration_ms
+        assert frames[-1].start_ms + frames[-1].duration_ms == round(13 * 1000 / 12)
+        # The end hold is one keyframe, not six repeated draws at 12 fps.
+        assert frames[-1].duration_ms > 400
+        # 7.2in square at the 50 dpi preview resolution; the config dpi is ignored.
+        assert Image.open(io.BytesIO(frames[0].png)).size == (360, 360)
+        assert plt.get_fignums() == open_before
+
+    def test_closing_early_closes_the_figure(self, session, tmp_path):
+        import matplotlib.pyplot as plt
+
+        open_before = plt.get_fignums()
+        preview = session.render_animation_preview(self._config(tmp_path), "landscape")
+        next(preview)
+        preview.close()
+
+        assert plt.get_fignums() == open_before
+
+    def test_rejects_unknown_format(self, session, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported video format"):
+            next(session.render_animation_preview(self._config(tmp_path), "all"))
+
+    def test_rejects_non_animatable_chart(self, session, tmp_path):
+        from tpsplots.animation.animators import UnsupportedChartAnimation
+
+        config = self._config(tmp_path)
+        config["chart"] = {
+            "type": "donut",
+            "output": "donut",
+            "title": "Donut",
+            "values": [1, 2, 3],
+            "labels": ["A", "B", "C"],
+        }
+        with pytest.raises(UnsupportedChartAnimation):
+            next(session.render_animation_preview(config))
+
+
 class TestLegendDictIntegration:
     """Integration test: legend dict survives clean → validate → build_render_context."""
 
@@ -0,0 +1,164 @@
+"""Tests for the persistent HTTP cache used by remote CSV sources."""
+
+import time
+
+import pytest
+import requests
+
+from tpsplots.data_sources import http_cache
+from tpsplots.data_sources.http_cache import CacheStats, HTTPCache
+from tpsplots.exceptions import DataSourceError
+
+URL = "https://example.com/sheet.csv"
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, text="", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession:
+    """Stand-in for requests.Session returning queued responses."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls: list[dict] = []
+
+    def get(self, url, headers=None, timeout=None, verify=True):
+        self.calls.append({"url": url, "headers": headers or {}})
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def make_cache(tmp_path, *responses, **kwargs):
+    cache = HTTPCache(tmp_path, **kwargs)
+    cache._session = FakeSession(*responses)
+    return cache
+
+
+class TestHTTPCache:
+    """Tests for HTTPCache storage, freshness and revalidation."""
+
+    def test_miss_stores_body_and_validators(self, tmp_path):
+        cache = make_cache(
+            tmp_path, FakeResponse(text="a,b\n1,2\n", headers={"ETag": '"v1"'}), ttl=0
+        )
+
+        assert cache.fetch_text(URL) == "a,b\n1,2\n"
+        assert cache.stats == CacheStats(misses=1)
+        assert len(list(tmp_path.glob("*.body"))) == 1
+
+    def test_fresh_entry_skips_network(self, tmp_path):
+        cache = make_cache(tmp_path, FakeResponse(text="x"), ttl=3600)
+        cache.fetch_text(URL)
+
+        assert cache.fetch_text(URL) == "x"
+        assert len(cache.session.calls) == 1
+        assert cache.stats == CacheStats(hits=1, misses=1)
+
+    def test_expired_entry_revalidates_with_conditional_headers(self, tmp_path):
+        cache = make_cache(
+            tmp_path,
+            FakeResponse(
+                text="x", headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+            ),
+            FakeResponse(status_code=304),
+            ttl=0,
+        )
+        cache.fetch_text(URL)
+
+        assert cache.fetch_text(URL) == "x"
+        sent = cache.session.calls[1]["headers"]
+        assert sent["If-None-Match"] == '"v1"'
+        assert sent["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+        assert cache.stats == CacheStats(revalidated=1, misses=1)
+
+    def test_changed_resource_replaces_entry(self, tmp_path):
+        cache = make_cache(tmp_path, FakeResponse(text="old"), FakeResponse(text="new"), ttl=0)
+        cache.fetch_text(URL)
+
+        assert cache.fetch_text(URL) == "new"
+        cache.offline = True
+        assert cache.fetch_text(URL) == "new"
+
+    def test_network_failure_serves_stale_copy(self, tmp_path):
+        cache = make_cache(
+            tmp_path,
+            FakeResponse(text="x"),
+            requests.exceptions.ConnectionError("down"),
+            ttl=0,
+        )
+        cache.fetch_text(URL)
+
+        assert cache.fetch_text(URL) == "x"
+        assert cache.stats.stale == 1
+
+    def test_http_error_with_cached_copy_raises(self, tmp_path):
+        cache = make_cache(tmp_path, FakeResponse(text="x"), FakeResponse(status_code=404), ttl=0)
+        cache.fetch_text(URL)
+
+        with pytest.raises(DataSourceError, match="404"):
+            cache.fetch_text(URL)
+        assert cache.stats.stale == 0
+
+    def test_network_failure_without_copy_raises(self, tmp_path):
+        cache = make_cache(tmp_path, FakeResponse(status_code=500))
+        with pytest.raises(requests.exceptions.HTTPError):
+            cache.fetch_text(URL)
+        assert not list(tmp_path.glob("*.body"))
+
+    def test_offline_reads_cache_only(self, tmp_path):
+        make_cache(tmp_path, FakeResponse(text="x")).fetch_text(URL)
+        offline = make_cache(tmp_path, offline=True)
+
+        assert offline.fetch_text(URL) == "x"
+        with pytest.raises(DataSourceError, match="Offline mode"):
+            offline.fetch_text("https://example.com/other.csv")
+        assert offline.session.calls == []
+
+    def test_ttl_is_measured_from_last_validation(self, tmp_path, monkeypatch):
+        cache = make_cache(tmp_path, FakeResponse(text="x"), ttl=60)
+        cache.fetch_text(URL)
+
+        later = time.time() + 120
+        monkeypatch.setattr(http_cache.time, "time", lambda: later)
+        cache.session.responses.append(FakeResponse(status_code=304))
+        cache.fetch_text(URL)
+
+        assert cache.stats.revalidated == 1
+        assert cache.fetch_text(URL) == "x"
+        assert cache.stats.hits == 1
+
+    def test_clear(self, tmp_path):
+        cache = make_cache(tmp_path, FakeResponse(text="x"))
+        cache.fetch_text(URL)
+        cache.clear()
+        assert not list(tmp_path.iterdir())
+
+
+def test_configure_http_cache_keeps_unset_settings(tmp_path):
+    http_cache.configure_http_cache(cache_dir=tmp_path, ttl=30)
+    cache = http_cache.configure_http_cache(offline=True)
+
+    assert cache.settings() == {
+        "cache_dir": str(tmp_path),
+        "ttl": 30,
+        "offline": True,
+        "enabled": True,
+    }
+    assert http_cache.get_http_cache() is cache
+
+
+def test_cache_stats_arithmetic():
+    total = CacheStats(hits=2, misses=1) + CacheStats(revalidated=1)
+    assert total - CacheStats(hits=1) == CacheStats(hits=1, revalidated=1, misses=1)
+    assert not CacheStats()
+    assert total.summary() == "HTTP cache: 2 hits, 1 revalidated, 1 misses, 0 stale"
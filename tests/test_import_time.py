@@ -0,0 +1,87 @@
+"""Import-time regression tests for the CLI and package entry points.
+
+Each check runs in a fresh interpreter so modules already imported by the
+test session do not hide a regression.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Never needed to start the CLI, print --version or list chart types.
+HEAVY_MODULES = [
+    "matplotlib",
+    "pandas",
+    "pydantic",
+    "fastapi",
+    "uvicorn",
+    "boto3",
+    "pywaffle",
+    "squarify",
+    "geopandas",
+    "pptx",
+    "flexitext",
+    "adjustText",
+    "tpsplots.views.chart_view",
+    "tpsplots.processors",
+]
+
+# Cumulative import time budget for ``tpsplots.cli`` (measured ~0.1 s; the
+# eager imports it replaced took over a second).
+CLI_IMPORT_BUDGET_US = 500_000
+
+
+def _run(code: str) -> tuple[str, str]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout, result.stderr
+
+
+def _loaded(imports: str, modules: list[str]) -> list[str]:
+    stdout, _ = _run(
+        f"import json, sys\n{imports}\n"
+        f"print(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+    )
+    return json.loads(stdout)
+
+
+def _cumulative_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+@pytest.mark.parametrize("imports", ["import tpsplots", "import tpsplots.cli"])
+def test_entry_points_defer_heavy_modules(imports):
+    assert _loaded(imports, HEAVY_MODULES) == []
+
+
+def test_cli_import_time_budget():
+    _, stderr = _run("import tpsplots.cli")
+    assert _cumulative_us(stderr, "tpsplots.cli") < CLI_IMPORT_BUDGET_US
+
+
+def test_view_registry_imports_only_requested_view():
+    loaded = _loaded(
+        "from tpsplots.views import VIEW_REGISTRY\n"
+        "assert 'waffle_plot' in VIEW_REGISTRY\n"
+        "VIEW_REGISTRY['bar_plot']",
+        ["tpsplots.views.bar_chart", "tpsplots.views.waffle_chart", "pywaffle", "squarify"],
+    )
+    assert loaded == ["tpsplots.views.bar_chart"]
+
+
+def test_lazy_package_attributes_resolve():
+    stdout, _ = _run(
+        "import tpsplots, tpsplots.views as views\n"
+        "print(tpsplots.generate.__module__, views.AreaChartView.__name__, tpsplots.plt.get_backend().lower())"
+    )
+    assert stdout.split() == ["tpsplots.api", "AreaChartView", "agg"]
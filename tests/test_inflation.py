@@ -221,3 +221,83 @@ def test_nnsi_missing_from_year_warns_once(nnsi_fixture_path: Path, caplog):
         r for r in caplog.records if r.levelname == "WARNING" and "1899" in r.getMessage()
     ]
     assert len(missing_warnings) == 1
+
+
+def test_nnsi_multipliers_match_calc_for_every_year_format(nnsi_2025: NNSI):
+    # The batched path must key datetimes, ints, floats and TQ strings exactly
+    # like the scalar path.
+    years = [datetime(2014, 1, 1), 2015, 2016.0, "2017", "1976 TQ", "TQ", 2014]
+    expected = [nnsi_2025.calc(year, 1.0) for year in years]
+
+    assert nnsi_2025.multipliers(years).tolist() == pytest.approx(expected)
+    assert nnsi_2025.multipliers(
+        pd.Series(pd.to_datetime(["2014-01-01", "2015-01-01"]))
+    ).tolist() == (pytest.approx([nnsi_2025.calc(2014, 1.0), nnsi_2025.calc(2015, 1.0)]))
+
+
+def test_nnsi_adjust_keeps_nan_and_warns_once(nnsi_fixture_path: Path, caplog):
+    import numpy as np
+
+    nnsi = NNSI(year="2025", source=nnsi_fixture_path)
+    years = pd.Series([2015, 1899, 1899, 1898])
+    values = pd.Series([100.0, 200.0, 300.0, np.nan])
+
+    with caplog.at_level(logging.WARNING, logger="tpsplots.data_sources.inflation"):
+        adjusted = nnsi.adjust(years, values)
+
+    assert adjusted[0] == pytest.approx(nnsi.calc(2015, 100.0))
+    assert adjusted[1:3].tolist() == [200.0, 300.0]
+    assert np.isnan(adjusted[3])
+    warned = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+    assert sum("1899" in msg for msg in warned) == 1
+    # 1898 only appears on a NaN row, which calc() would never have seen.
+    assert not any("1898" in msg for msg in warned)
+
+
+def test_nnsi_index_is_parsed_once_per_source(nnsi_fixture_path: Path, monkeypatch):
+    # Every target year derives from one read of the raw table.
+    loads = []
+    original = NNSI._load_raw
+
+    def counting_load_raw(self):
+        loads.append(self.source)
+        return original(self)
+
+    monkeypatch.setattr(NNSI, "_load_raw", counting_load_raw)
+
+    first = NNSI(year="2025", source=nnsi_fixture_path)
+    again = NNSI(year="2025", source=nnsi_fixture_path)
+    other_year = NNSI(year="2020", source=nnsi_fixture_path)
+
+    assert len(loads) == 1
+    assert again._table is first._table
+    assert other_year.calc(2015, 1.0) == pytest.approx(
+        _fixture_multiplier(nnsi_fixture_path, "FROM 2015", 2020)
+    )
+    with pytest.raises(TypeError):
+        first._table["2015"] = 0.0
+
+    NNSI.clear_cache(nnsi_fixture_path)
+    NNSI(year="2025", source=nnsi_fixture_path)
+    assert len(loads) == 2
+
+
+def test_clear_cache_is_scoped_to_class():
+    rows = [
+        ["YEAR", "2024", "2025"],
+        ["From 2024", "1.0", "1.1"],
+    ]
+    quarters = pd.DataFrame(
+        {
+            "observation_date": ["2023-10-01", "2024-01-01", "2024-04-01", "2024-07-01"],
+            "GDPDEF": ["100", "100", "100", "100"],
+        }
+    )
+    _nnsi_from_rows(rows)
+    DummyGDP(year="2024", df=quarters)
+
+    from tpsplots.data_sources import inflation
+
+    NNSI.clear_cache()
+    cached = {key[0] for key in inflation._parsed_indexes}
+    assert cached == {DummyGDP}
@@ -381,3 +381,39 @@ class TestInflationAdjustmentCustomFYColumn:
         result = processor.process(df)
 
         assert "Amount_adjusted_nnsi" in result.columns
+
+
+class TestInflationAdjustmentVectorized:
+    """The batched adjustment must reproduce the row-wise calc() results."""
+
+    @pytest.fixture
+    def mock_nnsi(self):
+        """Mock NNSI with a distinct multiplier per year and a TQ row."""
+        mock_table = {str(y): 1 + (2025 - y) / 100 for y in range(2015, 2026)}
+        mock_table["TQ"] = 3.0
+        with patch(
+            "tpsplots.processors.inflation_adjustment_processor.NNSI._load_table",
+            return_value=mock_table,
+        ):
+            yield
+
+    def test_matches_row_wise_calc(self, mock_nnsi):
+        df = pd.DataFrame(
+            {
+                "Fiscal Year": [2015, 2020.0, "1976 TQ", datetime(2025, 1, 1), 2040],
+                "PBR": [10.0, 20.0, 30.0, np.nan, 50.0],
+                "Enacted": [1, 2, 3, 4, 5],
+            }
+        )
+        config = InflationAdjustmentConfig(target_year=2025, nnsi_columns=["PBR", "Enacted"])
+        processor = InflationAdjustmentProcessor(config)
+
+        result = processor.process(df)
+
+        for col in ("PBR", "Enacted"):
+            expected = [
+                processor._nnsi.calc(fy, value) if pd.notna(value) else np.nan
+                for fy, value in zip(df["Fiscal Year"], df[col], strict=True)
+            ]
+            assert result[f"{col}_adjusted_nnsi"].tolist() == pytest.approx(expected, nan_ok=True)
+        assert result["PBR_adjusted_nnsi"].dtype == np.float64
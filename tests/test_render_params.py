@@ -0,0 +1,106 @@
+"""Tests for the frozen render parameters shared across device renders."""
+
+import copy
+import importlib.util
+import pickle
+from copy import deepcopy
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+from tpsplots.views.render_params import FrozenDict, FrozenList, RenderParams, freeze
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_freeze_keeps_container_types_but_blocks_mutation():
+    frozen = freeze({"legend": {"ncol": 2}, "colors": ["red", "blue"], "lim": (0, [1])})
+
+    assert isinstance(frozen, dict) and isinstance(frozen["colors"], list)
+    assert frozen == {"legend": {"ncol": 2}, "colors": ["red", "blue"], "lim": (0, [1])}
+    for mutate in (
+        lambda: frozen.update(x=1),
+        lambda: frozen["legend"].setdefault("loc", "best"),
+        lambda: frozen["colors"].append("green"),
+        lambda: frozen["lim"][1].sort(),
+    ):
+        with pytest.raises(TypeError, match="read-only"):
+            mutate()
+
+    # Copies are ordinary, mutable containers.
+    colors = list(frozen["colors"])
+    colors.append("green")
+    assert frozen["colors"] == ["red", "blue"]
+
+
+def test_arrays_become_read_only_views():
+    values = np.arange(5.0)
+    frozen = freeze({"y": values})["y"]
+
+    assert np.shares_memory(frozen, values)
+    assert not frozen.flags.writeable
+    assert values.flags.writeable
+    with pytest.raises(ValueError, match="read-only"):
+        frozen[0] = 1
+
+
+def test_frozen_params_survive_pickle_and_copy():
+    params = RenderParams({"legend": {"ncol": 2}, "y": [np.arange(3)], "tags": {"a"}})
+
+    for clone in (pickle.loads(pickle.dumps(params)), copy.copy(params), deepcopy(params)):
+        assert type(clone) is RenderParams
+        assert isinstance(clone["legend"], FrozenDict)
+        assert isinstance(clone["y"], FrozenList)
+        assert not clone["y"][0].flags.writeable
+        assert clone["tags"] == frozenset({"a"})
+
+
+def test_render_params_of_does_not_refreeze():
+    params = RenderParams({"y": [1, 2]})
+    assert RenderParams.of(params) is params
+    assert RenderParams.of({"y": [1, 2]}) == params
+
+
+def _load_cases():
+    spec = importlib.util.spec_from_file_location(
+        "bench_pipeline", REPO_ROOT / "benchmarks" / "bench_pipeline.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.CASES
+
+
+def _assert_unchanged(before, after, path="params"):
+    assert type(before) is type(after), path
+    if isinstance(before, (pd.DataFrame, pd.Series)):
+        assert before.equals(after), path
+    elif isinstance(before, (np.ndarray, pd.Index, pd.api.extensions.ExtensionArray)):
+        np.testing.assert_array_equal(np.asarray(before), np.asarray(after), err_msg=path)
+    elif isinstance(before, dict):
+        assert before.keys() == after.keys(), path
+        for key in before:
+            _assert_unchanged(before[key], after[key], f"{path}[{key!r}]")
+    elif isinstance(before, (list, tuple)):
+        assert len(before) == len(after), path
+        for i, (b, a) in enumerate(zip(before, after, strict=True)):
+            _assert_unchanged(b, a, f"{path}[{i}]")
+    else:
+        np.testing.assert_equal(after, before, err_msg=path)
+
+
+@pytest.mark.parametrize("chart_type", sorted(_load_cases()))
+def test_device_renders_do_not_mutate_inputs(chart_type, tmp_path, monkeypatch):
+    monkeypatch.chdir(REPO_ROOT)
+    processor = YAMLChartProcessor(_load_cases()[chart_type], outdir=tmp_path)
+    ctx, view = processor.prepare_render()
+    params = {key: value for key, value in ctx.resolved_params.items() if key != "dpi"}
+    snapshot = deepcopy(params)
+
+    for device in ("desktop", "mobile", "social"):
+        plt.close(view.create_figure(dict(ctx.resolved_metadata), device, dpi=30, **params))
+
+    _assert_unchanged(snapshot, params)
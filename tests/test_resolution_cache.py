@@ -0,0 +1,143 @@
+"""Tests for the batch-scoped data resolution cache."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tpsplots.models.data_sources import DataSourceConfig
+from tpsplots.processors.batch import iter_chart_jobs
+from tpsplots.processors.resolvers import DataResolver, ResolutionCache
+
+
+@pytest.fixture
+def counting_csv(monkeypatch):
+    """Replace CSV loading with a counter returning a small frame."""
+    calls: list[str] = []
+
+    def fake_resolve_csv(path, params=None):
+        calls.append(path)
+        df = pd.DataFrame({"Year": [2020, 2021], "Value": [1.0, 3.0]})
+        return {
+            "data": df,
+            "Year": np.array([2020, 2021]),
+            "Value": np.array([1.0, 3.0]),
+            "metadata": {"rows": 2},
+        }
+
+    monkeypatch.setattr(DataResolver, "_resolve_csv", staticmethod(fake_resolve_csv))
+    return calls
+
+
+class TestResolutionCache:
+    """Tests for ResolutionCache keying and copy-on-write views."""
+
+    def test_identical_sources_resolve_once(self, counting_csv):
+        cache = ResolutionCache()
+        config = DataSourceConfig(source="csv:data/budget.csv")
+
+        DataResolver.resolve(config, cache=cache)
+        DataResolver.resolve(config, cache=cache)
+
+        assert len(counting_csv) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_source_spellings_normalize_to_one_key(self):
+        explicit = DataSourceConfig(source="controller:nasa_budget_chart.by_year")
+        bare = DataSourceConfig(source="  nasa_budget_chart.by_year ")
+        assert ResolutionCache.key_for(explicit) == ResolutionCache.key_for(bare)
+
+        default_type = DataSourceConfig(
+            source="data.csv", calculate_inflation={"columns": ["A"], "type": "nnsi"}
+        )
+        implicit_type = DataSourceConfig(source="data.csv", calculate_inflation={"columns": ["A"]})
+        assert ResolutionCache.key_for(default_type) == ResolutionCache.key_for(implicit_type)
+
+    def test_params_and_inflation_are_part_of_the_key(self):
+        base = DataSourceConfig(source="data.csv")
+        with_params = DataSourceConfig(source="data.csv", params={"columns": ["A"]})
+        with_inflation = DataSourceConfig(source="data.csv", calculate_inflation={"columns": ["A"]})
+        keys = {ResolutionCache.key_for(c) for c in (base, with_params, with_inflation)}
+        assert len(keys) == 3
+
+    def test_views_cannot_mutate_cached_entry(self, counting_csv):
+        cache = ResolutionCache()
+        config = DataSourceConfig(source="data.csv")
+
+        first = DataResolver.resolve(config, cache=cache)
+        first["data"]["Value"] = [100.0, 300.0]
+        first["data"].loc[0, "Year"] = 1999
+        first["metadata"]["rows"] = 99
+        first["extra"] = "added"
+        with pytest.raises(ValueError):
+            first["Value"][0] = 100.0
+
+        second = DataResolver.resolve(config, cache=cache)
+        assert second["data"]["Value"].tolist() == [1.0, 3.0]
+        assert second["data"]["Year"].tolist() == [2020, 2021]
+        assert second["metadata"]["rows"] == 2
+        assert "extra" not in second
+        assert second["Value"].tolist() == [1.0, 3.0]
+
+    def test_failures_are_not_cached(self, monkeypatch):
+        calls: list[str] = []
+
+        def failing(path, params=None):
+            calls.append(path)
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(DataResolver, "_resolve_csv", staticmethod(failing))
+        cache = ResolutionCache()
+        config = DataSourceConfig(source="data.csv")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                DataResolver.resolve(config, cache=cache)
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+    def test_invalidate(self, counting_csv):
+        cache = ResolutionCache()
+        config = DataSourceConfig(source="data.csv")
+        DataResolver.resolve(config, cache=cache)
+
+        cache.invalidate(config)
+        assert config not in cache
+        DataResolver.resolve(config, cache=cache)
+        assert len(counting_csv) == 2
+
+    def test_invalidate_files_drops_only_entries_read_from_them(self, tmp_path, counting_csv):
+        cache = ResolutionCache()
+        changed = DataSourceConfig(source=f"csv:{tmp_path / 'a.csv'}")
+        kept = DataSourceConfig(source=f"csv:{tmp_path / 'b.csv'}")
+        for config in (changed, kept):
+            DataResolver.resolve(config, cache=cache)
+
+        assert cache.invalidate_files([tmp_path / "a.csv"]) == 1
+        assert changed not in cache
+        assert kept in cache
+
+
+def test_batch_run_shares_one_resolution(tmp_path: Path, counting_csv):
+    """Every chart in a generate batch reuses the first chart's data."""
+    yaml_files = []
+    for name in ("one", "two", "three"):
+        path = tmp_path / f"{name}.yaml"
+        path.write_text(
+            f"data:\n"
+            f"  source: csv:shared.csv\n"
+            f"chart:\n"
+            f"  type: bar\n"
+            f"  output: {name}\n"
+            f"  title: Shared\n"
+            f'  categories: "{{{{Year}}}}"\n'
+            f'  values: "{{{{Value}}}}"\n',
+            encoding="utf-8",
+        )
+        yaml_files.append(path)
+
+    outcomes = list(iter_chart_jobs(yaml_files, tmp_path / "out"))
+
+    assert [o.status for o in outcomes] == ["ok", "ok", "ok"]
+    assert counting_csv == ["shared.csv"]
@@ -0,0 +1,88 @@
+"""Tests for the grid index behind direct-label line collision checks."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from tpsplots.views.mixins.segment_index import MAX_CELLS_PER_SEGMENT, SegmentIndex
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _segments_cross(p, q, r, s):
+    d1, d2 = _cross(r, s, p), _cross(r, s, q)
+    d3, d4 = _cross(p, q, r), _cross(p, q, s)
+    return d1 * d2 <= 0 and d3 * d4 <= 0
+
+
+def _brute_force(lines, box):
+    """Exact check: an end inside the box, or a crossing with one of its edges."""
+    x0, y0, x1, y1 = box
+    corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1)]
+    edges = list(zip(corners, corners[1:] + corners[:1], strict=True))
+    for line in lines:
+        for p, q in itertools.pairwise(line):
+            if any(x0 <= x <= x1 and y0 <= y <= y1 for x, y in (p, q)):
+                return True
+            if any(_segments_cross(p, q, r, s) for r, s in edges):
+                return True
+    return False
+
+
+@pytest.mark.parametrize(
+    ("box", "expected"),
+    [
+        ((40, 40, 60, 60), True),  # diagonal crosses the box
+        ((10, 60, 30, 90), False),  # above the diagonal
+        ((200, 0, 260, 20), True),  # horizontal segment passes through
+        ((200, 30, 260, 50), False),  # parallel to it, above
+        ((0, 100, 100, 140), True),  # touches the diagonal's end
+    ],
+)
+def test_intersects_box(box, expected):
+    index = SegmentIndex([np.array([[0, 0], [100, 100]]), np.array([[150, 10], [400, 10]])])
+    assert index.intersects_box(*box) is expected
+
+
+def test_segment_entirely_inside_box_counts():
+    index = SegmentIndex([np.array([[50, 50], [55, 52]])])
+    assert index.intersects_box(0, 0, 500, 500)
+
+
+def test_degenerate_and_non_finite_input_is_ignored():
+    index = SegmentIndex([np.array([[5, 5]]), np.array([[0, 0], [np.nan, 10]]), np.empty((0, 2))])
+    assert len(index) == 0
+    assert not index.intersects_box(-1e6, -1e6, 1e6, 1e6)
+
+
+def test_zero_length_segment_is_a_point():
+    index = SegmentIndex([np.array([[10, 10], [10, 10]])])
+    assert index.intersects_box(5, 5, 15, 15)
+    assert not index.intersects_box(11, 5, 15, 15)
+
+
+def test_long_diagonal_stays_out_of_the_grid():
+    # Far past the axes: its bounding box alone would span ~39M cells.
+    diagonal = np.array([[0, 0], [3e5, 3e5]])
+    index = SegmentIndex([diagonal, np.array([[0, 10], [40, 10]])])
+
+    assert len(index._keys) <= MAX_CELLS_PER_SEGMENT
+    assert index.intersects_box(1000, 990, 1020, 1010)
+    assert not index.intersects_box(1000, 900, 1020, 950)
+    assert index.intersects_box(20, 5, 30, 15)
+
+
+def test_matches_brute_force_on_random_lines():
+    rng = np.random.default_rng(0)
+    lines = [
+        np.column_stack([np.linspace(0, 800, n), rng.normal(300, 120, n).cumsum() / 4])
+        for n in (2, 10, 60, 400)
+    ]
+    index = SegmentIndex(lines, cell_px=32)
+    for _ in range(300):
+        x0, y0 = rng.uniform(-100, 900), rng.uniform(-200, 600)
+        box = (x0, y0, x0 + rng.uniform(1, 150), y0 + rng.uniform(1, 40))
+        assert index.intersects_box(*box) == _brute_force(lines, box), box
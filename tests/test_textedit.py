@@ -106,6 +106,20 @@ def test_textedit_session_renders_svg_without_writing_chart_files(tmp_path):
     assert not list(outdir.glob("*.pptx"))
 
 
+def test_textedit_session_reuses_chart_body_for_text_edits(tmp_path):
+    """Only the first render per device draws the data; text edits relayout a copy."""
+    yaml_path = _write_minimal_chart_yaml(tmp_path)
+
+    from tpsplots.textedit.session import TextEditSession
+
+    session = TextEditSession(yaml_path=yaml_path, outdir=tmp_path / "charts")
+    session.render_svg(device="desktop", title="First")
+    svg = session.render_svg(device="desktop", title="Second")
+
+    assert "Second" in svg and "First" not in svg
+    assert session._body_cache.stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
 def test_textedit_session_save_updates_source_yaml(tmp_path):
     """Saving in a session should update title/subtitle/source in YAML."""
     yaml_path = _write_minimal_chart_yaml(tmp_path)
@@ -0,0 +1,49 @@
+"""Tests for the us_map_pie states base map."""
+
+from __future__ import annotations
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+from tpsplots.views import us_map_pie_charts
+from tpsplots.views.us_map_pie_charts import USMapPieChartView, _lower48_state_paths
+
+
+@pytest.fixture
+def ax():
+    fig, ax = plt.subplots()
+    yield ax
+    plt.close(fig)
+
+
+def test_state_paths_are_parsed_once_and_cover_the_lower_48():
+    paths = _lower48_state_paths()
+
+    assert _lower48_state_paths() is paths
+    assert len(paths) == 48  # the bundled 50 states (no DC) less AK and HI
+    vertices = np.concatenate([p.vertices for p in paths])
+    assert vertices[:, 0].min() > -125 and vertices[:, 0].max() < -66
+    assert vertices[:, 1].min() > 24 and vertices[:, 1].max() < 50
+    assert all(p.readonly for p in paths)
+
+
+def test_base_map_draws_one_collection_without_axis_labels(tmp_path, ax):
+    USMapPieChartView(outdir=tmp_path)._load_states_map(ax, show_state_boundaries=False)
+
+    [states] = ax.collections
+    assert len(states.get_paths()) == 48
+    assert states.get_linewidth()[0] == pytest.approx(0.1)
+    assert (ax.get_xlabel(), ax.get_ylabel()) == ("", "")
+
+
+def test_unreadable_geometry_falls_back_to_a_rectangle(tmp_path, ax, monkeypatch):
+    monkeypatch.setattr(us_map_pie_charts, "STATES_GEOJSON", tmp_path / "missing.geojson")
+    _lower48_state_paths.cache_clear()
+    try:
+        USMapPieChartView(outdir=tmp_path)._load_states_map(ax, show_state_boundaries=True)
+    finally:
+        _lower48_state_paths.cache_clear()
+
+    assert not ax.collections
+    assert len(ax.patches) == 1
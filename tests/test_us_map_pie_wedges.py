@@ -0,0 +1,101 @@
+"""Tests for batched us_map_pie wedge rendering."""
+
+from __future__ import annotations
+
+import io
+import itertools
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.collections import PathCollection
+from PIL import Image
+
+from tpsplots.views.us_map_pie_charts import USMapPieChartView
+
+PIES = [((-100.0, 40.0), [3, 1], ["#037CC2", "#FF5D47"]), ((-90.0, 35.0), [1, 1, 2], None)]
+
+
+def _render(draw) -> np.ndarray:
+    fig, ax = plt.subplots(figsize=(4, 3), dpi=100)
+    ax.set_xlim(-110, -80)
+    ax.set_ylim(30, 45)
+    ax.set_axis_off()
+    draw(ax)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    return np.asarray(Image.open(buf)).astype(int)
+
+
+def _per_wedge_scatter(view, ax):
+    """Reference: one scatter call per wedge, as the view used to draw pies."""
+    for (x, y), values, colors in PIES:
+        colors = colors or view._get_cycled_colors(len(values))
+        bounds = [0, *(np.cumsum(values) / np.sum(values)).tolist()]
+        for i, (r1, r2) in enumerate(itertools.pairwise(bounds)):
+            angles = np.linspace(2 * np.pi * r1 + np.pi / 2, 2 * np.pi * r2 + np.pi / 2, 50)
+            marker = np.column_stack([[0, *np.cos(angles)], [0, *np.sin(angles)]])
+            ax.scatter(
+                [x],
+                [y],
+                marker=marker,
+                s=800,
+                color=colors[i],
+                alpha=0.85,
+                edgecolors="white",
+                linewidths=0.5,
+                zorder=10,
+            )
+
+
+def _batched(view, ax):
+    pie_data = {
+        f"P{i}": {"values": values, **({"colors": colors} if colors else {})}
+        for i, (_, values, colors) in enumerate(PIES)
+    }
+    locations = {f"P{i}": {"lat": y, "lon": x} for i, ((x, y), _, _) in enumerate(PIES)}
+    view._draw_pies_and_collect_legend(
+        ax,
+        pie_data,
+        locations,
+        offset_positions={},
+        pie_sizes={},
+        show_pie_labels=False,
+        show_percentages=False,
+        offset_line_color="gray",
+        offset_line_style="--",
+        offset_line_width=1.5,
+        figsize=view.DESKTOP["figsize"],
+        dpi=view.DESKTOP["dpi"],
+        style=view.DESKTOP,
+        base_pie_size=800,
+    )
+
+
+@pytest.fixture
+def view(tmp_path):
+    return USMapPieChartView(outdir=tmp_path, style_file=None)
+
+
+def test_all_wedges_draw_as_one_collection(view):
+    fig, ax = plt.subplots()
+    _batched(view, ax)
+
+    [wedges] = ax.collections
+    assert isinstance(wedges, PathCollection)
+    assert len(wedges.get_paths()) == 5
+    assert wedges.get_sizes().tolist() == [800] * 5
+    assert wedges.get_zorder() == 10
+    plt.close(fig)
+
+
+def test_batched_wedges_match_per_wedge_scatter(view):
+    reference = _render(lambda ax: _per_wedge_scatter(view, ax))
+    batched = _render(lambda ax: _batched(view, ax))
+
+    # Scatter markers snap to whole pixels; the batch keeps exact offsets, so
+    # only anti-aliased wedge edges may differ.
+    differs = np.abs(batched - reference).max(axis=-1) > 0
+    assert differs.mean() < 0.01
+    assert np.abs(batched - reference).mean() < 0.5
@@ -943,6 +943,7 @@ def test_us_map_helpers_fallback_to_base_size_when_pie_size_missing(tmp_path):
         style,
         pie_edge_color,
         pie_edge_width,
+        wedges=None,
     ):
         captured_sizes.append(size)
         return axis
@@ -0,0 +1,125 @@
+"""Tests for dependency-aware watch mode."""
+
+import threading
+import time
+from pathlib import Path
+
+from tpsplots.processors.watch import (
+    DependencyIndex,
+    _apply_changes,
+    chart_dependencies,
+    watch_charts,
+)
+
+
+def _write_yaml(path: Path, source: str) -> Path:
+    path.write_text(f"data:\n  source: {source}\nchart:\n  type: bar\n", encoding="utf-8")
+    return path
+
+
+class TestChartDependencies:
+    """Tests for reading local dependencies from data.source."""
+
+    def test_csv_source(self, tmp_path):
+        csv_path = tmp_path / "data.csv"
+        yaml_path = _write_yaml(tmp_path / "a.yaml", f"csv:{csv_path}")
+
+        assert chart_dependencies(yaml_path) == {yaml_path.resolve(), csv_path.resolve()}
+
+    def test_relative_sources_resolve_from_cwd(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        yaml_path = _write_yaml(tmp_path / "a.yaml", "controller:ctrl/budget.py:load")
+
+        assert (tmp_path / "ctrl" / "budget.py").resolve() in chart_dependencies(yaml_path)
+
+    def test_remote_and_invalid_sources_depend_only_on_yaml(self, tmp_path):
+        remote = _write_yaml(tmp_path / "remote.yaml", "https://example.com/sheet.csv")
+        broken = tmp_path / "broken.yaml"
+        broken.write_text("data: [unclosed\n", encoding="utf-8")
+
+        assert chart_dependencies(remote) == {remote.resolve()}
+        assert chart_dependencies(broken) == {broken.resolve()}
+
+
+class TestDependencyIndex:
+    """Tests for mapping changed files to dependent charts."""
+
+    def test_shared_data_file_maps_to_every_dependent(self, tmp_path):
+        shared = tmp_path / "shared.csv"
+        a = _write_yaml(tmp_path / "a.yaml", f"csv:{shared}")
+        b = _write_yaml(tmp_path / "b.yaml", f"csv:{tmp_path / 'other.csv'}")
+        c = _write_yaml(tmp_path / "c.yaml", f"csv:{shared}")
+        index = DependencyIndex([a, b, c])
+
+        assert index.dependents([shared]) == [a, c]
+        assert index.dependents([b]) == [b]
+        assert index.dependents([tmp_path / "unrelated.csv"]) == []
+
+    def test_edited_yaml_moves_to_new_source(self, tmp_path):
+        old, new = tmp_path / "old.csv", tmp_path / "new.csv"
+        chart = _write_yaml(tmp_path / "a.yaml", f"csv:{old}")
+        index = DependencyIndex([chart])
+
+        _write_yaml(chart, f"csv:{new}")
+        assert _apply_changes(index, [chart], {chart.resolve()}) == [chart]
+        assert index.dependents([old]) == []
+        assert index.dependents([new]) == [chart]
+
+    def test_changed_sources_are_data_files_only(self, tmp_path):
+        csv_path = tmp_path / "data.csv"
+        chart = _write_yaml(tmp_path / "a.yaml", f"csv:{csv_path}")
+        index = DependencyIndex([chart])
+
+        assert index.changed_sources([chart, csv_path, tmp_path / "other.csv"]) == {
+            csv_path.resolve()
+        }
+
+    def test_added_and_removed_charts(self, tmp_path):
+        a = _write_yaml(tmp_path / "a.yaml", "https://example.com/a.csv")
+        b = _write_yaml(tmp_path / "b.yaml", "https://example.com/b.csv")
+        index = DependencyIndex([a])
+
+        assert _apply_changes(index, [b], {a.resolve(), b.resolve()}) == [b]
+        assert index.charts == [b]
+
+
+def test_watch_rerenders_only_dependent_charts(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    csv_path = data_dir / "budget.csv"
+    csv_path.write_text("Year,Value\n2020,1\n", encoding="utf-8")
+    dependent = _write_yaml(tmp_path / "dependent.yaml", f"csv:{csv_path}")
+    other = _write_yaml(tmp_path / "other.yaml", "https://example.com/sheet.csv")
+
+    rebuilt: list[list[Path]] = []
+    invalidated: list[set[Path]] = []
+    stop = threading.Event()
+
+    def rebuild(charts):
+        rebuilt.append(charts)
+        stop.set()
+
+    watcher = threading.Thread(
+        target=watch_charts,
+        args=(lambda: [dependent, other], rebuild),
+        kwargs={
+            "input_dirs": [tmp_path],
+            "invalidate": invalidated.append,
+            "stop_event": stop,
+            "debounce_ms": 50,
+        },
+    )
+    watcher.start()
+    try:
+        # Keep touching the file until the watcher (starting asynchronously) sees it.
+        deadline = time.monotonic() + 10
+        while not stop.is_set() and time.monotonic() < deadline:
+            csv_path.write_text(f"Year,Value\n2020,{time.monotonic()}\n", encoding="utf-8")
+            stop.wait(0.2)
+    finally:
+        stop.set()
+        watcher.join(timeout=10)
+
+    assert not watcher.is_alive()
+    assert rebuilt and rebuilt[0] == [dependent]
+    assert invalidated[0] == {csv_path.resolve()}
@@ -13,8 +13,17 @@ CLI usage:
     $ tpsplots yaml/  # Process all YAML files in directory
 """
 
+import threading
 from pathlib import Path
 
+from tpsplots.exceptions import (
+    ConfigurationError,
+    DataSourceError,
+    RenderingError,
+    TPSPlotsError,
+)
+from tpsplots.lazy import lazy_exports
+
 
 def _configure_matplotlib():
     """Use a single non-interactive backend for all package rendering."""
@@ -32,8 +41,6 @@ def _configure_matplotlib():
     return fm, plt
 
 
-fm, plt = _configure_matplotlib()
-
 # Version
 __version__ = "1.0.0"
 
@@ -49,20 +56,50 @@ ASSETS_DIR = (PACKAGE_ROOT / "assets").resolve()
 FONTS_DIR = (ASSETS_DIR / "fonts" / "Poppins").resolve()
 IMAGES_DIR = (ASSETS_DIR / "images").resolve()
 
-# Register custom Poppins fonts from the package assets directory
-if FONTS_DIR.exists():
-    for font_file in FONTS_DIR.glob("*.ttf"):
-        fm.fontManager.addfont(str(font_file))
-
-# Public API imports
-from tpsplots.api import generate  # noqa: E402
-from tpsplots.exceptions import (  # noqa: E402
-    ConfigurationError,
-    DataSourceError,
-    RenderingError,
-    TPSPlotsError,
+_matplotlib_lock = threading.Lock()
+_matplotlib_ready = False
+
+
+def ensure_matplotlib() -> None:
+    """Select the Agg backend and register the Poppins fonts, once per process.
+
+    Deferred until something draws, so ``import tpsplots``, ``tpsplots
+    --version`` and ``validate`` never load pyplot. ``tpsplots.views.chart_view``
+    calls it on import (every chart view loads it), and the process-pool
+    worker initializers call it before rendering: ``processors.batch``,
+    ``views.variant_pool`` and ``editor.preview_pool``.
+    """
+    global _matplotlib_ready
+    if _matplotlib_ready:
+        return
+    with _matplotlib_lock:
+        if _matplotlib_ready:
+            return
+        fm, _plt = _configure_matplotlib()
+        # Register custom Poppins fonts from the package assets directory
+        if FONTS_DIR.exists():
+            for font_file in FONTS_DIR.glob("*.ttf"):
+                fm.fontManager.addfont(str(font_file))
+        _matplotlib_ready = True
+
+
+# Public API imports, resolved on first access
+_lazy_getattr, __dir__ = lazy_exports(
+    __name__,
+    {
+        "generate": "tpsplots.api:generate",
+        "fm": "matplotlib.font_manager",
+        "plt": "matplotlib.pyplot",
+    },
 )
 
+
+def __getattr__(name: str):
+    if name in ("fm", "plt"):
+        ensure_matplotlib()
+    return _lazy_getattr(name)
+
+
 __all__ = [
     "ASSETS_DIR",
     "FONTS_DIR",
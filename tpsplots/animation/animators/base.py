@@ -32,13 +32,13 @@ easings may only ever drive geometry.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Hashable, Iterable, Mapping
 from dataclasses import dataclass
 from typing import Any
 
 from tpsplots.animation.config import ResolvedAnimation, effective_choreography
 from tpsplots.animation.easing import EasingFn, get_easing
-from tpsplots.animation.timeline import Timeline, Window
+from tpsplots.animation.timeline import Timeline, Window, idle_spans
 from tpsplots.exceptions import RenderingError
 from tpsplots.views.anim_tags import Tag, iter_tagged
 
@@ -131,6 +131,7 @@ class BaseAnimator(ABC):
         self.by_role: dict[str, list[tuple[Tag, Any]]] = {}
         self.timeline = Timeline()
         self._draw_duration = 0.0
+        self._idle_spans: list[tuple[float, float]] = []
 
     # ── lifecycle ────────────────────────────────────────────────────
 
@@ -144,12 +145,12 @@ class BaseAnimator(ABC):
         self.timeline = self.build_timeline()
         self._draw_duration = self.timeline.duration  # frozen; hoisted off the frame loop
         self.capture()
+        self._idle_spans = idle_spans(self.busy_windows())  # after capture: may read it
         self.apply_global(0.0)
 
     def apply_global(self, t: float) -> None:
         """Advance the whole scene to wall-clock time ``t`` (idempotent)."""
-        draw_t = min(max(t - self.anim.intro_hold, 0.0), self._draw_duration)
-        self.apply(draw_t)
+        self.apply(self._draw_time(t))
 
     def finalize(self) -> None:
         """Restore the exact final state (for the end hold / poster frame)."""
@@ -160,6 +161,20 @@ class BaseAnimator(ABC):
         """Video length in seconds: intro + draw phase + end hold."""
         return self.anim.intro_hold + self._draw_duration + self.anim.end_hold
 
+    def frame_key(self, t: float) -> Hashable:
+        """A key that is equal for two wall-clock times showing the same frame.
+
+        Frames share a key when they map to the same draw-phase time (the
+        intro and end holds) or fall in one stretch of the draw phase where
+        none of :meth:`busy_windows` is in progress. The encoder renders each
+        run of equal keys once and repeats the frame.
+        """
+        draw_t = self._draw_time(t)
+        for span in self._idle_spans:
+            if span[0] <= draw_t < span[1]:
+                return span
+        return draw_t
+
     # ── subclass contract ────────────────────────────────────────────
 
     @abstractmethod
@@ -177,6 +192,15 @@ class BaseAnimator(ABC):
         Must be idempotent: state = f(t), never f(dt).
         """
 
+    def busy_windows(self) -> Iterable[Window]:
+        """Every window that can change the scene, on the draw-phase clock.
+
+        Defaults to the timeline's windows. Subclasses that evaluate a window
+        on a shifted clock must report the shifted window here, or
+        :meth:`frame_key` would treat its motion as a still.
+        """
+        return self.timeline.windows()
+
     # ── shared helpers ───────────────────────────────────────────────
 
     # Part of the subclass API (also available module-level).
@@ -205,6 +229,9 @@ class BaseAnimator(ABC):
 
     # ── internals ────────────────────────────────────────────────────
 
+    def _draw_time(self, t: float) -> float:
+        return min(max(t - self.anim.intro_hold, 0.0), self._draw_duration)
+
     def _assert_pixel_dims(self) -> None:
         if self.expected_px is None:
             return
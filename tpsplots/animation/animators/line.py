@@ -160,6 +160,17 @@ class LineAnimator(BaseAnimator):
                 timeline.add(("pop", tag.index), Window(start + draw, pop_duration, pop_easing))
         return timeline
 
+    def busy_windows(self) -> list[Window]:
+        # Companion fades run on the label window shifted by companion_delay.
+        windows = self.timeline.windows()
+        for index, capture in self._series:
+            label = self.timeline.window(("label", index))
+            if label is not None and 0.0 < capture.companion_delay < math.inf:
+                windows.append(
+                    Window(label.start + capture.companion_delay, label.duration, label.easing)
+                )
+        return windows
+
     def capture(self) -> None:
         endpoints = {tag.index: artist for tag, artist in self.tagged(Roles.ENDPOINT)}
         rings = {tag.index: artist for tag, artist in self.tagged(Roles.ENDPOINT_RING)}
@@ -0,0 +1,147 @@
+"""Blitted frame rendering for the animation encoder.
+
+Only tagged artists (see :mod:`tpsplots.views.anim_tags`) change between
+frames; axes, gridlines, tick labels and everything else drawn before them are
+identical in every frame. :class:`BlitRenderer` rasterizes that static prefix
+of the figure's draw order once, then renders each frame by restoring the
+cached background and redrawing only the rest — the tagged artists plus any
+untagged artist that a full draw paints *after* the first of them (spines,
+labels, legends, later axes). Redrawing that whole suffix in draw order keeps
+z-order and alpha blending identical to a full ``canvas.draw()``.
+
+This module must stay cheap to import (the encoder imports it lazily, and the
+animation package may not pull in ``matplotlib.animation``); matplotlib itself
+is only imported inside functions.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from tpsplots.views.anim_tags import iter_tagged
+
+
+class BlitRenderer:
+    """Renders frames of ``fig`` by redrawing only its animated suffix.
+
+    Construct via :func:`blitting`, which also restores the figure afterwards.
+    """
+
+    def __init__(self, fig: Any, redraw: list[Any]) -> None:
+        """
+        Args:
+            fig: The prepared figure being animated.
+            redraw: Artists (or whole axes) to redraw per frame, in the order a
+                full draw paints them.
+        """
+        self.fig = fig
+        self.redraw = redraw
+        self._background: Any = None
+
+    def capture_background(self) -> None:
+        """Draw everything except the redraw set once and cache the pixels."""
+        for artist in self.redraw:
+            artist.set_animated(True)
+        canvas = self.fig.canvas
+        canvas.draw()
+        self._background = canvas.copy_from_bbox(self.fig.bbox)
+
+    def render(self) -> memoryview:
+        """Draw the current frame and return the canvas's RGBA buffer."""
+        canvas = self.fig.canvas
+        canvas.restore_region(self._background)
+        renderer = canvas.get_renderer()
+        for artist in self.redraw:
+            artist.draw(renderer)
+        return canvas.buffer_rgba()
+
+    def release(self) -> None:
+        """Return the redraw set to normal drawing (e.g. for the poster frame)."""
+        for artist in self.redraw:
+            artist.set_animated(False)
+
+
+def _axes_draw_order(ax: Any) -> list[Any]:
+    """``ax``'s children in the order ``Axes.draw`` paints them (patch excluded)."""
+    children = ax.get_children()
+    children.remove(ax.patch)
+    if not (ax.axison and ax.get_frame_on()):
+        hidden = set(ax.spines.values())
+        children = [child for child in children if child not in hidden]
+    if not ax.axison:
+        hidden = set(ax._axis_map.values())
+        children = [child for child in children if child not in hidden]
+    return sorted(children, key=lambda artist: artist.get_zorder())
+
+
+def redraw_order(fig: Any) -> list[Any]:
+    """The suffix of ``fig``'s draw order that starts at its first tagged artist.
+
+    Within the axes holding the first tagged artist, the suffix is made of
+    individual children; every figure-level artist drawn after that axes
+    (including whole later axes, e.g. a ``twinx`` partner) is included as a
+    unit. Returns an empty list when nothing is tagged.
+    """
+    from matplotlib.axes import Axes
+
+    tagged = {id(artist) for _tag, artist in iter_tagged(fig)}
+    if not tagged:
+        return []
+
+    children = fig.get_children()
+    children.remove(fig.patch)
+    fig_order = sorted(children, key=lambda artist: artist.get_zorder())
+    for position, unit in enumerate(fig_order):
+        if not isinstance(unit, Axes):
+            continue
+        ax_order = _axes_draw_order(unit)
+        first = next((i for i, child in enumerate(ax_order) if id(child) in tagged), None)
+        if first is not None:
+            return ax_order[first:] + fig_order[position + 1 :]
+    return []
+
+
+def _supported(fig: Any, writer: Any) -> bool:
+    """Whether blitted frames are byte-compatible with ``writer.grab_frame``."""
+    import matplotlib
+    from matplotlib.layout_engine import PlaceHolderLayoutEngine
+
+    canvas = fig.canvas
+    engine = fig.get_layout_engine()
+    rc = matplotlib.rcParams
+    return (
+        hasattr(canvas, "copy_from_bbox")
+        # A real layout engine re-runs on every full draw; the cache would go stale.
+        and (engine is None or isinstance(engine, PlaceHolderLayoutEngine))
+        and writer.frame_format == "rgba"
+        and writer.dpi == fig.dpi
+        and tuple(writer.frame_size) == tuple(canvas.get_width_height())
+        # savefig settings that would make grab_frame differ from a canvas draw.
+        and rc["savefig.bbox"] != "tight"
+        and not rc["savefig.transparent"]
+        and rc["savefig.facecolor"] == "auto"
+        and rc["savefig.edgecolor"] == "auto"
+    )
+
+
+@contextmanager
+def blitting(fig: Any, writer: Any) -> Iterator[BlitRenderer | None]:
+    """Yield a :class:`BlitRenderer` for ``fig``, or ``None`` when unsupported.
+
+    Must be entered inside ``writer.saving(...)`` so the writer's frame size is
+    final. Blitting is skipped when nothing is tagged, when the canvas cannot
+    copy regions, or when the canvas buffer would not match what
+    ``writer.grab_frame`` sends. The figure is restored on exit.
+    """
+    redraw = redraw_order(fig)
+    if not redraw or not _supported(fig, writer):
+        yield None
+        return
+    blit = BlitRenderer(fig, redraw)
+    try:
+        blit.capture_background()
+        yield blit
+    finally:
+        blit.release()
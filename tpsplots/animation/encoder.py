@@ -8,7 +8,9 @@ This module must stay cheap to import: ``matplotlib.animation`` and
 
 from __future__ import annotations
 
+import io
 from collections.abc import Callable
+from contextlib import nullcontext
 from pathlib import Path
 
 from tpsplots.exceptions import RenderingError
@@ -89,6 +91,16 @@ BT709_ARGS: list[str] = [
 ]
 
 
+def frame_count(animator, fps: int) -> int:
+    """Number of frames :func:`write_mp4` grabs for ``animator`` at ``fps``.
+
+    Inclusive endpoint: a frame at t=0 AND one at t~=total_duration. A last
+    frame up to half a frame past the end is harmless — apply_global clamps to
+    the draw duration, so it renders the exact final state.
+    """
+    return round(animator.total_duration * fps) + 1
+
+
 def write_mp4(
     fig,
     animator,
@@ -97,9 +109,16 @@ def write_mp4(
     fps: int,
     quality: str = "high",
     on_frame: Callable[[int, int], None] | None = None,
+    blit: bool = True,
 ) -> Path:
     """Encode ``animator`` on ``fig`` to an MP4 at ``out_path``.
 
+    Runs of identical frames (holds and idle stretches, see
+    :meth:`~tpsplots.animation.animators.base.BaseAnimator.frame_key`) are
+    drawn once and repeated into ffmpeg. With ``blit``, each frame redraws only
+    the animated artists over a cached background
+    (:mod:`tpsplots.animation.blit`).
+
     Args:
         fig: The fully-rendered figure being animated (never resized here —
             ``grab_frame`` re-asserts the figure size every frame).
@@ -109,31 +128,191 @@ def write_mp4(
         fps: Output frame rate.
         quality: Key into :data:`QUALITY_ARGS` (``"high"`` or ``"draft"``).
         on_frame: Optional progress callback ``(current, total)`` per frame.
+        blit: Blit frames when the figure supports it; ``False`` forces a full
+            draw per frame.
+
+    Returns:
+        ``out_path``.
+    """
+    # Use the DEFAULT codec ("h264") — do NOT pass codec="libx264". matplotlib's
+    # automatic even-dimension correction only runs when codec == "h264", and it
+    # maps to libx264 anyway; naming libx264 explicitly disables that safety net.
+    writer = _holding_writer(fps=fps, extra_args=[*BT709_ARGS, *QUALITY_ARGS[quality]])
+    frames = range(frame_count(animator, fps))
+    _grab_frames(writer, fig, animator, out_path, frames, fps=fps, on_frame=on_frame, blit=blit)
+    return out_path
+
+
+# Lossless intermediate for frame shards (see tpsplots.animation.frame_pool).
+# FFV1 stores the grabbed RGB exactly, so the final x264 pass converts the same
+# pixels a serial encode pipes in — the BT.709 conversion happens once, there.
+SEGMENT_CODEC = "ffv1"
+SEGMENT_ARGS: list[str] = ["-pix_fmt", "bgr0"]
+SEGMENT_SUFFIX = ".mkv"
+
+
+def write_segment(
+    fig,
+    animator,
+    out_path: Path,
+    *,
+    fps: int,
+    frames: range,
+    on_frame: Callable[[int, int], None] | None = None,
+    blit: bool = True,
+) -> Path:
+    """Losslessly encode the frames in ``frames`` to a ``.mkv`` segment.
+
+    Frame ``i`` shows wall-clock time ``i / fps``, exactly as in
+    :func:`write_mp4`, so segments for contiguous ranges concatenate into the
+    same frame sequence a serial encode produces.
+
+    Args:
+        fig: The fully-rendered figure being animated.
+        animator: A prepared animator (see :func:`write_mp4`).
+        out_path: Destination segment path; parent dirs are created.
+        fps: Frame rate of the final video.
+        frames: Contiguous, increasing frame indices to render.
+        on_frame: Optional progress callback ``(current, total)`` counted
+            within this segment.
+        blit: See :func:`write_mp4`.
 
     Returns:
         ``out_path``.
     """
+    writer = _holding_writer(fps=fps, codec=SEGMENT_CODEC, extra_args=SEGMENT_ARGS)
+    _grab_frames(writer, fig, animator, out_path, frames, fps=fps, on_frame=on_frame, blit=blit)
+    return out_path
+
+
+def concat_segments(
+    segments: list[Path], out_path: Path, *, fps: int, quality: str = "high"
+) -> Path:
+    """Join lossless segments into one MP4 using the :func:`write_mp4` encode.
+
+    The segments are read back-to-back through ffmpeg's concat demuxer and
+    encoded once with :data:`BT709_ARGS` and :data:`QUALITY_ARGS`, so the result
+    is tagged and compressed exactly like a serial encode.
+
+    Raises:
+        RenderingError: If ffmpeg fails.
+    """
+    import subprocess
+
+    ffmpeg = resolve_ffmpeg()
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    listing = segments[0].parent / "segments.txt"
+    listing.write_text(
+        "".join(f"file '{_concat_quote(segment)}'\n" for segment in segments), encoding="utf-8"
+    )
+    args = [
+        ffmpeg,
+        "-loglevel",
+        "error",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        str(listing),
+        "-r",
+        str(fps),
+        "-vcodec",
+        "h264",
+        *BT709_ARGS,
+        *QUALITY_ARGS[quality],
+        "-y",
+        str(out_path),
+    ]
+    result = subprocess.run(args, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        raise RenderingError(
+            f"ffmpeg failed to join {len(segments)} frame segments into {out_path.name}: "
+            f"{result.stderr.strip()}"
+        )
+    return out_path
+
+
+def _concat_quote(path: Path) -> str:
+    # concat demuxer quoting: close the quote, escape the quote, reopen.
+    return str(path.resolve()).replace("'", "'\\''")
+
+
+def _holding_writer(**kwargs):
+    """An ``FFMpegWriter`` that can send one drawn frame several times.
+
+    Held frames (intro/end holds, idle stretches of the draw phase) are drawn
+    once and their raw buffer is piped to ffmpeg repeatedly, which produces the
+    same video as drawing each of them.
+    """
     # Lazy import: keeps the animation package free of matplotlib.animation at
     # import time (guarded by an import-order test).
     from matplotlib.animation import FFMpegWriter
 
+    class HoldingFFMpegWriter(FFMpegWriter):
+        def grab_held_frame(self, count: int) -> None:
+            """Grab the current frame once and write it ``count`` times."""
+            if count == 1:
+                self.grab_frame()
+                return
+            # Same steps as MovieWriter.grab_frame, but into a reusable buffer.
+            buffer = io.BytesIO()
+            self.fig.set_size_inches(self._w, self._h)
+            self.fig.savefig(buffer, format=self.frame_format, dpi=self.dpi)
+            self.write_frame(buffer.getbuffer(), count)
+
+        def write_frame(self, frame, count: int = 1) -> None:
+            """Pipe an already-rendered raw ``frame_format`` buffer ``count`` times."""
+            for _ in range(count):
+                self._proc.stdin.write(frame)
+
+    return HoldingFFMpegWriter(**kwargs)
+
+
+def frame_runs(animator, frames: range, fps: int) -> list[tuple[int, int]]:
+    """Group ``frames`` into ``(first_frame, count)`` runs of identical frames."""
+    runs: list[tuple[int, int]] = []
+    previous = object()
+    for i in frames:
+        key = animator.frame_key(i / fps)
+        if runs and key == previous:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((i, 1))
+        previous = key
+    return runs
+
+
+def _grab_frames(
+    writer,
+    fig,
+    animator,
+    out_path: Path,
+    frames: range,
+    *,
+    fps: int,
+    on_frame: Callable[[int, int], None] | None,
+    blit: bool,
+) -> None:
     # matplotlib raises FileNotFoundError from saving() if the dir is missing.
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Use the DEFAULT codec ("h264") — do NOT pass codec="libx264". matplotlib's
-    # automatic even-dimension correction only runs when codec == "h264", and it
-    # maps to libx264 anyway; naming libx264 explicitly disables that safety net.
-    writer = FFMpegWriter(fps=fps, extra_args=[*BT709_ARGS, *QUALITY_ARGS[quality]])
-
-    # Inclusive endpoint: a frame at t=0 AND one at t~=total_duration. A last
-    # frame up to half a frame past the end is harmless — apply_global clamps
-    # to the draw duration, so it renders the exact final state.
-    total = round(animator.total_duration * fps)
-    with writer.saving(fig, str(out_path), dpi=fig.dpi):
-        for i in range(total + 1):
-            animator.apply_global(i / fps)
-            writer.grab_frame()
-            if on_frame is not None:
-                on_frame(i + 1, total + 1)
+    from tpsplots.animation.blit import blitting
 
-    return out_path
+    total = len(frames)
+    done = 0
+    with (
+        writer.saving(fig, str(out_path), dpi=fig.dpi),
+        blitting(fig, writer) if blit else nullcontext() as blitter,
+    ):
+        for first, count in frame_runs(animator, frames, fps):
+            animator.apply_global(first / fps)
+            if blitter is None:
+                writer.grab_held_frame(count)
+            else:
+                writer.write_frame(blitter.render(), count)
+            if on_frame is not None:
+                for _ in range(count):
+                    done += 1
+                    on_frame(done, total)
@@ -0,0 +1,305 @@
+"""Process pools for ``tpsplots animate``: frame shards and concurrent formats.
+
+A serial encode draws every frame on one figure in one process. Because
+``BaseAnimator.apply`` is idempotent (state = f(t)), any process that rebuilds
+the same figure and animator can render any frame. :func:`write_mp4_sharded`
+splits a video's frames into contiguous ranges, renders each range in a
+spawned worker to a lossless segment (:func:`~tpsplots.animation.encoder.write_segment`),
+then joins the segments with one x264 pass
+(:func:`~tpsplots.animation.encoder.concat_segments`) using the same BT.709 and
+quality arguments as :func:`~tpsplots.animation.encoder.write_mp4`.
+
+:func:`encode_formats` instead runs each requested video format's whole encode
+(MP4 and poster PNG) in its own worker, so ``--format all`` takes as long as
+the slowest format rather than the sum of all three.
+
+Workers rebuild the scene from an :class:`AnimationScene` — the same recipe the
+renderer uses in-process — so every shard starts from an identical figure.
+Workers are spawned rather than forked for the same reason as the
+``generate --jobs`` pool: no pyplot or font-cache state is inherited.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import queue
+import tempfile
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from tpsplots.animation.config import ResolvedAnimation
+from tpsplots.animation.encoder import (
+    SEGMENT_SUFFIX,
+    concat_segments,
+    resolve_ffmpeg,
+    write_mp4,
+    write_segment,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AnimationScene:
+    """Everything needed to rebuild one video format's prepared animator.
+
+    Picklable as long as the view and its inputs are, so worker processes can
+    rebuild exactly the figure the parent renders.
+    """
+
+    view: Any
+    metadata: Mapping[str, Any]
+    device: str
+    params: Mapping[str, Any]
+    animator_cls: type
+    anim: ResolvedAnimation
+    choreo: Mapping[str, Any]
+    expected_px: tuple[int, int] | None = None
+
+    def build(self) -> tuple[Any, Any]:
+        """Create the figure and return it with its prepared animator.
+
+        The figure is closed again if the animator fails to prepare.
+        """
+        import matplotlib.pyplot as plt
+
+        fig = self.view.create_figure(
+            metadata=deepcopy(dict(self.metadata)), device=self.device, **self.params
+        )
+        try:
+            animator = self.animator_cls(fig, self.anim, self.choreo, expected_px=self.expected_px)
+            animator.prepare()
+        except BaseException:
+            plt.close(fig)
+            raise
+        return fig, animator
+
+
+def shard_frames(frames: int, shards: int) -> list[range]:
+    """Split ``range(frames)`` into at most ``shards`` contiguous ranges.
+
+    Range lengths differ by at most one; empty ranges are never returned.
+    """
+    shards = max(1, min(shards, frames))
+    size, extra = divmod(frames, shards)
+    ranges = []
+    start = 0
+    for index in range(shards):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append(range(start, stop))
+        start = stop
+    return ranges
+
+
+def _init_worker(log_level: int) -> None:
+    logging.basicConfig(level=log_level, format="%(message)s", force=True)
+    logging.getLogger("matplotlib.category").setLevel(logging.WARNING)
+    # rcParams are not inherited by spawned workers; point FFMpegWriter at the
+    # same binary the parent resolved.
+    resolve_ffmpeg()
+
+
+def _render_shard(
+    scene: AnimationScene, frames: range, fps: int, segment_path: Path, progress: Any
+) -> Path:
+    import matplotlib.pyplot as plt
+
+    # Unpickling skips ChartView.__init__, so re-apply the view's style here.
+    scene.view._apply_style()
+    fig, animator = scene.build()
+    try:
+        on_frame = None if progress is None else lambda _current, _total: progress.put(1)
+        return write_segment(fig, animator, segment_path, fps=fps, frames=frames, on_frame=on_frame)
+    finally:
+        plt.close(fig)
+
+
+def write_mp4_sharded(
+    scene: AnimationScene,
+    out_path: Path,
+    *,
+    frames: int,
+    fps: int,
+    quality: str = "high",
+    workers: int = 2,
+    on_frame: Callable[[int, int], None] | None = None,
+) -> Path:
+    """Render ``frames`` frames of ``scene`` in ``workers`` processes into one MP4.
+
+    Args:
+        scene: Recipe for the figure and animator each worker rebuilds.
+        out_path: Destination ``.mp4`` path; parent dirs are created.
+        frames: Total frame count (see :func:`~tpsplots.animation.encoder.frame_count`).
+        fps: Output frame rate.
+        quality: Key into :data:`~tpsplots.animation.encoder.QUALITY_ARGS`.
+        workers: Number of worker processes (one contiguous shard each).
+        on_frame: Optional progress callback with the same contract as
+            :func:`~tpsplots.animation.encoder.write_mp4`: one call per frame,
+            ``current`` counting 1..``frames`` in completion order.
+
+    Returns:
+        ``out_path``.
+    """
+    shards = shard_frames(frames, workers)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    logger.info("Rendering %d frames of %s in %d shards", frames, out_path.name, len(shards))
+
+    context = multiprocessing.get_context("spawn")
+    # Segments live next to the output so the final join reads from the same disk.
+    with (
+        tempfile.TemporaryDirectory(prefix=".frames-", dir=out_path.parent) as tmp,
+        ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(logging.getLogger().level,),
+        ) as pool,
+    ):
+        manager = context.Manager() if on_frame is not None else None
+        try:
+            progress = manager.Queue() if manager is not None else None
+            segments = [Path(tmp) / f"{index:04d}{SEGMENT_SUFFIX}" for index in range(len(shards))]
+            futures = [
+                pool.submit(_render_shard, scene, shard, fps, segment, progress)
+                for shard, segment in zip(shards, segments, strict=True)
+            ]
+            if progress is not None:
+                _relay_progress(progress, futures, frames, on_frame)
+            for future in futures:
+                future.result()
+        finally:
+            if manager is not None:
+                manager.shutdown()
+        return concat_segments(segments, out_path, fps=fps, quality=quality)
+
+
+def _relay_progress(
+    progress: Any, futures: list[Future], frames: int, on_frame: Callable[[int, int], None]
+) -> None:
+    """Forward worker frame ticks to ``on_frame`` until all frames are in.
+
+    Returns early (leaving the caller to surface the error) as soon as a worker
+    fails, or once every worker has finished and no ticks remain.
+    """
+    done = 0
+    while done < frames:
+        try:
+            progress.get(timeout=0.2)
+        except queue.Empty:
+            if any(f.done() and f.exception() is not None for f in futures):
+                return
+            if all(f.done() for f in futures):
+                return
+            continue
+        done += 1
+        on_frame(done, frames)
+
+
+def _encode_format(
+    scene: AnimationScene,
+    fmt: str,
+    mp4_path: Path,
+    poster_path: Path,
+    fps: int,
+    quality: str,
+    progress: Any,
+) -> None:
+    import matplotlib.pyplot as plt
+
+    # Unpickling skips ChartView.__init__, so re-apply the view's style here.
+    scene.view._apply_style()
+    fig, animator = scene.build()
+    try:
+        on_frame = (
+            None if progress is None else lambda current, total: progress.put((fmt, current, total))
+        )
+        write_mp4(fig, animator, mp4_path, fps=fps, quality=quality, on_frame=on_frame)
+        # Restore the exact final state, then save it as the poster frame.
+        animator.finalize()
+        fig.savefig(poster_path)
+    finally:
+        plt.close(fig)
+
+
+def encode_formats(
+    scenes: Mapping[str, AnimationScene],
+    outdir: Path,
+    output_name: str,
+    *,
+    fps: int,
+    quality: str = "high",
+    on_frame: Callable[[int, int, str], None] | None = None,
+) -> list[Path]:
+    """Encode every format in ``scenes`` concurrently, one worker process each.
+
+    Writes the same ``{output_name}_{fmt}.mp4`` and
+    ``{output_name}_{fmt}_poster.png`` files as a serial encode.
+
+    Args:
+        scenes: Format name -> recipe for that format's figure and animator.
+        outdir: Directory for the outputs.
+        output_name: Stem shared by every format's outputs.
+        fps: Output frame rate.
+        quality: Key into :data:`~tpsplots.animation.encoder.QUALITY_ARGS`.
+        on_frame: Optional progress callback ``(current, total, fmt)``. Calls
+            for different formats interleave; per format they follow the
+            :func:`~tpsplots.animation.encoder.write_mp4` contract.
+
+    Returns:
+        The MP4 and poster paths, in ``scenes`` order.
+    """
+    outdir.mkdir(parents=True, exist_ok=True)
+    paths = {
+        fmt: (outdir / f"{output_name}_{fmt}.mp4", outdir / f"{output_name}_{fmt}_poster.png")
+        for fmt in scenes
+    }
+    logger.info("Encoding %s concurrently", ", ".join(scenes))
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=len(scenes),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(logging.getLogger().level,),
+    ) as pool:
+        manager = context.Manager() if on_frame is not None else None
+        try:
+            progress = manager.Queue() if manager is not None else None
+            futures = [
+                pool.submit(_encode_format, scene, fmt, *paths[fmt], fps, quality, progress)
+                for fmt, scene in scenes.items()
+            ]
+            if progress is not None:
+                _relay_format_progress(progress, futures, on_frame)
+            for future in futures:
+                future.result()
+        finally:
+            if manager is not None:
+                manager.shutdown()
+    return [path for pair in paths.values() for path in pair]
+
+
+def _relay_format_progress(
+    progress: Any, futures: list[Future], on_frame: Callable[[int, int, str], None]
+) -> None:
+    """Forward ``(fmt, current, total)`` ticks to ``on_frame`` until workers finish.
+
+    Returns early (leaving the caller to surface the error) as soon as a worker
+    fails. A worker's ticks are all queued before its future completes, so once
+    every future is done an empty queue means nothing is left to relay.
+    """
+    while True:
+        try:
+            fmt, current, total = progress.get(timeout=0.2)
+        except queue.Empty:
+            if any(f.done() and f.exception() is not None for f in futures):
+                return
+            if all(f.done() for f in futures):
+                return
+            continue
+        on_frame(current, total, fmt)
@@ -0,0 +1,74 @@
+"""Fast draft previews of a chart's animation for the editor.
+
+A preview samples the animator's clock at a capped frame rate and collapses
+each run of identical frames (see :meth:`BaseAnimator.frame_key`) into one
+keyframe shown for the whole run, so intro holds, idle gaps and the end hold
+cost one draw each. Keyframes are PNGs that can be shown as soon as they are
+drawn; :func:`write_gif` packs a finished preview into a looping GIF with
+Pillow (a matplotlib dependency), so previews never need ffmpeg.
+
+Like the rest of the package this module must stay cheap to import; Pillow is
+only imported inside :func:`write_gif`.
+"""
+
+from __future__ import annotations
+
+import io
+from collections.abc import Iterator, Sequence
+from typing import Any, NamedTuple
+
+from tpsplots.animation.encoder import frame_count, frame_runs
+
+# Frame-rate ceiling for previews; choreography reads fine at this rate and
+# every skipped frame is a full figure draw saved.
+PREVIEW_MAX_FPS = 12
+
+
+class Keyframe(NamedTuple):
+    """One distinct preview frame and how long it stays on screen."""
+
+    index: int
+    count: int
+    start_ms: int
+    duration_ms: int
+    png: bytes
+
+
+def keyframes(fig: Any, animator: Any, *, fps: int) -> Iterator[Keyframe]:
+    """Draw ``animator``'s distinct frames at ``fps`` as PNG keyframes.
+
+    ``animator`` must be prepared. Keyframe times are rounded to whole
+    milliseconds without drift: each one starts where the previous one ends.
+    """
+    runs = frame_runs(animator, range(frame_count(animator, fps)), fps)
+    for index, (first, count) in enumerate(runs):
+        animator.apply_global(first / fps)
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi="figure")
+        start_ms = round(first * 1000 / fps)
+        yield Keyframe(
+            index=index,
+            count=len(runs),
+            start_ms=start_ms,
+            duration_ms=round((first + count) * 1000 / fps) - start_ms,
+            png=buf.getvalue(),
+        )
+
+
+def write_gif(frames: Sequence[Keyframe]) -> bytes:
+    """Pack ``frames`` into a looping animated GIF."""
+    from PIL import Image
+
+    if not frames:
+        raise ValueError("An animation preview needs at least one frame")
+    images = [Image.open(io.BytesIO(frame.png)).convert("RGB") for frame in frames]
+    buf = io.BytesIO()
+    images[0].save(
+        buf,
+        format="GIF",
+        save_all=True,
+        append_images=images[1:],
+        duration=[frame.duration_ms for frame in frames],
+        loop=0,
+    )
+    return buf.getvalue()
@@ -4,23 +4,30 @@
 config, rejects non-animatable chart types *before* any data fetch, resolves the
 animation settings, then per requested video format builds a fully-rendered
 figure with the matching ``video_*`` device style, drives it through its
-animator, and encodes an MP4 plus a poster PNG of the final frame.
+animator, and encodes an MP4 plus a poster PNG of the final frame. With
+``jobs > 1`` each format's frames are rendered in parallel worker processes;
+with ``parallel_formats`` the formats themselves are encoded concurrently,
+one worker process each (see :mod:`tpsplots.animation.frame_pool`).
 """
 
 from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from copy import deepcopy
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 
 from tpsplots.animation.animators import get_animator
 from tpsplots.animation.config import CHOREOGRAPHY, resolve_animation
-from tpsplots.animation.encoder import resolve_ffmpeg, write_mp4
+from tpsplots.animation.encoder import frame_count, resolve_ffmpeg, write_mp4
+from tpsplots.animation.frame_pool import AnimationScene, encode_formats, write_mp4_sharded
 from tpsplots.models.chart_config import chart_type_v1 as to_v1
+from tpsplots.processors.batch import resolve_jobs
+from tpsplots.processors.resolvers import ResolutionCache
 from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+from tpsplots.views.render_params import RenderParams
+from tpsplots.views.variant_pool import picklable
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +36,10 @@ def animate_yaml(
     yaml_path: Path,
     outdir: Path = Path("charts"),
     on_frame: Callable[[int, int], None] | None = None,
+    on_format_frame: Callable[[int, int, str], None] | None = None,
+    data_cache: ResolutionCache | None = None,
+    jobs: int = 1,
+    parallel_formats: bool = False,
     **cli_overrides,
 ) -> list[Path]:
     """Render animated MP4(s) for one YAML chart config.
@@ -39,7 +50,20 @@ def animate_yaml(
         on_frame: Optional per-frame progress callback ``(current, total)``.
             Contract (load-bearing for progress UIs): ``current`` restarts at 1
             for each requested format's encode, steps by one per frame, and the
-            final call of each encode has ``current == total``.
+            final call of each encode has ``current == total``. When formats
+            encode concurrently their calls interleave; use
+            ``on_format_frame`` to tell them apart.
+        on_format_frame: Optional per-frame progress callback
+            ``(current, total, fmt)`` with the same per-format contract as
+            ``on_frame``, naming the format each frame belongs to.
+        data_cache: Optional batch-scoped resolution cache shared with the
+            other charts of the same run.
+        jobs: Worker processes rendering each video's frames (``0`` = one per
+            CPU). ``1`` renders serially in this process; the parallel path
+            falls back to it when the chart's inputs cannot be pickled.
+        parallel_formats: Encode each requested format in its own worker
+            process instead of one after another. Ignored for a single format
+            or unpicklable inputs; overrides ``jobs``.
         **cli_overrides: Animation overrides (``fps``, ``duration``, ``stagger``,
             ``easing``, ``intro_hold``, ``end_hold``, ``quality``, ``scale``);
             ``None`` values are ignored so YAML settings survive unset flags.
@@ -53,7 +77,7 @@ def animate_yaml(
         UnsupportedChartAnimation: If the chart type has no animator (raised
             before any data source is fetched).
     """
-    processor = YAMLChartProcessor(yaml_path, outdir=outdir)
+    processor = YAMLChartProcessor(yaml_path, outdir=outdir, data_cache=data_cache)
 
     # Reject non-animatable types first (a permanent config error) — before
     # the fixable environment check and long before any data fetch.
@@ -70,7 +94,7 @@ def animate_yaml(
 
     # A YAML figsize/dpi would break the exact video pixel dimensions that the
     # device styles guarantee — strip once (format-independent), with a warning.
-    base_params = deepcopy(ctx.resolved_params)
+    base_params = dict(ctx.resolved_params)
     for key in ("figsize", "dpi"):
         if base_params.pop(key, None) is not None:
             logger.warning(
@@ -80,12 +104,17 @@ def animate_yaml(
                 ctx.output_name,
             )
 
+    # Frozen once and shared by every format's render instead of copied.
+    base_params = RenderParams(base_params)
+
     # draft quality forces <=30fps regardless of the resolved fps.
     fps = anim.fps if anim.quality != "draft" else min(anim.fps, 30)
 
-    outputs: list[Path] = []
+    progress = _format_progress(on_frame, on_format_frame)
+
+    scenes: dict[str, AnimationScene] = {}
     for fmt in anim.formats:
-        params = deepcopy(base_params)
+        params = dict(base_params)
         device = f"video_{fmt}"
         style = view.device_style(device)
         style_dpi = style["dpi"]
@@ -97,13 +126,56 @@ def animate_yaml(
         # no duplicated pixel table.
         expected_px = tuple(round(dim * style_dpi * anim.scale) for dim in style["figsize"])
 
-        fig = view.create_figure(metadata=deepcopy(ctx.resolved_metadata), device=device, **params)
-        try:
-            animator = animator_cls(fig, anim, CHOREOGRAPHY[chart_type_v1], expected_px=expected_px)
-            animator.prepare()
+        scenes[fmt] = AnimationScene(
+            view=view,
+            metadata=ctx.resolved_metadata,
+            device=device,
+            params=params,
+            animator_cls=animator_cls,
+            anim=anim,
+            choreo=CHOREOGRAPHY[chart_type_v1],
+            expected_px=expected_px,
+        )
+
+    if parallel_formats and len(scenes) > 1 and picklable(scenes):
+        if jobs != 1:
+            logger.warning(
+                "--jobs is ignored with --parallel-formats; formats already render in parallel"
+            )
+        return encode_formats(
+            scenes,
+            outdir,
+            ctx.output_name,
+            fps=fps,
+            quality=anim.quality,
+            on_frame=progress,
+        )
 
+    outputs: list[Path] = []
+    for fmt, scene in scenes.items():
+        fig, animator = scene.build()
+        fmt_progress = (
+            None
+            if progress is None
+            else lambda current, total, fmt=fmt: progress(current, total, fmt)
+        )
+        try:
             mp4_path = outdir / f"{ctx.output_name}_{fmt}.mp4"
-            write_mp4(fig, animator, mp4_path, fps=fps, quality=anim.quality, on_frame=on_frame)
+            workers = 1 if jobs == 1 else resolve_jobs(jobs, frame_count(animator, fps))
+            if workers > 1 and picklable(scene):
+                write_mp4_sharded(
+                    scene,
+                    mp4_path,
+                    frames=frame_count(animator, fps),
+                    fps=fps,
+                    quality=anim.quality,
+                    workers=workers,
+                    on_frame=fmt_progress,
+                )
+            else:
+                write_mp4(
+                    fig, animator, mp4_path, fps=fps, quality=anim.quality, on_frame=fmt_progress
+                )
 
             # Restore the exact final state, then save it as the poster frame.
             animator.finalize()
@@ -115,3 +187,20 @@ def animate_yaml(
             plt.close(fig)
 
     return outputs
+
+
+def _format_progress(
+    on_frame: Callable[[int, int], None] | None,
+    on_format_frame: Callable[[int, int, str], None] | None,
+) -> Callable[[int, int, str], None] | None:
+    """Fan each ``(current, total, fmt)`` tick out to both progress callbacks."""
+    if on_frame is None and on_format_frame is None:
+        return None
+
+    def relay(current: int, total: int, fmt: str) -> None:
+        if on_frame is not None:
+            on_frame(current, total)
+        if on_format_frame is not None:
+            on_format_frame(current, total, fmt)
+
+    return relay
@@ -11,7 +11,8 @@ mid-window. Windows deliberately do NOT clamp - callers that drive alpha must
 clamp themselves, since ``set_alpha`` rejects out-of-range values.
 """
 
-from collections.abc import Hashable
+import math
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass
 
 from tpsplots.animation.easing import EasingFn, linear
@@ -101,9 +102,45 @@ class Timeline:
         """Return the :class:`Window` for ``key``, or ``None`` if unknown."""
         return self._windows.get(key)
 
+    def windows(self) -> list[Window]:
+        """Every scheduled window, in insertion order."""
+        return list(self._windows.values())
+
+    def idle_spans(self) -> list[tuple[float, float]]:
+        """The spans where no window of this timeline is in progress.
+
+        See :func:`idle_spans`.
+        """
+        return idle_spans(self._windows.values())
+
     @property
     def duration(self) -> float:
         """The latest end time across all windows; ``0.0`` when empty."""
         if not self._windows:
             return 0.0
         return max(window.end for window in self._windows.values())
+
+
+def idle_spans(windows: Iterable[Window]) -> list[tuple[float, float]]:
+    """Return the half-open spans ``[start, end)`` where no window progresses.
+
+    Every window's progress is constant for all ``t`` inside one span, so
+    frames whose times fall in the same span are identical. Spans cover
+    ``[0, inf)`` outside the windows: the first starts at ``0.0`` (when no
+    window starts at ``0``) and the last ends at ``math.inf``. A zero-duration
+    window splits the span it steps in.
+
+    Args:
+        windows: The windows sharing one clock.
+
+    Returns:
+        Non-empty spans in increasing order.
+    """
+    spans: list[tuple[float, float]] = []
+    cursor = 0.0
+    for window in sorted(windows, key=lambda w: w.start):
+        if window.start > cursor:
+            spans.append((cursor, window.start))
+        cursor = max(cursor, window.end)
+    spans.append((cursor, math.inf))
+    return spans
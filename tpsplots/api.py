@@ -1,10 +1,11 @@
 """Public API for tpsplots package."""
 
 import logging
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from tpsplots.exceptions import ConfigurationError, DataSourceError, RenderingError
+from tpsplots.exceptions import ConfigurationError
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +14,9 @@ def generate(
     *sources: str | Path,
     outdir: str | Path | None = None,
     quiet: bool = False,
+    jobs: int = 1,
+    parallel_variants: bool = False,
+    force: bool = False,
 ) -> dict[str, Any]:
     """
     Generate charts from YAML configuration file(s).
@@ -27,10 +31,21 @@ def generate(
         outdir: Output directory for generated charts. Defaults to 'charts/'
                 relative to the current working directory.
         quiet: If True, suppress progress logging. Errors are still logged.
+        jobs: Number of worker processes to render files in. ``1`` (the
+              default) renders serially in this process; ``0`` uses one
+              worker per CPU.
+        parallel_variants: If True, render each chart's desktop, mobile and
+              social variants in worker processes. Only applies to serial
+              runs (``jobs=1``); a multi-process batch is already parallel.
+        force: If True, re-render every chart. By default charts whose
+              YAML, data, style and tpsplots version match the build
+              manifest in ``outdir`` are skipped and their recorded files
+              reported.
 
     Returns:
         dict: Summary of generation results:
             - 'succeeded': Number of charts successfully generated
+            - 'unchanged': How many of those were skipped as up to date
             - 'failed': Number of charts that failed
             - 'files': List of generated file paths (on success)
             - 'errors': List of error messages (on failure)
@@ -48,6 +63,12 @@ def generate(
 
         >>> # Process all YAML files in a directory
         >>> result = tpsplots.generate("yaml/", outdir="output/")
+
+        >>> # Render a large directory on four cores
+        >>> result = tpsplots.generate("yaml/", jobs=4)
+
+        >>> # Cut the latency of one heavy chart
+        >>> result = tpsplots.generate("yaml/us_map.yaml", parallel_variants=True)
     """
     if not quiet:
         logging.basicConfig(level=logging.INFO, format="%(message)s")
@@ -67,6 +88,7 @@ def generate(
 
     result = {
         "succeeded": 0,
+        "unchanged": 0,
         "failed": 0,
         "files": [],
         "errors": [],
@@ -98,31 +120,41 @@ def generate(
         raise ConfigurationError(f"Source path does not exist: {missing_display}")
 
     # Lazy import to avoid circular import when running yaml_chart_processor as __main__
-    from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
-
-    # Process each YAML file
-    for yaml_file in yaml_files:
-        try:
-            if not quiet:
-                logger.info(f"Processing {yaml_file.name}...")
-
-            processor = YAMLChartProcessor(yaml_file, outdir=output_path)
-            chart_result = processor.generate_chart()
-
+    from tpsplots.processors import yaml_chart_processor
+    from tpsplots.processors.batch import iter_chart_jobs
+    from tpsplots.processors.build_manifest import BuildManifest
+
+    def log_start(yaml_file: Path) -> None:
+        if not quiet:
+            logger.info(f"Processing {yaml_file.name}...")
+
+    processor_cls = yaml_chart_processor.YAMLChartProcessor
+    if parallel_variants:
+        processor_cls = partial(processor_cls, parallel_variants=True)
+
+    for outcome in iter_chart_jobs(
+        yaml_files,
+        output_path,
+        jobs=jobs,
+        processor_cls=processor_cls,
+        log_level=logging.getLogger().level,
+        on_start=log_start,
+        manifest=BuildManifest.load(output_path),
+        force=force,
+    ):
+        if outcome.status in ("ok", "unchanged", "no_output"):
             result["succeeded"] += 1
-            if chart_result and isinstance(chart_result, dict) and "files" in chart_result:
-                result["files"].extend(str(path) for path in chart_result["files"])
-
-        except (ConfigurationError, DataSourceError, RenderingError) as e:
-            result["failed"] += 1
-            error_msg = f"{yaml_file.name}: {e}"
-            result["errors"].append(error_msg)
-            logger.error(error_msg)
-        except Exception as e:
-            result["failed"] += 1
-            error_msg = f"{yaml_file.name}: Unexpected error - {e}"
-            result["errors"].append(error_msg)
-            logger.error(error_msg)
+            result["unchanged"] += outcome.status == "unchanged"
+            result["files"].extend(outcome.files)
+            continue
+
+        result["failed"] += 1
+        if outcome.status == "unexpected":
+            error_msg = f"{outcome.yaml_path.name}: Unexpected error - {outcome.error}"
+        else:
+            error_msg = f"{outcome.yaml_path.name}: {outcome.error}"
+        result["errors"].append(error_msg)
+        logger.error(error_msg)
 
     if not quiet:
         logger.info(f"Complete: {result['succeeded']} succeeded, {result['failed']} failed")
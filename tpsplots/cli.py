@@ -1,10 +1,18 @@
-"""Command-line interface for tpsplots using Typer."""
+"""Command-line interface for tpsplots using Typer.
+
+Only typer and the lightweight command modules are imported at startup;
+processors, models and rendering code are imported inside the commands that
+use them, so ``tpsplots --version`` and ``--help`` return immediately.
+"""
+
+from __future__ import annotations
 
 import logging
 import sys
-import traceback
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
@@ -14,10 +22,13 @@ from tpsplots.commands.docs import docs
 from tpsplots.commands.editor import editor
 from tpsplots.commands.s3_sync import s3_sync
 from tpsplots.commands.textedit import textedit
-from tpsplots.exceptions import ConfigurationError, DataSourceError, RenderingError
-from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+from tpsplots.exceptions import ConfigurationError, DataSourceError
 from tpsplots.schema import get_chart_types
-from tpsplots.templates import get_available_templates, get_template
+
+if TYPE_CHECKING:
+    from tpsplots.processors.batch import ChartPool
+    from tpsplots.processors.resolvers.resolution_cache import ResolutionCache
+    from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
 
 app = typer.Typer(
     name="tpsplots",
@@ -75,6 +86,9 @@ def emit_generate_status(
     if status == "ok":
         typer.secho(f"{prefix}  OK", fg=typer.colors.GREEN)
         return
+    if status == "skip":
+        typer.secho(f"{prefix}  SKIP: unchanged", fg=typer.colors.BRIGHT_BLACK)
+        return
     if status == "warn":
         suffix = f" WARN: {detail}" if detail else " WARN"
         typer.secho(f"{prefix}{suffix}", fg=typer.colors.YELLOW)
@@ -89,6 +103,7 @@ def emit_generate_summary(
     success_count: int,
     failure_count: int,
     config_error_count: int,
+    unchanged_count: int = 0,
     failure_details: list[str],
     verbose: bool,
     quiet: bool,
@@ -98,19 +113,22 @@ def emit_generate_summary(
     if quiet:
         return
 
+    succeeded = f"{success_count} succeeded"
+    if unchanged_count:
+        succeeded += f" ({unchanged_count} unchanged)"
+
     if verbose:
-        logger.info(f"Complete: {success_count} succeeded, {failure_count} failed")
+        logger.info(f"Complete: {succeeded}, {failure_count} failed")
         if config_error_count:
             logger.info(f"Configuration errors: {config_error_count}")
         return
 
     if config_error_count:
         summary = (
-            f"Summary: {success_count} succeeded, {failure_count} failed, "
-            f"{config_error_count} config errors"
+            f"Summary: {succeeded}, {failure_count} failed, {config_error_count} config errors"
         )
     else:
-        summary = f"Summary: {success_count} succeeded, {failure_count} failed"
+        summary = f"Summary: {succeeded}, {failure_count} failed"
 
     summary_color = (
         typer.colors.GREEN if failure_count == 0 and config_error_count == 0 else typer.colors.RED
@@ -125,6 +143,8 @@ def emit_generate_summary(
 
 def validate_yaml(yaml_path: Path) -> bool:
     """Validate a YAML configuration without generating charts."""
+    from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+
     try:
         YAMLChartProcessor(yaml_path)
         print(f"Valid: {yaml_path.name}")
@@ -204,6 +224,8 @@ def list_types_callback(value: bool) -> None:
 def new_callback(chart_type: str | None) -> None:
     """Generate template and exit."""
     if chart_type:
+        from tpsplots.templates import get_available_templates, get_template
+
         try:
             template = get_template(chart_type)
             print(template)
@@ -258,6 +280,143 @@ def main(
     pass
 
 
+def run_generate_batch(
+    yaml_files: list[Path],
+    *,
+    outdir: Path,
+    jobs: int,
+    processor_cls: Callable[..., YAMLChartProcessor],
+    force: bool,
+    verbose: bool,
+    quiet: bool,
+    logger: logging.Logger,
+    data_cache: ResolutionCache | None = None,
+    pool: ChartPool | None = None,
+) -> tuple[int, int]:
+    """Render ``yaml_files`` with per-file status output and a summary.
+
+    ``data_cache`` and ``pool`` are kept by ``--watch`` across rebuilds so
+    resolved data and warm worker processes carry over.
+
+    Returns:
+        The number of failed files and the number of configuration errors.
+    """
+    success_count = 0
+    unchanged_count = 0
+    failure_count = 0
+    config_error_count = 0
+    failure_details: list[str] = []
+    from tpsplots.data_sources.http_cache import CacheStats
+    from tpsplots.processors.batch import iter_chart_jobs
+    from tpsplots.processors.build_manifest import BuildManifest
+
+    http_stats = CacheStats()
+
+    emit_generate_start(len(yaml_files), verbose=verbose, quiet=quiet, logger=logger)
+
+    for index, outcome in enumerate(
+        iter_chart_jobs(
+            yaml_files,
+            outdir,
+            jobs=jobs,
+            processor_cls=processor_cls,
+            log_level=logging.getLogger().level,
+            data_cache=data_cache,
+            manifest=BuildManifest.load(outdir),
+            force=force,
+            pool=pool,
+        ),
+        start=1,
+    ):
+        yaml_name = outcome.yaml_path.name
+        if outcome.http_stats is not None:
+            http_stats += outcome.http_stats
+
+        if outcome.status == "ok":
+            if verbose and not quiet:
+                logger.info(f"Generated chart from {yaml_name}")
+            elif not verbose:
+                emit_generate_status(index, len(yaml_files), yaml_name, "ok", quiet=quiet)
+            success_count += 1
+            continue
+
+        if outcome.status == "unchanged":
+            if verbose and not quiet:
+                logger.info(f"Unchanged, skipped {yaml_name}")
+            elif not verbose:
+                emit_generate_status(index, len(yaml_files), yaml_name, "skip", quiet=quiet)
+            success_count += 1
+            unchanged_count += 1
+            continue
+
+        if outcome.status == "no_output":
+            if verbose and not quiet:
+                logger.warning(f"No output from {yaml_name}")
+            elif not verbose:
+                emit_generate_status(
+                    index,
+                    len(yaml_files),
+                    yaml_name,
+                    "warn",
+                    detail="no output produced",
+                    quiet=quiet,
+                )
+            failure_count += 1
+            failure_details.append(f"{yaml_name}: no output produced")
+            continue
+
+        error = outcome.error
+        if outcome.status == "config_error":
+            if verbose:
+                logger.error(f"Config error: {yaml_name} - {error}")
+            else:
+                emit_generate_status(
+                    index, len(yaml_files), yaml_name, "fail", detail=error, quiet=quiet
+                )
+            config_error_count += 1
+            failure_details.append(f"{yaml_name}: config error - {error}")
+        elif outcome.status == "error":
+            if verbose:
+                logger.error(f"Failed: {yaml_name} - {error}")
+            else:
+                emit_generate_status(
+                    index, len(yaml_files), yaml_name, "fail", detail=error, quiet=quiet
+                )
+            failure_count += 1
+            failure_details.append(f"{yaml_name}: {error}")
+        else:
+            if verbose:
+                logger.error(f"Unexpected error: {yaml_name} - {error}")
+            else:
+                emit_generate_status(
+                    index,
+                    len(yaml_files),
+                    yaml_name,
+                    "fail",
+                    detail=f"unexpected error: {error}",
+                    quiet=quiet,
+                )
+            failure_count += 1
+            failure_details.append(f"{yaml_name}: unexpected error - {error}")
+
+        if verbose and outcome.traceback:
+            sys.stderr.write(outcome.traceback)
+
+    emit_generate_summary(
+        success_count=success_count,
+        unchanged_count=unchanged_count,
+        failure_count=failure_count,
+        config_error_count=config_error_count,
+        failure_details=failure_details,
+        verbose=verbose,
+        quiet=quiet,
+        logger=logger,
+    )
+    if verbose and http_stats:
+        logger.info(http_stats.summary())
+    return failure_count, config_error_count
+
+
 @app.command("generate")
 def generate(
     inputs: Annotated[
@@ -276,9 +435,55 @@ def generate(
         bool,
         typer.Option("--verbose", help="Enable verbose/debug logging"),
     ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Render files in N worker processes (0 = one per CPU)",
+        ),
+    ] = 1,
+    force: Annotated[
+        bool,
+        typer.Option(
+            "--force", "-f", help="Re-render every chart, even if its inputs are unchanged"
+        ),
+    ] = False,
+    watch: Annotated[
+        bool,
+        typer.Option(
+            "--watch",
+            "-w",
+            help="Keep running and re-render charts whose YAML or local data files change",
+        ),
+    ] = False,
+    parallel_variants: Annotated[
+        bool,
+        typer.Option(
+            "--parallel-variants",
+            help="Render each chart's desktop/mobile/social variants in parallel processes",
+        ),
+    ] = False,
+    offline: Annotated[
+        bool,
+        typer.Option("--offline", help="Use only cached copies of remote data (no network)"),
+    ] = False,
+    cache_ttl: Annotated[
+        float | None,
+        typer.Option(
+            "--cache-ttl",
+            min=0,
+            help="Reuse cached remote data younger than this many seconds without revalidating",
+        ),
+    ] = None,
 ) -> None:
     """Generate charts from YAML configuration files.
 
+    Charts whose YAML, data, style and tpsplots version are unchanged since
+    the last run into the same output directory are skipped; use --force to
+    re-render them.
+
     Examples:
 
         tpsplots generate chart.yaml                    Generate a single chart
@@ -288,11 +493,35 @@ def generate(
         tpsplots generate yaml/                         Process all YAML files in directory
 
         tpsplots generate --outdir output/ yaml/        Specify output directory
+
+        tpsplots generate --jobs 4 yaml/                Render four files at a time
+
+        tpsplots generate --force yaml/                 Re-render even unchanged charts
+
+        tpsplots generate --parallel-variants map.yaml  Render one chart's variants in parallel
+
+        tpsplots generate --offline yaml/               Render from cached remote data only
+
+        tpsplots generate --watch yaml/                 Re-render charts as their inputs change
     """
+    from tpsplots.data_sources.http_cache import configure_http_cache
+    from tpsplots.processors.batch import ChartPool, resolve_jobs
+    from tpsplots.processors.resolvers.resolution_cache import ResolutionCache
+    from tpsplots.processors.watch import watch_charts
+    from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+
     # Setup logging
     setup_logging(verbose=verbose, quiet=quiet)
     logger = logging.getLogger(__name__)
 
+    http_settings: dict = {}
+    if offline:
+        http_settings["offline"] = True
+    if cache_ttl is not None:
+        http_settings["ttl"] = cache_ttl
+    if http_settings:
+        configure_http_cache(**http_settings)
+
     # Collect all YAML files from inputs
     yaml_files, input_errors = collect_yaml_files(inputs)
 
@@ -305,108 +534,60 @@ def generate(
         logger.error("No YAML files found to process")
         raise typer.Exit(code=2)
 
-    # Generate charts
-    success_count = 0
-    failure_count = 0
-    config_error_count = 0
-    failure_details: list[str] = []
-
     # Create output directory if it doesn't exist
     outdir.mkdir(parents=True, exist_ok=True)
 
-    emit_generate_start(len(yaml_files), verbose=verbose, quiet=quiet, logger=logger)
-
-    for index, yaml_file in enumerate(yaml_files, start=1):
-        try:
-            processor = YAMLChartProcessor(yaml_file, outdir=outdir)
-            result = processor.generate_chart()
-
-            if result:
-                if verbose and not quiet:
-                    logger.info(f"Generated chart from {yaml_file.name}")
-                elif not verbose:
-                    emit_generate_status(
-                        index,
-                        len(yaml_files),
-                        yaml_file.name,
-                        "ok",
-                        quiet=quiet,
-                    )
-                success_count += 1
-            else:
-                if verbose and not quiet:
-                    logger.warning(f"No output from {yaml_file.name}")
-                elif not verbose:
-                    emit_generate_status(
-                        index,
-                        len(yaml_files),
-                        yaml_file.name,
-                        "warn",
-                        detail="no output produced",
-                        quiet=quiet,
-                    )
-                failure_count += 1
-                failure_details.append(f"{yaml_file.name}: no output produced")
-
-        except ConfigurationError as e:
-            if verbose:
-                logger.error(f"Config error: {yaml_file.name} - {e}")
-            else:
-                emit_generate_status(
-                    index,
-                    len(yaml_files),
-                    yaml_file.name,
-                    "fail",
-                    detail=str(e),
-                    quiet=quiet,
-                )
-            config_error_count += 1
-            failure_details.append(f"{yaml_file.name}: config error - {e}")
-            if verbose:
-                traceback.print_exc()
-        except (DataSourceError, RenderingError) as e:
-            if verbose:
-                logger.error(f"Failed: {yaml_file.name} - {e}")
-            else:
-                emit_generate_status(
-                    index,
-                    len(yaml_files),
-                    yaml_file.name,
-                    "fail",
-                    detail=str(e),
-                    quiet=quiet,
-                )
-            failure_count += 1
-            failure_details.append(f"{yaml_file.name}: {e}")
-            if verbose:
-                traceback.print_exc()
-        except Exception as e:
-            if verbose:
-                logger.error(f"Unexpected error: {yaml_file.name} - {e}")
-            else:
-                emit_generate_status(
-                    index,
-                    len(yaml_files),
-                    yaml_file.name,
-                    "fail",
-                    detail=f"unexpected error: {e}",
-                    quiet=quiet,
-                )
-            failure_count += 1
-            failure_details.append(f"{yaml_file.name}: unexpected error - {e}")
-            if verbose:
-                traceback.print_exc()
-
-    emit_generate_summary(
-        success_count=success_count,
-        failure_count=failure_count,
-        config_error_count=config_error_count,
-        failure_details=failure_details,
+    processor_cls = YAMLChartProcessor
+    if parallel_variants:
+        if resolve_jobs(jobs, len(yaml_files)) > 1:
+            logger.warning(
+                "--parallel-variants is ignored with --jobs; files already render in parallel"
+            )
+        processor_cls = partial(YAMLChartProcessor, parallel_variants=True)
+
+    # Watch mode keeps one resolution cache and one worker pool for the whole
+    # session; changed data files are evicted from both before each rebuild.
+    data_cache = ResolutionCache()
+    pool = None
+    workers = resolve_jobs(jobs, len(yaml_files))
+    if watch and workers > 1:
+        pool = ChartPool(workers, logging.getLogger().level)
+
+    run_batch = partial(
+        run_generate_batch,
+        outdir=outdir,
+        jobs=jobs,
+        processor_cls=processor_cls,
+        force=force,
         verbose=verbose,
         quiet=quiet,
         logger=logger,
+        data_cache=data_cache,
+        pool=pool,
     )
 
+    def invalidate(paths: set[Path]) -> None:
+        data_cache.invalidate_files(paths)
+        if pool is not None:
+            pool.invalidate(paths)
+
+    try:
+        failure_count, config_error_count = run_batch(yaml_files)
+
+        if watch:
+            if not quiet:
+                typer.secho("Watching for changes (Ctrl-C to stop)", fg=typer.colors.CYAN)
+            watch_charts(
+                lambda: collect_yaml_files(inputs)[0],
+                run_batch,
+                input_dirs=[path for path in inputs if path.is_dir()],
+                invalidate=invalidate,
+            )
+            return
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
     if config_error_count > 0:
         raise typer.Exit(code=2)
     if failure_count > 0:
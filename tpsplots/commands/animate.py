@@ -10,6 +10,7 @@ chart types report a clear "not animatable" failure and the batch continues.
 from __future__ import annotations
 
 import logging
+import sys
 import traceback
 from pathlib import Path
 from typing import Annotated, Any
@@ -18,12 +19,22 @@ import typer
 
 from tpsplots.animation.animators import UnsupportedChartAnimation
 from tpsplots.animation.encoder import FFmpegUnavailableError, resolve_ffmpeg
-from tpsplots.animation.renderer import animate_yaml
 from tpsplots.exceptions import ConfigurationError, TPSPlotsError
 
 logger = logging.getLogger(__name__)
 
 
+def animate_yaml(*args: Any, **kwargs: Any) -> Any:
+    """Call :func:`tpsplots.animation.renderer.animate_yaml`.
+
+    The renderer pulls in pyplot, pandas and the chart views, so it is only
+    imported once a chart is actually animated.
+    """
+    from tpsplots.animation.renderer import animate_yaml as render
+
+    return render(*args, **kwargs)
+
+
 class _EncodeProgress:
     """Lazily-created per-encode progress bar driven by ``on_frame``.
 
@@ -31,10 +42,17 @@ class _EncodeProgress:
     requested video format and steps by one per frame, so a bar is opened on
     each ``current == 1`` and closed when the encode completes. Bars are
     created on the first frame because ``total`` is only known then.
+
+    Concurrent format encodes report through :meth:`format_frame` instead
+    (``animate_yaml``'s ``on_format_frame``); those are drawn as one line
+    holding a bar per format.
     """
 
+    BAR_WIDTH = 20
+
     def __init__(self) -> None:
         self._bar: Any = None
+        self._formats: dict[str, tuple[int, int]] = {}
 
     def __call__(self, current: int, total: int) -> None:
         if self._bar is None or current == 1:
@@ -45,10 +63,35 @@ class _EncodeProgress:
         if current >= total:
             self.close()
 
+    def format_frame(self, current: int, total: int, fmt: str) -> None:
+        previous = self._formats.get(fmt)
+        self._formats[fmt] = (current, total)
+        if not sys.stdout.isatty():
+            # Like click's progressbar: no redraws off a terminal, one label each.
+            if previous is None:
+                typer.echo(f"  encoding {fmt}")
+            return
+        # Redraw only when a bar visibly moves; frames arrive far faster.
+        if previous is not None and self._filled(*previous) == self._filled(current, total):
+            return
+        bars = "  ".join(
+            f"{name} [{'#' * (filled := self._filled(done, length))}"
+            f"{'-' * (self.BAR_WIDTH - filled)}] {done * 100 // length:3d}%"
+            for name, (done, length) in self._formats.items()
+        )
+        typer.echo(f"\r  encoding  {bars}", nl=False)
+
+    def _filled(self, current: int, total: int) -> int:
+        return self.BAR_WIDTH * current // total
+
     def close(self) -> None:
         if self._bar is not None:
             self._bar.__exit__(None, None, None)
             self._bar = None
+        if self._formats:
+            if sys.stdout.isatty():
+                typer.echo()
+            self._formats = {}
 
 
 def animate(
@@ -91,6 +134,22 @@ def animate(
             help="Super-sample factor for higher-res encodes (e.g. 2 -> 4K landscape)",
         ),
     ] = None,
+    jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            min=0,
+            help="Render each video's frames in N worker processes (0 = one per CPU)",
+        ),
+    ] = 1,
+    parallel_formats: Annotated[
+        bool,
+        typer.Option(
+            "--parallel-formats",
+            help="Encode each requested video format in its own process",
+        ),
+    ] = False,
     quiet: Annotated[
         bool,
         typer.Option("--quiet", "-q", help="Suppress progress output (errors still shown)"),
@@ -125,6 +184,10 @@ def animate(
         tpsplots animate --format all yaml/chart.yaml   Square, landscape, and portrait
 
         tpsplots animate --scale 2 --format landscape chart.yaml   4K landscape for YouTube
+
+        tpsplots animate --jobs 0 chart.yaml            Render frames on every CPU core
+
+        tpsplots animate --format all --parallel-formats chart.yaml   Encode formats concurrently
     """
     # Lazy import: cli.py imports this module at load time, so importing these
     # from tpsplots.cli at module scope would be a circular import.
@@ -177,6 +240,10 @@ def animate(
     failure_count = 0
     config_error_count = 0
     failure_details: list[str] = []
+    from tpsplots.processors.resolvers import ResolutionCache
+
+    # Charts in one run that share a data section resolve it only once.
+    data_cache = ResolutionCache()
 
     for index, yaml_file in enumerate(yaml_files, start=1):
         if not quiet:
@@ -187,7 +254,11 @@ def animate(
             outputs = animate_yaml(
                 yaml_file,
                 outdir=outdir,
-                on_frame=None if quiet else progress,
+                on_frame=None if quiet or parallel_formats else progress,
+                on_format_frame=progress.format_frame if parallel_formats and not quiet else None,
+                data_cache=data_cache,
+                jobs=jobs,
+                parallel_formats=parallel_formats,
                 **overrides,
             )
         except ConfigurationError as exc:
@@ -5,9 +5,6 @@ from typing import Annotated
 
 import typer
 
-from tpsplots.docs_generator import generate_all
-from tpsplots.models.charts import CONFIG_REGISTRY
-
 
 def docs(
     output_dir: Annotated[
@@ -31,6 +28,9 @@ def docs(
 
         tpsplots docs --chart-type bar             Single chart type only
     """
+    from tpsplots.docs_generator import generate_all
+    from tpsplots.models.charts import CONFIG_REGISTRY
+
     if chart_type and chart_type not in CONFIG_REGISTRY:
         available = ", ".join(sorted(CONFIG_REGISTRY.keys()))
         typer.secho(
@@ -37,7 +37,13 @@ def _pick_available_port(host: str, preferred_port: int) -> int:
 
 
 def start_editor_server(
-    yaml_dir: Path, host: str, port: int, open_browser: bool, outdir: Path | None = None
+    yaml_dir: Path,
+    host: str,
+    port: int,
+    open_browser: bool,
+    outdir: Path | None = None,
+    cache_max_mb: float | None = None,
+    url_ttl: float | None = None,
 ) -> None:
     """Launch the chart editor web app."""
     try:
@@ -57,7 +63,10 @@ def start_editor_server(
             host,
         )
 
-    session = EditorSession(yaml_dir=yaml_dir, outdir=outdir)
+    cache_kwargs = {"url_ttl": url_ttl}
+    if cache_max_mb is not None:
+        cache_kwargs["cache_max_bytes"] = int(cache_max_mb * 1024 * 1024)
+    session = EditorSession(yaml_dir=yaml_dir, outdir=outdir, **cache_kwargs)
     selected_port = _pick_available_port(host, port)
     app = create_editor_app(session)
     url = f"http://{host}:{selected_port}/"
@@ -100,6 +109,24 @@ def editor(
             help="Automatically open the editor URL in your browser",
         ),
     ] = True,
+    cache_mb: Annotated[
+        float | None,
+        typer.Option(
+            "--cache-mb",
+            min=1,
+            help="Memory budget (MiB) for each of the editor's data and profile caches, "
+            "split between the editor and its preview workers (default: 256)",
+        ),
+    ] = None,
+    url_ttl: Annotated[
+        float | None,
+        typer.Option(
+            "--url-ttl",
+            min=0,
+            help="Seconds before a cached URL data source is fetched again "
+            "(default: until Refresh Data)",
+        ),
+    ] = None,
 ) -> None:
     """Launch the interactive chart editor."""
     try:
@@ -108,6 +135,8 @@ def editor(
             host=host,
             port=port,
             open_browser=open_browser,
+            cache_max_mb=cache_mb,
+            url_ttl=url_ttl,
         )
     except OSError as exc:
         typer.echo(f"Failed to bind editor server: {exc}", err=True)
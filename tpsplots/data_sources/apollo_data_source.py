@@ -30,9 +30,7 @@ import logging
 from functools import cached_property
 from typing import ClassVar
 
-import certifi
 import pandas as pd
-import requests
 
 from tpsplots.data_sources.nasa_budget_data_source import NASABudget
 from tpsplots.data_sources.truncate_rows_mixin import TruncateRowsMixin
@@ -131,9 +129,8 @@ class ApolloSpending(_ApolloBase):
         becomes meaningless comma-separated values in the CSV export.  The
         real column headers are in row 2.
         """
-        response = requests.get(self._csv_source, timeout=30, verify=certifi.where())
-        response.raise_for_status()
-        return pd.read_csv(io.StringIO(response.text), skiprows=1)
+        text = self._fetch_url_content(self._csv_source)
+        return pd.read_csv(io.StringIO(text), skiprows=1)
 
 
 class RoboticLunarProgramSpending(_ApolloBase):
@@ -63,8 +63,8 @@ import io
 import logging
 
 import pandas as pd
-import requests
 
+from tpsplots.data_sources.http_cache import fetch_text
 from tpsplots.data_sources.tabular_data_source import TabularDataSource
 
 logger = logging.getLogger(__name__)
@@ -139,7 +139,7 @@ class GoogleSheetsSource(TabularDataSource):
     @staticmethod
     def _fetch_csv_content(url: str) -> str:
         """
-        Fetch CSV content from URL.
+        Fetch CSV content from URL through the shared HTTP cache.
 
         Args:
             url: The URL to fetch.
@@ -147,6 +147,4 @@ class GoogleSheetsSource(TabularDataSource):
         Returns:
             The CSV content as a string.
         """
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        return response.text
+        return fetch_text(url)
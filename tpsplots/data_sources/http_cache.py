@@ -0,0 +1,311 @@
+"""Shared HTTP fetch layer with a persistent on-disk cache.
+
+Every remote CSV source (Google Sheets exports, the NASA budget sheets, the
+Apollo tables, the NNSI and FRED inflation indexes) fetches through
+:func:`fetch_text`. Responses are stored under the cache directory, one body
+file plus one JSON metadata file per URL, and reused across CLI invocations:
+
+* Within ``ttl`` seconds of the last fetch an entry is served without any
+  network traffic. The default TTL of ``0`` always revalidates, so results are
+  exactly as fresh as an uncached fetch.
+* Past the TTL the entry is revalidated with ``If-None-Match`` /
+  ``If-Modified-Since``; a ``304 Not Modified`` reuses the stored body.
+* If the server cannot be reached (connection error or timeout) and a cached
+  copy exists, the stale copy is served with a warning instead of failing the
+  chart. An HTTP error status is never masked this way.
+* In offline mode only the cache is consulted; a miss raises
+  :class:`~tpsplots.exceptions.DataSourceError`.
+
+All fetches share one pooled :class:`requests.Session`, so repeated requests
+to ``docs.google.com`` reuse the same TLS connection.
+
+Settings come from :func:`configure_http_cache` or, by default, from the
+``TPSPLOTS_CACHE_DIR``, ``TPSPLOTS_HTTP_CACHE_TTL`` and ``TPSPLOTS_OFFLINE``
+environment variables.
+
+Example:
+    >>> from tpsplots.data_sources.http_cache import configure_http_cache, fetch_text
+    >>> configure_http_cache(ttl=600)
+    >>> csv_text = fetch_text("https://docs.google.com/spreadsheets/d/.../export?format=csv")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from tpsplots.exceptions import DataSourceError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory from the environment or the XDG default."""
+    if configured := os.environ.get("TPSPLOTS_CACHE_DIR"):
+        return Path(configured).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "tpsplots" / "http"
+
+
+@dataclass
+class CacheStats:
+    """Counters for one :class:`HTTPCache` (or a delta between snapshots)."""
+
+    hits: int = 0
+    revalidated: int = 0
+    misses: int = 0
+    stale: int = 0
+
+    def __sub__(self, other: CacheStats) -> CacheStats:
+        return CacheStats(
+            hits=self.hits - other.hits,
+            revalidated=self.revalidated - other.revalidated,
+            misses=self.misses - other.misses,
+            stale=self.stale - other.stale,
+        )
+
+    def __add__(self, other: CacheStats) -> CacheStats:
+        return CacheStats(
+            hits=self.hits + other.hits,
+            revalidated=self.revalidated + other.revalidated,
+            misses=self.misses + other.misses,
+            stale=self.stale + other.stale,
+        )
+
+    def __bool__(self) -> bool:
+        return any(asdict(self).values())
+
+    def summary(self) -> str:
+        """One-line description for verbose CLI output."""
+        return (
+            f"HTTP cache: {self.hits} hits, {self.revalidated} revalidated, "
+            f"{self.misses} misses, {self.stale} stale"
+        )
+
+
+class HTTPCache:
+    """Persistent, revalidating cache for remote CSV text.
+
+    Args:
+        cache_dir: Directory for cached bodies and metadata.
+        ttl: Seconds an entry is served without revalidation (``None`` =
+            forever, ``0`` = always revalidate).
+        offline: Serve only from the cache and never touch the network.
+        enabled: When False, fetch directly (the session is still pooled).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        *,
+        ttl: float | None = 0,
+        offline: bool = False,
+        enabled: bool = True,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+        self.ttl = ttl
+        self.offline = offline
+        self.enabled = enabled
+        self.stats = CacheStats()
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The pooled session shared by every fetch through this cache."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = requests.Session()
+        return self._session
+
+    def settings(self) -> dict[str, Any]:
+        """Constructor arguments that recreate this cache (e.g. in a worker)."""
+        return {
+            "cache_dir": str(self.cache_dir),
+            "ttl": self.ttl,
+            "offline": self.offline,
+            "enabled": self.enabled,
+        }
+
+    def fetch_text(
+        self,
+        url: str,
+        *,
+        verify: bool | str = True,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> str:
+        """Return the decoded body of ``url``, using the cache when possible.
+
+        Raises:
+            DataSourceError: In offline mode when ``url`` is not cached, or
+                when the server answers with an HTTP error although a cached
+                copy exists (only connection errors and timeouts fall back to
+                the cached copy).
+            requests.exceptions.RequestException: When the fetch fails and no
+                cached copy exists.
+        """
+        if not self.enabled and not self.offline:
+            self.stats.misses += 1
+            response = self.session.get(url, timeout=timeout, verify=verify)
+            response.raise_for_status()
+            return response.text
+
+        body_path, meta_path = self._entry_paths(url)
+        meta = self._read_meta(meta_path) if body_path.is_file() else None
+
+        if self.offline:
+            if meta is None:
+                raise DataSourceError(
+                    f"Offline mode: {url} is not in the HTTP cache ({self.cache_dir})"
+                )
+            self.stats.hits += 1
+            return body_path.read_text(encoding="utf-8")
+
+        if meta is not None and self._is_fresh(meta):
+            self.stats.hits += 1
+            logger.debug("HTTP cache hit: %s", url)
+            return body_path.read_text(encoding="utf-8")
+
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self.session.get(url, headers=headers, timeout=timeout, verify=verify)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+            # Only an unreachable server falls back to the cached copy.
+            if meta is None:
+                raise
+            self.stats.stale += 1
+            logger.warning("Fetching %s failed (%s); using cached copy", url, exc)
+            return body_path.read_text(encoding="utf-8")
+
+        if response.status_code == 304 and meta is not None:
+            self.stats.revalidated += 1
+            logger.debug("HTTP cache revalidated: %s", url)
+            self._write_meta(meta_path, {**meta, "fetched_at": time.time()})
+            return body_path.read_text(encoding="utf-8")
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as exc:
+            if meta is None:
+                raise
+            # The server answered: the source moved, vanished or lost its
+            # permissions, so rendering the old copy would hide that.
+            raise DataSourceError(
+                f"Fetching {url} failed ({exc}); the cached copy is not used "
+                "because the server rejected the request"
+            ) from exc
+
+        self.stats.misses += 1
+        logger.debug("HTTP cache miss: %s", url)
+        text = response.text
+        self._store(
+            body_path,
+            meta_path,
+            text,
+            {
+                "url": url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            },
+        )
+        return text
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        if not self.cache_dir.is_dir():
+            return
+        for path in self.cache_dir.iterdir():
+            if path.suffix in (".body", ".json"):
+                path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Storage helpers
+    # ------------------------------------------------------------------
+
+    def _entry_paths(self, url: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.body", self.cache_dir / f"{digest}.json"
+
+    def _is_fresh(self, meta: dict[str, Any]) -> bool:
+        if self.ttl is None:
+            return True
+        return time.time() - float(meta.get("fetched_at", 0)) < self.ttl
+
+    @staticmethod
+    def _read_meta(meta_path: Path) -> dict[str, Any] | None:
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, body_path: Path, meta_path: Path, text: str, meta: dict[str, Any]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write(body_path, text)
+            self._write_meta(meta_path, meta)
+        except OSError as exc:
+            # An unwritable cache must never fail the chart itself.
+            logger.warning("Could not write HTTP cache entry in %s: %s", self.cache_dir, exc)
+
+    @staticmethod
+    def _write_meta(meta_path: Path, meta: dict[str, Any]) -> None:
+        try:
+            _atomic_write(meta_path, json.dumps(meta))
+        except OSError as exc:
+            logger.warning("Could not update HTTP cache metadata %s: %s", meta_path, exc)
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    """Write via a temp file + rename so concurrent workers never read halves."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    tmp.replace(path)
+
+
+_http_cache: HTTPCache | None = None
+
+
+def get_http_cache() -> HTTPCache:
+    """Return the process-wide cache, creating it from the environment."""
+    global _http_cache
+    if _http_cache is None:
+        ttl_env = os.environ.get("TPSPLOTS_HTTP_CACHE_TTL")
+        _http_cache = HTTPCache(
+            ttl=float(ttl_env) if ttl_env else 0,
+            offline=os.environ.get("TPSPLOTS_OFFLINE", "").lower() in ("1", "true", "yes"),
+        )
+    return _http_cache
+
+
+def configure_http_cache(**settings: Any) -> HTTPCache:
+    """Replace the process-wide cache; accepts :class:`HTTPCache` arguments.
+
+    Settings not passed keep their current values.
+    """
+    global _http_cache
+    current = get_http_cache().settings()
+    _http_cache = HTTPCache(**{**current, **settings})
+    return _http_cache
+
+
+def fetch_text(url: str, **kwargs: Any) -> str:
+    """Fetch ``url`` through the process-wide :class:`HTTPCache`."""
+    return get_http_cache().fetch_text(url, **kwargs)
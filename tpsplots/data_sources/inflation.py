@@ -11,6 +11,11 @@ Example
 >>> nnsi = NNSI(year="2025")  # target FY 2025
 >>> nnsi.calc("2014", 10)  # 10 → 13.59   (multiplied by 1.359)
 >>> nnsi.calc(datetime(2014, 1, 1), 10)  # Also handles datetime objects
+>>> nnsi.adjust(df["Fiscal Year"], df["Amount"])  # whole columns at once
+
+Index tables are fetched and parsed once per process. Every later instance
+with the same class and source (any target year) derives its multipliers from
+that parsed table; call :meth:`Inflation.clear_cache` to force a reload.
 
 """
 
@@ -18,20 +23,29 @@ from __future__ import annotations
 
 import io
 import logging
+import threading
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import Hashable, Mapping
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import certifi
 import numpy as np
 import pandas as pd
-import requests
 
+from tpsplots.data_sources.http_cache import fetch_text
 from tpsplots.exceptions import DataSourceError
 
 logger = logging.getLogger(__name__)
 
+# Process-wide registry: parsed index tables keyed by (class, source), and the
+# per-target-year multiplier maps derived from them keyed by (class, source, year).
+_registry_lock = threading.Lock()
+_parsed_indexes: dict[tuple[type, Hashable], Any] = {}
+_year_tables: dict[tuple[type, Hashable, str], Mapping[str, float]] = {}
+
 
 # Base class
 class Inflation(ABC):
@@ -51,6 +65,10 @@ class Inflation(ABC):
     ----------
     calc(from_year: Union[str, datetime, int], value: float) -> float
         Return *value* adjusted from *from_year* → *self.year*.
+    multipliers(from_years) -> np.ndarray
+        Return the multiplier for every entry of a fiscal-year column.
+    adjust(from_years, values) -> np.ndarray
+        Vectorised ``calc`` over aligned fiscal-year and value columns.
     """
 
     def __init__(self, *, year: str, source: str | Path | None = None) -> None:
@@ -65,27 +83,72 @@ class Inflation(ABC):
             )
 
     # ------------------------------------------------------------------ #
-    #  Sub-classes *must* implement the following three hooks            #
+    #  Sub-classes *must* implement the following hooks                  #
     # ------------------------------------------------------------------ #
     @abstractmethod
     def _load_raw(self) -> pd.DataFrame:
         """Return the raw price-index table as a DataFrame (no parsing)."""
         raise NotImplementedError
 
+    def _parse_index(self, df: pd.DataFrame) -> Any:
+        """
+        Parse the raw table into a target-year-independent form.
+
+        The result is cached per ``(class, source)`` and handed to
+        :meth:`_parse_table` for every target year. Defaults to *df* itself.
+        """
+        return df
+
     @abstractmethod
-    def _parse_table(self, df: pd.DataFrame) -> Mapping[str, float]:
+    def _parse_table(self, index: Any) -> Mapping[str, float]:
         """
-        Convert *df* into a mapping: ``{from_year_str -> multiplier(float)}``
-        for the chosen **target** fiscal year (``self.year``).
+        Convert the parsed *index* into a mapping:
+        ``{from_year_str -> multiplier(float)}`` for the chosen **target**
+        fiscal year (``self.year``).
         """
         raise NotImplementedError
 
+    def _raw_source(self) -> str | Path | None:
+        """URL or path :meth:`_load_raw` reads; part of the cache key."""
+        return self.source
+
     # ------------------------------------------------------------------ #
     #  Template method -- do not override in sub-classes                  #
     # ------------------------------------------------------------------ #
     def _load_table(self) -> Mapping[str, float]:
-        raw = self._load_raw()
-        return self._parse_table(raw)
+        cls = type(self)
+        source_key = _source_key(self._raw_source())
+        with _registry_lock:
+            table = _year_tables.get((cls, source_key, self.year))
+            if table is not None:
+                return table
+            index = _parsed_indexes.get((cls, source_key))
+            if index is None:
+                logger.debug("Loading %s index from %s", cls.__name__, source_key)
+                index = self._parse_index(self._load_raw())
+                _parsed_indexes[(cls, source_key)] = index
+            table = self._parse_table(index)
+            if table:
+                # Shared by every instance, so hand out a read-only view.
+                table = MappingProxyType(dict(table))
+                _year_tables[(cls, source_key, self.year)] = table
+            return table
+
+    @classmethod
+    def clear_cache(cls, source: str | Path | None = None) -> None:
+        """
+        Drop memoized index tables so the next instance reloads them.
+
+        Called on :class:`Inflation` it clears every adjuster; on a subclass
+        (e.g. ``NNSI.clear_cache()``) only that class and its subclasses.
+        Pass *source* to drop a single table.
+        """
+        source_key = None if source is None else _source_key(source)
+        with _registry_lock:
+            for registry in (_parsed_indexes, _year_tables):
+                for key in [k for k in registry if issubclass(k[0], cls)]:
+                    if source_key is None or key[1] == source_key:
+                        del registry[key]
 
     # ------------------------------------------------------------------ #
     #  Public helper                                                     #
@@ -102,23 +165,71 @@ class Inflation(ABC):
         Returns:
             float: The inflation-adjusted value.
         """
+        return value * self._multiplier(from_year)
+
+    def multipliers(self, from_years: pd.Series | np.ndarray | list) -> np.ndarray:
+        """
+        Return the multiplier for every entry of *from_years* in one pass.
+
+        Each distinct year is converted to a table key once, so a 10k-row
+        column with a few dozen fiscal years costs a few dozen lookups.
+        Accepts the same year formats as :meth:`calc` (datetimes, ints,
+        floats, strings such as ``"1976 TQ"``) and warns once per missing key
+        exactly as :meth:`calc` does.
+
+        Args:
+            from_years: Fiscal years to adjust from, one per row.
+
+        Returns:
+            np.ndarray: Float multipliers aligned with *from_years*.
+        """
+        codes, uniques = pd.factorize(pd.Series(from_years), use_na_sentinel=False)
+        lookup = np.fromiter(
+            (self._multiplier(year) for year in uniques), dtype=float, count=len(uniques)
+        )
+        return lookup[codes]
+
+    def adjust(
+        self,
+        from_years: pd.Series | np.ndarray | list,
+        values: pd.Series | np.ndarray | list,
+    ) -> np.ndarray:
+        """
+        Vectorised :meth:`calc` over aligned year and value columns.
+
+        NaN values stay NaN, and their fiscal years are not looked up, so a
+        year that only appears on empty rows does not trigger a warning.
+
+        Args:
+            from_years: Fiscal years to adjust from, one per row.
+            values: Values to adjust, aligned with *from_years*.
+
+        Returns:
+            np.ndarray: The inflation-adjusted values as floats.
+        """
+        values = np.asarray(values, dtype=float)
+        present = ~np.isnan(values)
+        result = np.full(values.shape, np.nan)
+        years = pd.Series(from_years).iloc[present]
+        result[present] = values[present] * self.multipliers(years)
+        return result
+
+    def _multiplier(self, from_year: object) -> float:
+        """Look up the multiplier for one year, warning once per missing key."""
         key = self._normalise_key(self._convert_year_to_key(from_year))
         if key in self._table:
-            mult = self._table[key]
-        else:
-            # Partial coverage is legitimate (e.g. projection years beyond the
-            # table). Leave the value unadjusted but warn once per key so a
-            # silent whole-series no-op can't slip by unnoticed.
-            mult = 1.0
-            if key not in self._warned_keys:
-                self._warned_keys.add(key)
-                logger.warning(
-                    "%s has no inflation entry for FY '%s'; leaving value "
-                    "unadjusted (multiplier 1.0)",
-                    self.__class__.__name__,
-                    key,
-                )
-        return value * mult
+            return self._table[key]
+        # Partial coverage is legitimate (e.g. projection years beyond the
+        # table). Leave the value unadjusted but warn once per key so a
+        # silent whole-series no-op can't slip by unnoticed.
+        if key not in self._warned_keys:
+            self._warned_keys.add(key)
+            logger.warning(
+                "%s has no inflation entry for FY '%s'; leaving value unadjusted (multiplier 1.0)",
+                self.__class__.__name__,
+                key,
+            )
+        return 1.0
 
     def _convert_year_to_key(self, year_input: str | datetime | int) -> str:
         """
@@ -173,13 +284,15 @@ class NNSI(Inflation):
         "1t7hYjU6AIAovar5sqi7cHXPmkWu6uAujsptMtGukQrA/export?format=csv"
     )
 
+    def _raw_source(self) -> str | Path:
+        return self.source or self.DEFAULT_CSV
+
     # ---------- step 1: fetch raw file ----------------------------------
     def _load_raw(self) -> pd.DataFrame:
-        path_or_url = self.source or self.DEFAULT_CSV
-        return _read_csv_source(path_or_url, header=None)
+        return _read_csv_source(self._raw_source(), header=None)
 
-    # ---------- step 2: parse into lookup dict --------------------------
-    def _parse_table(self, df: pd.DataFrame) -> Mapping[str, float]:
+    # ---------- step 2: parse the full from-year x target-year matrix ---
+    def _parse_index(self, df: pd.DataFrame) -> pd.DataFrame:
         header_idx = self._find_header_row(df)
         columns = self._extract_columns(df.iloc[header_idx].tolist())
         data = df.iloc[header_idx + 1 :, : len(columns)].copy()
@@ -193,8 +306,10 @@ class NNSI(Inflation):
         data = data.apply(lambda col: col.map(self._coerce_numeric))
         data = data.dropna(how="all")
         data.columns = [self._normalize_column(c) for c in data.columns]
-        data = data.loc[:, [c for c in data.columns if c is not None]]
+        return data.loc[:, [c for c in data.columns if c is not None]]
 
+    # ---------- step 3: pick the target-year column ---------------------
+    def _parse_table(self, data: pd.DataFrame) -> Mapping[str, float]:
         target_col = int(self.year)
         if target_col not in data.columns:
             logger.warning(
@@ -290,9 +405,12 @@ class GDP(Inflation):
     # FRED quarterly CSV (public, no key)
     _FRED_CSV = "https://fred.stlouisfed.org/graph/fredgraph.csv?id=GDPDEF"
 
+    def _raw_source(self) -> str:
+        return self._FRED_CSV
+
     # ---------- hook #1 --------------------------------------------------
     def _load_raw(self) -> pd.DataFrame:
-        return _read_csv_source(self._FRED_CSV)
+        return _read_csv_source(self._raw_source())
 
     @staticmethod
     def _annualize_quarters(
@@ -307,13 +425,8 @@ class GDP(Inflation):
         return annual, quarter_counts
 
     # ---------- hook #2 --------------------------------------------------
-    def _parse_table(self, df: pd.DataFrame) -> Mapping[str, float]:
-        """
-        Return { 'YYYY' -> multiplier } where multiplier =
-        deflator[target_year] / deflator[from_year]
-        """
-        target = int(self.year)
-
+    def _parse_index(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Return fiscal-year deflator averages and their quarter counts."""
         num_col = "GDPDEF"
 
         df = df[~df[num_col].isin([".", ""])].copy()  # remove blanks
@@ -323,6 +436,16 @@ class GDP(Inflation):
             "observation_date",
             num_col,
         )
+        return pd.DataFrame({"annual": annual, "quarters": quarter_counts})
+
+    # ---------- hook #3 --------------------------------------------------
+    def _parse_table(self, index: pd.DataFrame) -> Mapping[str, float]:
+        """
+        Return { 'YYYY' -> multiplier } where multiplier =
+        deflator[target_year] / deflator[from_year]
+        """
+        target = int(self.year)
+        annual, quarter_counts = index["annual"], index["quarters"]
         if target in quarter_counts.index and quarter_counts.loc[target] < 4:
             logger.warning(
                 f"GDP deflator FY {target} computed from {quarter_counts.loc[target]} quarters"
@@ -339,10 +462,19 @@ class GDP(Inflation):
         return {str(k): float(v) for k, v in multipliers.items()}
 
 
+def _source_key(source: str | Path | None) -> Hashable:
+    """Cache key for *source*; local files include their mtime so edits reload."""
+    if source is None:
+        return None
+    path = Path(source)
+    if path.is_file():
+        return (str(path.resolve()), path.stat().st_mtime_ns)
+    return str(source)
+
+
 def _read_csv_source(source: str | Path, header: int | None = 0) -> pd.DataFrame:
     path = Path(source)
     if path.is_file():
         return pd.read_csv(path, header=header)
-    response = requests.get(str(source), timeout=30, verify=certifi.where())
-    response.raise_for_status()
-    return pd.read_csv(io.StringIO(response.text), header=header)
+    text = fetch_text(str(source), verify=certifi.where())
+    return pd.read_csv(io.StringIO(text), header=header)
@@ -68,6 +68,7 @@ import pandas as pd
 import requests
 
 from tpsplots.data_sources.fiscal_year_mixin import FiscalYearMixin
+from tpsplots.data_sources.http_cache import fetch_text
 from tpsplots.utils.currency_processing import clean_currency_column
 
 logger = logging.getLogger(__name__)
@@ -225,11 +226,9 @@ class NASABudget(FiscalYearMixin):
     # ── I/O helpers ────────────────────────────────────────────────
     @staticmethod
     def _fetch_url_content(url: str) -> str:
-        """Fetch raw CSV text from a URL without parsing it first."""
+        """Fetch raw CSV text from a URL (via the shared HTTP cache) without parsing it."""
         try:
-            response = requests.get(url, timeout=30, verify=certifi.where())
-            response.raise_for_status()
-            return response.text
+            return fetch_text(url, verify=certifi.where())
         except requests.exceptions.RequestException as exc:
             raise URLError(str(exc)) from exc
 
@@ -0,0 +1,185 @@
+"""Size-bounded LRU caches for the editor's resolved data and profiles.
+
+An editor session resolves a data source for every preview, validation and
+profile request, keyed by a hash of the ``data:`` section. Trying many
+sources or params over a long session would keep every resolved DataFrame
+alive, so :class:`ByteBudgetLRU` bounds the cache by the memory its values
+hold rather than by entry count: a resolved source is typically a DataFrame
+plus one NumPy array per column (``ChartController._build_result_dict``),
+and a wide sheet can outweigh hundreds of small CSVs.
+
+Entries may carry a time-to-live, used for URL sources whose upstream can
+change without the cache key changing.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Per-cache default: plenty for dozens of typical sheets, small next to the
+# memory a long editing session could otherwise accumulate.
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def estimate_nbytes(value: Any, _seen: set[int] | None = None) -> int:
+    """Approximate resident bytes held by ``value``.
+
+    DataFrames and Series count ``memory_usage(deep=True)``; NumPy arrays
+    count their buffer plus, for object dtype, the objects they point to;
+    containers are walked recursively. An object reachable twice is counted
+    once.
+    """
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, (pd.Series, pd.Index)):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return value.nbytes + sum(estimate_nbytes(item, seen) for item in value.flat)
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(key, seen) + estimate_nbytes(item, seen) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(item, seen) for item in value)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class LRUStats:
+    """Lookup and eviction counters for one :class:`ByteBudgetLRU`."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    nbytes: int
+    expires_at: float | None
+
+
+class ByteBudgetLRU(MutableMapping[str, Any]):
+    """Least-recently-used cache bounded by the estimated bytes of its values.
+
+    Storing a value that pushes the total over ``max_bytes`` evicts the least
+    recently used entries until it fits. The newest entry is always kept,
+    even on its own over budget, so the source being edited stays cached.
+
+    Only :meth:`get` counts hits and misses and refreshes recency;
+    mapping-style access (``cache[key]``, iteration) is bookkeeping-free.
+
+    Args:
+        max_bytes: Byte budget; ``None`` for unbounded.
+        clock: Monotonic time source for TTLs (injectable for tests).
+
+    Example:
+        >>> cache = ByteBudgetLRU(max_bytes=64 * 1024 * 1024)
+        >>> cache.put("key", {"data": df}, ttl=300)
+        >>> cache.get("key")["data"] is df
+        True
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = DEFAULT_CACHE_MAX_BYTES,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.stats = LRUStats()
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated bytes held by the cached values."""
+        return self._nbytes
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the live value for ``key`` and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def put(self, key: str, value: Any, *, ttl: float | None = None) -> None:
+        """Store ``value``, expiring after ``ttl`` seconds when given."""
+        nbytes = estimate_nbytes(value)
+        expires_at = None if ttl is None else self._clock() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(value, nbytes, expires_at)
+            self._nbytes += nbytes
+            if self.max_bytes is not None:
+                while self._nbytes > self.max_bytes and len(self._entries) > 1:
+                    self._remove(next(iter(self._entries)))
+                    self.stats.evictions += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Size, budget and counters, for the editor API."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._nbytes,
+                "max_bytes": self.max_bytes,
+                **asdict(self.stats),
+            }
+
+    def _expired(self, entry: _Entry) -> bool:
+        return entry.expires_at is not None and self._clock() >= entry.expires_at
+
+    def _remove(self, key: str) -> None:
+        self._nbytes -= self._entries.pop(key).nbytes
+
+    # MutableMapping interface -------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        return self._entries[key].value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
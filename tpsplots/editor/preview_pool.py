@@ -0,0 +1,393 @@
+"""Process-backed, coalescing scheduler for editor previews.
+
+Every keystroke in the editor form can trigger ``/api/preview``. Rendering
+runs in worker processes (matplotlib is not thread-safe, and separate
+processes let desktop, mobile and social previews render side by side), and
+requests are coalesced per *slot* — one ``(client_id, device)`` pair:
+
+* at most one render per slot runs at a time;
+* at most one more waits behind it; a newer request for the same slot
+  replaces the waiting one, which fails with :class:`PreviewSuperseded`
+  without ever being rendered;
+* waiting slots start in arrival order as workers free up.
+
+A render that has already started is never interrupted; its result is
+delivered and the newest waiting config for the slot renders next. Animation
+previews (:func:`submit_animation`) are the exception: they run for seconds,
+so they check a shared cancel event between frames.
+
+Workers are spawned, like the ``generate --jobs`` and variant pools, and each
+holds its own :class:`~tpsplots.editor.session.EditorSession` (data cache
+included) for the editor's YAML directory.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import multiprocessing
+import os
+import pickle
+import statistics
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, InvalidStateError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from tpsplots import ensure_matplotlib
+from tpsplots.animation.preview import write_gif
+from tpsplots.editor.session import PREVIEW_DPI
+from tpsplots.exceptions import RenderingError
+
+if TYPE_CHECKING:
+    from tpsplots.editor.session import EditorSession
+
+logger = logging.getLogger(__name__)
+
+# Enough for one slot per device to render concurrently.
+DEFAULT_PREVIEW_WORKERS = 3
+
+# Recent renders kept for the latency figures in diagnostics().
+_LATENCY_WINDOW = 200
+
+
+class PreviewSuperseded(Exception):
+    """A newer preview request for the same client and device replaced this one."""
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+_worker_session = None
+_worker_generation = 0
+
+
+def _init_worker(
+    yaml_dir: str, outdir: str, cache_settings: dict[str, Any], log_level: int
+) -> None:
+    global _worker_session
+    ensure_matplotlib()
+    logging.basicConfig(level=log_level, format="%(message)s", force=True)
+    logging.getLogger("matplotlib.category").setLevel(logging.WARNING)
+
+    from tpsplots.editor.session import EditorSession
+
+    _worker_session = EditorSession(Path(yaml_dir), Path(outdir), **cache_settings)
+
+
+def _portable(exc: BaseException) -> BaseException:
+    """Return ``exc``, or the nearest picklable base class carrying its message.
+
+    Exceptions cross the process boundary by pickling. One whose
+    ``__init__`` does not take its message (e.g. a custom error with extra
+    required arguments) cannot be rebuilt on the other side, and would
+    otherwise surface as an opaque pickling error instead of a 400.
+    """
+    for cls in type(exc).__mro__:
+        if not issubclass(cls, BaseException):
+            continue
+        candidate = exc if cls is type(exc) else cls(str(exc))
+        try:
+            pickle.loads(pickle.dumps(candidate))
+        except Exception:
+            continue
+        return candidate
+    return RenderingError(str(exc))
+
+
+def _sync_generation(generation: int) -> None:
+    global _worker_generation
+    if generation != _worker_generation:
+        # /api/refresh-data ran since this worker last rendered.
+        _worker_session.invalidate_data_cache()
+        _worker_generation = generation
+
+
+def _render_in_worker(
+    config: dict[str, Any], device: str, generation: int, dpi: int = PREVIEW_DPI
+) -> tuple[bytes, dict[str, Any]]:
+    """Render in a worker; return the PNG and this worker's cache stats."""
+    _sync_generation(generation)
+    try:
+        png = _worker_session.render_preview(config, device, dpi=dpi)
+    except Exception as exc:
+        raise _portable(exc) from None
+    return png, {"pid": os.getpid(), **_worker_session.cache_stats()}
+
+
+def _animate_in_worker(
+    config: dict[str, Any], fmt: str, generation: int, frames: Any, cancelled: Any
+) -> tuple[bytes, dict[str, Any]]:
+    """Render an animation preview in a worker; return its GIF and cache stats.
+
+    Each keyframe is also put on the ``frames`` queue as soon as it is drawn.
+    Between keyframes the render stops with :class:`PreviewSuperseded` once
+    the ``cancelled`` event is set.
+    """
+    _sync_generation(generation)
+    rendered = []
+    try:
+        for keyframe in _worker_session.render_animation_preview(config, fmt):
+            if cancelled.is_set():
+                raise PreviewSuperseded("Superseded by a newer preview")
+            frames.put(keyframe)
+            rendered.append(keyframe)
+        gif = write_gif(rendered)
+    except Exception as exc:
+        raise _portable(exc) from None
+    return gif, {"pid": os.getpid(), **_worker_session.cache_stats()}
+
+
+# ----------------------------------------------------------------------
+# Scheduler
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class _Job:
+    args: tuple
+    render: Callable[..., Any] | None = None
+    future: Future = field(default_factory=Future)
+    queued_at: float = field(default_factory=time.perf_counter)
+    started_at: float = 0.0
+    executor: Executor | None = None
+
+
+class PreviewScheduler:
+    """Coalesce preview requests per slot and render them on an executor.
+
+    Args:
+        executor_factory: Builds the executor renders run on; called again
+            after a worker process dies.
+        render: Picklable callable run on the executor with each job's args;
+            its return value becomes the job's result.
+        max_workers: Renders allowed in flight at once.
+    """
+
+    def __init__(
+        self,
+        executor_factory: Callable[[], Executor],
+        render: Callable[..., Any],
+        max_workers: int,
+    ) -> None:
+        self._executor_factory = executor_factory
+        self._executor: Executor | None = None
+        self._render = render
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        # Insertion order is arrival order; a replaced request keeps its place.
+        self._waiting: dict[tuple[str, str], _Job] = {}
+        self._running: dict[tuple[str, str], _Job] = {}
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0, "superseded": 0}
+        self._render_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._wait_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def submit(
+        self,
+        client_id: str,
+        device: str,
+        *args: Any,
+        render: Callable[..., Any] | None = None,
+    ) -> Future:
+        """Queue a render for ``(client_id, device)``; return its future.
+
+        The future fails with :class:`PreviewSuperseded` if a newer request
+        for the same slot arrives before this one starts. ``render`` replaces
+        the scheduler's render callable for this job.
+        """
+        job = _Job(args=args, render=render)
+        slot = (client_id, device)
+        with self._lock:
+            self._counts["submitted"] += 1
+            replaced = self._waiting.get(slot)
+            self._waiting[slot] = job
+            if replaced is not None:
+                self._counts["superseded"] += 1
+        if replaced is not None:
+            # Unless its caller already cancelled it.
+            with contextlib.suppress(InvalidStateError):
+                replaced.future.set_exception(PreviewSuperseded("Superseded by a newer preview"))
+        self._dispatch()
+        return job.future
+
+    def cancel(self, future: Future) -> bool:
+        """Drop a still-waiting request; return False once it has started."""
+        with self._lock:
+            for slot, job in self._waiting.items():
+                if job.future is future:
+                    del self._waiting[slot]
+                    break
+            else:
+                return False
+        return future.cancel()
+
+    def _dispatch(self) -> None:
+        """Start waiting slots while workers are free."""
+        started: list[tuple[tuple[str, str], _Job]] = []
+        with self._lock:
+            for slot in list(self._waiting):
+                if len(self._running) >= self._max_workers:
+                    break
+                if slot in self._running:
+                    continue
+                job = self._waiting.pop(slot)
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                job.started_at = time.perf_counter()
+                self._wait_ms.append((job.started_at - job.queued_at) * 1000)
+                self._running[slot] = job
+                started.append((slot, job))
+            if started and self._executor is None:
+                self._executor = self._executor_factory()
+            for _, job in started:
+                job.executor = self._executor
+
+        # Submitted outside the lock: a done callback can run synchronously
+        # and re-enter _finish.
+        for slot, job in started:
+            try:
+                inner = job.executor.submit(job.render or self._render, *job.args)
+            except Exception as exc:  # Boundary: pool was shut down or is broken
+                inner = Future()
+                inner.set_exception(exc)
+            inner.add_done_callback(
+                lambda inner, slot=slot, job=job: self._finish(slot, job, inner)
+            )
+
+    def _finish(self, slot: tuple[str, str], job: _Job, inner: Future) -> None:
+        exc = inner.exception()
+        with self._lock:
+            del self._running[slot]
+            if isinstance(exc, BrokenProcessPool) and self._executor is job.executor:
+                # A worker died (e.g. killed for memory); start a fresh pool next time.
+                job.executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            if exc is None:
+                self._counts["completed"] += 1
+                self._render_ms.append((time.perf_counter() - job.started_at) * 1000)
+            else:
+                self._counts["failed"] += 1
+        if exc is None:
+            job.future.set_result(inner.result())
+        else:
+            job.future.set_exception(exc)
+        self._dispatch()
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Queue depth, counters and recent latencies (milliseconds)."""
+        with self._lock:
+            return {
+                "workers": self._max_workers,
+                "pool_started": self._executor is not None,
+                "running": len(self._running),
+                "queued": len(self._waiting),
+                **self._counts,
+                "render_ms": _latency_summary(self._render_ms),
+                "queue_wait_ms": _latency_summary(self._wait_ms),
+            }
+
+    def shutdown(self) -> None:
+        """Fail waiting requests and stop the worker processes."""
+        with self._lock:
+            waiting = list(self._waiting.values())
+            self._waiting.clear()
+            executor, self._executor = self._executor, None
+        for job in waiting:
+            job.future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _latency_summary(samples: deque[float]) -> dict[str, float] | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return {
+        "last": round(samples[-1], 1),
+        "p50": round(statistics.median(ordered), 1),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+        "max": round(ordered[-1], 1),
+        "samples": len(ordered),
+    }
+
+
+def create_preview_scheduler(
+    session: EditorSession, max_workers: int | None = None
+) -> PreviewScheduler:
+    """Scheduler rendering on spawned worker processes, started on first use.
+
+    Each worker builds an ``EditorSession`` like ``session`` (same YAML
+    directory, output directory and cache settings), and the cache budget is
+    split between ``session`` and the workers. Jobs take
+    ``(config, device, data_generation[, dpi])`` and return
+    ``(png_bytes, worker_cache_stats)``; :func:`submit_animation` queues
+    animation previews on the same workers.
+    """
+    workers = max_workers or min(DEFAULT_PREVIEW_WORKERS, os.cpu_count() or 1)
+    initargs = (
+        str(session.yaml_dir),
+        str(session.outdir),
+        session.share_cache_budget(workers + 1),
+        logging.getLogger().level,
+    )
+
+    def executor_factory() -> Executor:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+
+    return PreviewScheduler(executor_factory, _render_in_worker, workers)
+
+
+def submit_animation(
+    scheduler: PreviewScheduler,
+    client_id: str,
+    config: dict[str, Any],
+    fmt: str,
+    generation: int,
+    frames: Any,
+    cancelled: Any,
+) -> Future:
+    """Queue an animation preview on ``scheduler``'s workers; return its future.
+
+    Animations share one slot per client, whatever the format, so a newer
+    request replaces a waiting one. ``frames`` (a queue) and ``cancelled``
+    (an event) must be shareable with worker processes, e.g. from
+    :func:`preview_channels`. The future's result is
+    ``(gif_bytes, worker_cache_stats)``.
+    """
+    return scheduler.submit(
+        client_id,
+        "animation",
+        config,
+        fmt,
+        generation,
+        frames,
+        cancelled,
+        render=_animate_in_worker,
+    )
+
+
+_manager: Any = None
+_manager_lock = threading.Lock()
+
+
+def preview_channels() -> tuple[Any, Any]:
+    """A new ``(queue, event)`` pair that preview workers can share.
+
+    Backed by one manager process, started on first use and reused.
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = multiprocessing.get_context("spawn").Manager()
+        return _manager.Queue(), _manager.Event()
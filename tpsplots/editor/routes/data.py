@@ -74,6 +74,11 @@ def create_data_router(session: EditorSession) -> APIRouter:
         except Exception as exc:
             raise HTTPException(status_code=500, detail=str(exc)) from exc
 
+    @router.get("/cache-stats")
+    def cache_stats() -> dict:
+        """Size, budget and hit/miss/eviction counts of the session's data caches."""
+        return session.cache_stats()
+
     @router.post("/refresh-data")
     def refresh_data() -> dict:
         """Clear cached data/profiles so changed sources are re-read."""
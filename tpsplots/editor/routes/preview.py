@@ -1,64 +1,361 @@
-"""Preview API: render chart PNG from config dict."""
+"""Preview API: render chart PNG (or a draft animation) from config dict."""
 
 from __future__ import annotations
 
 import asyncio
+import base64
+import contextlib
+import hashlib
+import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+from collections.abc import AsyncIterator
+from concurrent.futures import Future
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response as RawResponse
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from tpsplots.editor.session import EditorSession
+from tpsplots.animation.preview import Keyframe
+from tpsplots.editor.preview_pool import (
+    PreviewScheduler,
+    PreviewSuperseded,
+    create_preview_scheduler,
+    preview_channels,
+    submit_animation,
+)
+from tpsplots.editor.session import PREVIEW_DPI, EditorSession
 from tpsplots.exceptions import TPSPlotsError
 
 logger = logging.getLogger(__name__)
 
-# Single-threaded executor — matplotlib is not thread-safe.
-_executor = ThreadPoolExecutor(max_workers=1)
-
 _PREVIEW_TIMEOUT_SECONDS = 60
 
+# Resolution of the draft frame /preview/stream sends before the full one.
+# Rasterizing is most of the cost of heavy charts (maps, dense scatters);
+# at this size it is a small fraction of the 150 dpi frame.
+_DRAFT_DPI = 50
+
+# An animation preview draws dozens of frames, not one.
+_ANIMATION_TIMEOUT_SECONDS = 120
+
 
 class PreviewRequest(BaseModel):
     config: dict[str, Any]
     device: str = "desktop"
+    # Identifies one editor tab; requests coalesce per (client_id, device).
+    # Falls back to the caller's address.
+    client_id: str | None = None
+
+
+class PreviewStreamRequest(PreviewRequest):
+    # Hash of the frame the editor is showing; a frame with the same hash is
+    # announced as "unchanged" instead of being sent again.
+    known_hash: str | None = None
+
+
+class AnimationPreviewRequest(BaseModel):
+    config: dict[str, Any]
+    # Video format: square, landscape or portrait.
+    format: str = "square"
+    client_id: str | None = None
+
+
+def _error_status(exc: BaseException) -> int:
+    """HTTP status for a failed preview render."""
+    if isinstance(exc, PreviewSuperseded):
+        # The editor has already moved on to a newer config for this device.
+        return 409
+    if isinstance(exc, (ValueError, TypeError, TPSPlotsError)):
+        # Config/data/render errors are user-fixable input problems, not
+        # server faults — return 400 with the message, never a 500.
+        return 400
+    return 500
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _frame_event(phase: str, png: bytes, dpi: int, known_hash: str | None) -> str:
+    digest = hashlib.sha256(png).hexdigest()
+    if digest == known_hash:
+        return _sse("unchanged", {"phase": phase, "hash": digest})
+    return _sse(
+        phase,
+        {
+            "hash": digest,
+            "png": base64.b64encode(png).decode("ascii"),
+            # Pixels per full-resolution pixel, so a draft displays at full size.
+            "density": round(dpi / PREVIEW_DPI, 4),
+        },
+    )
+
+
+def _keyframe_event(keyframe: Keyframe) -> str:
+    return _sse(
+        "frame",
+        {
+            "index": keyframe.index,
+            "count": keyframe.count,
+            "start_ms": keyframe.start_ms,
+            "duration_ms": keyframe.duration_ms,
+            "png": base64.b64encode(keyframe.png).decode("ascii"),
+        },
+    )
+
+
+def _read_keyframes(
+    frames: Any,
+    future: Future,
+    stop: threading.Event,
+    loop: asyncio.AbstractEventLoop,
+    pending: asyncio.Queue[Any],
+) -> None:
+    """Move keyframes from a worker's queue onto ``pending`` in ``loop``.
 
+    Runs on its own thread for the life of one animation stream. Ends with
+    ``None`` once the render is done and its frames are drained, or with the
+    exception that broke the queue; ``stop`` ends it early.
+    """
 
-def create_preview_router(session: EditorSession) -> APIRouter:
+    def deliver(item: Any) -> None:
+        # The loop is gone once the server shuts down; nobody is listening then.
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(pending.put_nowait, item)
+
+    try:
+        while not stop.is_set():
+            try:
+                keyframe = frames.get(timeout=0.1)
+            except queue.Empty:
+                if not future.done():
+                    continue
+                # Frames queued between the last wait and the render finishing.
+                while True:
+                    try:
+                        keyframe = frames.get_nowait()
+                    except queue.Empty:
+                        break
+                    deliver(keyframe)
+                break
+            deliver(keyframe)
+    except Exception as exc:  # Boundary: a dead manager fails the stream, not the thread
+        deliver(exc)
+        return
+    deliver(None)
+
+
+def create_preview_router(
+    session: EditorSession, scheduler: PreviewScheduler | None = None
+) -> APIRouter:
     router = APIRouter(tags=["preview"])
+    # Worker processes start with the first preview, not with the app.
+    scheduler = scheduler or create_preview_scheduler(session)
+    # Latest data-cache stats reported by each preview worker, keyed by pid.
+    worker_caches: dict[int, dict[str, Any]] = {}
+    # Cancel event of each client's newest animation preview.
+    animation_cancels: dict[str, Any] = {}
 
     @router.post("/preview")
-    async def preview(payload: PreviewRequest) -> RawResponse:
+    async def preview(payload: PreviewRequest, request: Request) -> RawResponse:
         """Render a chart preview as PNG."""
-        loop = asyncio.get_running_loop()
+        client_id = payload.client_id or (request.client.host if request.client else "")
+        future = scheduler.submit(
+            client_id,
+            payload.device,
+            payload.config,
+            payload.device,
+            session.data_generation,
+        )
         try:
-            png_bytes = await asyncio.wait_for(
-                loop.run_in_executor(
-                    _executor,
-                    session.render_preview,
-                    payload.config,
-                    payload.device,
-                ),
-                timeout=_PREVIEW_TIMEOUT_SECONDS,
+            png_bytes, cache_stats = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=_PREVIEW_TIMEOUT_SECONDS
             )
+            worker_caches[cache_stats["pid"]] = cache_stats
             return RawResponse(content=png_bytes, media_type="image/png")
         except asyncio.TimeoutError as exc:
+            scheduler.cancel(future)
             raise HTTPException(
                 status_code=504,
                 detail=f"Preview timed out after {_PREVIEW_TIMEOUT_SECONDS}s",
             ) from exc
-        except (ValueError, TypeError) as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        except TPSPlotsError as exc:
-            # Config/data/render errors are user-fixable input problems, not
-            # server faults — return 400 with the message, never a 500.
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
         except Exception as exc:
-            logger.exception("Preview rendering failed")
-            raise HTTPException(status_code=500, detail=str(exc)) from exc
+            status = _error_status(exc)
+            if status == 500:
+                logger.exception("Preview rendering failed")
+            raise HTTPException(status_code=status, detail=str(exc)) from exc
+
+    @router.post("/preview/stream")
+    async def preview_stream(payload: PreviewStreamRequest, request: Request) -> StreamingResponse:
+        """Stream a low-dpi draft frame, then the full preview, as server-sent events.
+
+        Events are ``draft`` and ``final`` (``{"hash", "png", "density"}``
+        with a base64 PNG), ``unchanged`` (``{"phase", "hash"}``) when a frame
+        matches ``known_hash``, and ``error`` (``{"status", "detail"}``).
+        The draft renders on its own worker alongside the full frame and is
+        skipped if the full frame is ready first. The stream always ends
+        after the final frame or an error.
+        """
+        client_id = payload.client_id or (request.client.host if request.client else "")
+        args = (payload.config, payload.device, session.data_generation)
+        # Drafts coalesce in their own slot so they never supersede full renders.
+        draft = scheduler.submit(client_id, f"{payload.device}:draft", *args, _DRAFT_DPI)
+        final = scheduler.submit(client_id, payload.device, *args)
+
+        async def events() -> AsyncIterator[str]:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + _PREVIEW_TIMEOUT_SECONDS
+            draft_wait = asyncio.wrap_future(draft)
+            final_wait = asyncio.wrap_future(final)
+            try:
+                done, _ = await asyncio.wait(
+                    {draft_wait, final_wait},
+                    timeout=_PREVIEW_TIMEOUT_SECONDS,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if draft_wait in done and final_wait not in done and not draft_wait.exception():
+                    png, _ = draft_wait.result()
+                    yield _frame_event("draft", png, _DRAFT_DPI, payload.known_hash)
+                # A failed draft is not reported: the full render fails the same way.
+                png, cache_stats = await asyncio.wait_for(
+                    final_wait, timeout=max(0.0, deadline - loop.time())
+                )
+                worker_caches[cache_stats["pid"]] = cache_stats
+                yield _frame_event("final", png, PREVIEW_DPI, payload.known_hash)
+            except asyncio.TimeoutError:
+                yield _sse(
+                    "error",
+                    {
+                        "status": 504,
+                        "detail": f"Preview timed out after {_PREVIEW_TIMEOUT_SECONDS}s",
+                    },
+                )
+            except Exception as exc:
+                status = _error_status(exc)
+                if status == 500:
+                    logger.exception("Preview rendering failed")
+                yield _sse("error", {"status": status, "detail": str(exc)})
+            finally:
+                # Client gone or stream over: drop renders that have not started.
+                for future, waiter in ((draft, draft_wait), (final, final_wait)):
+                    scheduler.cancel(future)
+                    if not waiter.done():
+                        waiter.cancel()
+                    elif not waiter.cancelled():
+                        # Mark a skipped draft's error as seen so asyncio does not log it.
+                        waiter.exception()
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @router.post("/preview/animation")
+    async def preview_animation(
+        payload: AnimationPreviewRequest, request: Request
+    ) -> StreamingResponse:
+        """Stream a fast draft of the chart's animation as server-sent events.
+
+        Events are ``frame`` (``{"index", "count", "start_ms", "duration_ms",
+        "png"}``) for each distinct frame as soon as it is drawn, then
+        ``final`` (``{"hash", "gif"}``, the whole preview as a base64 looping
+        GIF), or ``error`` (``{"status", "detail"}``). A newer animation
+        request from the same client, or the client going away, stops the
+        render at the next frame.
+        """
+        client_id = payload.client_id or (request.client.host if request.client else "")
+
+        def open_channels() -> tuple[Any, Any]:
+            frames, cancelled = preview_channels()
+            previous = animation_cancels.get(client_id)
+            animation_cancels[client_id] = cancelled
+            if previous is not None:
+                previous.set()
+            return frames, cancelled
+
+        # Starting the shared manager (first use) and its proxies block.
+        frames, cancelled = await asyncio.to_thread(open_channels)
+        future = submit_animation(
+            scheduler,
+            client_id,
+            payload.config,
+            payload.format,
+            session.data_generation,
+            frames,
+            cancelled,
+        )
+
+        async def events() -> AsyncIterator[str]:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + _ANIMATION_TIMEOUT_SECONDS
+            result = asyncio.wrap_future(future)
+            pending: asyncio.Queue[Any] = asyncio.Queue()
+            stop = threading.Event()
+            reader = threading.Thread(
+                target=_read_keyframes,
+                args=(frames, future, stop, loop, pending),
+                name=f"animation-preview-{client_id}",
+                daemon=True,
+            )
+            reader.start()
+            try:
+                while True:
+                    item = await asyncio.wait_for(pending.get(), deadline - loop.time())
+                    if item is None:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+                    yield _keyframe_event(item)
+                gif, cache_stats = await result
+                worker_caches[cache_stats["pid"]] = cache_stats
+                yield _sse(
+                    "final",
+                    {
+                        "hash": hashlib.sha256(gif).hexdigest(),
+                        "gif": base64.b64encode(gif).decode("ascii"),
+                    },
+                )
+            except asyncio.TimeoutError:
+                yield _sse(
+                    "error",
+                    {
+                        "status": 504,
+                        "detail": f"Animation preview timed out after "
+                        f"{_ANIMATION_TIMEOUT_SECONDS}s",
+                    },
+                )
+            except Exception as exc:
+                status = _error_status(exc)
+                if status == 500:
+                    logger.exception("Animation preview rendering failed")
+                yield _sse("error", {"status": status, "detail": str(exc)})
+            finally:
+                # Client gone or stream over: stop the reader and the render.
+                stop.set()
+                cancelled.set()
+                if animation_cancels.get(client_id) is cancelled:
+                    del animation_cancels[client_id]
+                scheduler.cancel(future)
+                if not result.done():
+                    result.cancel()
+                elif not result.cancelled():
+                    result.exception()
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @router.get("/preview/diagnostics")
+    def preview_diagnostics() -> dict:
+        """Preview queue depth, outcome counts, render latency and worker caches."""
+        return {**scheduler.diagnostics(), "worker_caches": list(worker_caches.values())}
 
     @router.post("/validate")
     def validate(config: dict[str, Any]) -> dict:
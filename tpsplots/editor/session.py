@@ -6,8 +6,7 @@ import hashlib
 import io
 import json
 import logging
-from collections.abc import Mapping, MutableMapping
-from copy import deepcopy
+from collections.abc import Iterator, Mapping, MutableMapping
 from datetime import date
 from pathlib import Path
 from typing import Any, NamedTuple
@@ -22,16 +21,29 @@ except ImportError:
 
 import yaml
 
+from tpsplots.animation.animators import get_animator
+from tpsplots.animation.config import CHOREOGRAPHY, resolve_animation
+from tpsplots.animation.preview import PREVIEW_MAX_FPS, Keyframe, keyframes
+from tpsplots.editor.data_cache import DEFAULT_CACHE_MAX_BYTES, ByteBudgetLRU
 from tpsplots.exceptions import TPSPlotsError
 from tpsplots.models.chart_config import CHART_TYPES
 from tpsplots.models.data_sources import DataSourceConfig
 from tpsplots.models.yaml_config import YAMLChartConfig
-from tpsplots.processors.render_pipeline import build_render_context
+from tpsplots.processors.render_pipeline import RenderContext, build_render_context
 from tpsplots.processors.resolvers import DataResolver
 from tpsplots.views import VIEW_REGISTRY
+from tpsplots.views.body_cache import ChartBodyCache
+from tpsplots.views.chart_view import ChartView
 
 logger = logging.getLogger(__name__)
 
+# Resolution of editor previews; a config's own `dpi` applies only on `generate`.
+PREVIEW_DPI = 150
+
+# Resolution of animation previews: a third of the 150 dpi video styles,
+# e.g. 360x360 px for the square format.
+ANIMATION_PREVIEW_DPI = 50
+
 
 class SaveConflict(Exception):
     """Raised when a save target changed on disk since it was loaded.
@@ -107,19 +119,83 @@ class EditorSession:
     controller modules referenced by a config are loaded from anywhere on disk,
     exactly like the ``tpsplots`` CLI, which also imports arbitrary controllers.
     Treat the editor as trusted-input only (see ``_resolve_data``).
+
+    Args:
+        yaml_dir: Directory YAML files are loaded from and saved to.
+        outdir: Output directory handed to chart views.
+        cache_max_bytes: Byte budget for each of the resolved-data and profile
+            caches (``None`` = unbounded). Preview workers split it with this
+            session (see :meth:`share_cache_budget`).
+        url_ttl: Seconds a URL source stays cached before it is fetched again
+            (``None`` = until evicted or refreshed).
     """
 
-    def __init__(self, yaml_dir: Path, outdir: Path | None = None) -> None:
+    def __init__(
+        self,
+        yaml_dir: Path,
+        outdir: Path | None = None,
+        *,
+        cache_max_bytes: int | None = DEFAULT_CACHE_MAX_BYTES,
+        url_ttl: float | None = None,
+    ) -> None:
         self._root = yaml_dir.resolve(strict=True)
         self._outdir = outdir or Path("charts")
-        self._data_cache: dict[str, Any] = {}
-        self._profile_cache: dict[str, dict[str, Any]] = {}
+        self._cache_max_bytes = cache_max_bytes
+        self._url_ttl = url_ttl
+        self._data_cache = ByteBudgetLRU(cache_max_bytes)
+        self._profile_cache = ByteBudgetLRU(cache_max_bytes)
+        # Pre-layout chart bodies, so edits to title/subtitle/source/etc.
+        # skip redrawing the data.
+        self._body_cache = ChartBodyCache()
         # mtime (ns) of each file at load time, keyed by relative path, so a
         # save can detect the file was changed on disk since it was loaded.
         self._loaded_mtimes: dict[str, int] = {}
         # Open-menu listing entries keyed by relative path, each paired with the
         # mtime (ns) they were parsed from: {rel: (mtime_ns, entry)}.
         self._file_meta_cache: dict[str, tuple[int | None, dict[str, Any]]] = {}
+        # Bumped by invalidate_data_cache so preview worker processes, which
+        # keep their own data caches, know to drop them too.
+        self._data_generation = 0
+
+    @property
+    def yaml_dir(self) -> Path:
+        """Resolved directory YAML files are loaded from and saved to."""
+        return self._root
+
+    @property
+    def outdir(self) -> Path:
+        return self._outdir
+
+    @property
+    def data_generation(self) -> int:
+        """Number of times the data cache has been invalidated."""
+        return self._data_generation
+
+    def cache_settings(self) -> dict[str, Any]:
+        """Cache keyword arguments that recreate this session (e.g. in a worker)."""
+        return {"cache_max_bytes": self._cache_max_bytes, "url_ttl": self._url_ttl}
+
+    def share_cache_budget(self, processes: int) -> dict[str, Any]:
+        """Split the cache budget evenly across ``processes`` sessions.
+
+        Shrinks this session's caches to its share and returns the
+        :meth:`cache_settings` for the other sessions (the preview workers'),
+        so all of them together stay within the configured budget.
+        """
+        if self._cache_max_bytes is not None:
+            share = max(1, self._cache_max_bytes // processes)
+            self._cache_max_bytes = share
+            self._data_cache.max_bytes = share
+            self._profile_cache.max_bytes = share
+        return self.cache_settings()
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Size, budget and hit/miss counters of the data, profile and chart-body caches."""
+        return {
+            "data": self._data_cache.snapshot(),
+            "profile": self._profile_cache.snapshot(),
+            "body": self._body_cache.stats(),
+        }
 
     # ------------------------------------------------------------------
     # Path security
@@ -178,6 +254,23 @@ class EditorSession:
         serialized = json.dumps(payload, sort_keys=True, default=str)
         return hashlib.sha256(serialized.encode()).hexdigest()[:16]
 
+    @staticmethod
+    def _parse_source(data_config: dict[str, Any]) -> tuple[str, str] | None:
+        """Return ``(kind, target)`` of the config's source, or ``None`` if unparseable."""
+        source = data_config.get("source")
+        if not isinstance(source, str) or not source.strip():
+            return None
+        try:
+            kind, target, _ = DataResolver._parse_source(source)
+        except Exception:
+            return None
+        return kind, target
+
+    def _cache_ttl(self, data_config: dict[str, Any]) -> float | None:
+        """TTL for cache entries of this source: ``url_ttl`` for URLs, else none."""
+        parsed = self._parse_source(data_config)
+        return self._url_ttl if parsed is not None and parsed[0] == "url" else None
+
     def _local_source_mtime_ns(self, data_config: dict[str, Any]) -> int | None:
         """Return the mtime (ns) of a local file data source, or ``None``.
 
@@ -186,15 +279,10 @@ class EditorSession:
         Mixing the mtime into the cache key means edits to a local CSV are
         picked up automatically instead of being served stale until restart.
         """
-        source = data_config.get("source")
-        if not isinstance(source, str) or not source.strip():
-            return None
-        try:
-            kind, target, _ = DataResolver._parse_source(source)
-        except Exception:
-            return None
-        if kind != "csv":
+        parsed = self._parse_source(data_config)
+        if parsed is None or parsed[0] != "csv":
             return None
+        target = parsed[1]
 
         # Stat the same path the CSV loader reads (cwd-relative when relative).
         path = Path(target).expanduser()
@@ -210,11 +298,11 @@ class EditorSession:
         return base if mtime is None else f"{base}:{mtime}"
 
     @staticmethod
-    def _evict_stale_variants(cache: dict[str, Any], cache_key: str) -> None:
+    def _evict_stale_variants(cache: ByteBudgetLRU, cache_key: str) -> None:
         """Drop entries for older mtimes of the same config from a cache."""
         base = cache_key.split(":", 1)[0]
         for key in [k for k in cache if k != cache_key and k.split(":", 1)[0] == base]:
-            del cache[key]
+            cache.pop(key, None)
 
     def _resolve_data(self, data_config: dict[str, Any]) -> dict[str, Any]:
         """Resolve data source, caching by content hash (+ local file mtime).
@@ -226,13 +314,14 @@ class EditorSession:
         """
         cache_key = self._data_cache_key(data_config)
 
-        if cache_key in self._data_cache:
-            return self._data_cache[cache_key]
+        cached = self._data_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         data_source = DataSourceConfig(**data_config)
         resolved = DataResolver.resolve(data_source)
         self._evict_stale_variants(self._data_cache, cache_key)
-        self._data_cache[cache_key] = resolved
+        self._data_cache.put(cache_key, resolved, ttl=self._cache_ttl(data_config))
         return resolved
 
     def _resolve_chart_templates(self, config: dict[str, Any]) -> ResolvedTemplates:
@@ -278,8 +367,9 @@ class EditorSession:
     def profile_data(self, data_config: dict[str, Any]) -> dict[str, Any]:
         """Return data profile details for a source configuration."""
         cache_key = self._data_cache_key(data_config)
-        if cache_key in self._profile_cache:
-            return self._profile_cache[cache_key]
+        cached = self._profile_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         data_source = DataSourceConfig(**data_config)
         resolved = self._resolve_data(data_config)
@@ -317,7 +407,7 @@ class EditorSession:
             "context_keys": context_keys,
         }
         self._evict_stale_variants(self._profile_cache, cache_key)
-        self._profile_cache[cache_key] = profile
+        self._profile_cache.put(cache_key, profile, ttl=self._cache_ttl(data_config))
         return profile
 
     def preflight(self, config: dict[str, Any]) -> dict[str, Any]:
@@ -427,25 +517,13 @@ class EditorSession:
     # Preview rendering
     # ------------------------------------------------------------------
 
-    def render_preview(
-        self,
-        config: dict[str, Any],
-        device: str = "desktop",
-    ) -> bytes:
-        """Render a chart preview as PNG from a full config dict.
-
-        Args:
-            config: Full ``{data: {...}, chart: {...}}`` config dict.
-            device: ``"desktop"``, ``"mobile"``, or ``"social"``.
+    def _render_context(
+        self, config: dict[str, Any]
+    ) -> tuple[YAMLChartConfig, RenderContext, ChartView]:
+        """Validate a form config and build its render context and view.
 
-        Returns:
-            PNG image bytes.
+        Shared by every preview renderer; data comes from the session cache.
         """
-        # Keep this strict: create_figure silently falls back to DESKTOP for
-        # unknown device names, which would mask typos as wrong-looking charts.
-        if device not in {"desktop", "mobile", "social"}:
-            raise ValueError(f"Unsupported device: {device}")
-
         # Drop empty values (empty strings, empty arrays, etc.) the editor form
         # emits for unset fields, so the pipeline sees them as absent.
         config = _clean_form_data(config)
@@ -470,16 +548,41 @@ class EditorSession:
         if view_class is None:
             raise ValueError(f"Unknown chart type: {ctx.chart_type_v1}")
 
-        view = view_class(outdir=self._outdir)
-        params = deepcopy(ctx.resolved_params)
-        # Previews are always rendered at 150 dpi for speed; a config's own `dpi`
-        # applies only on `generate`. Pop it so an explicit dpi can't collide
-        # with the dpi=150 kwarg below (duplicate-kwarg TypeError).
-        params.pop("dpi", None)
+        return validated, ctx, view_class(outdir=self._outdir)
+
+    def render_preview(
+        self,
+        config: dict[str, Any],
+        device: str = "desktop",
+        dpi: int = PREVIEW_DPI,
+    ) -> bytes:
+        """Render a chart preview as PNG from a full config dict.
+
+        Args:
+            config: Full ``{data: {...}, chart: {...}}`` config dict.
+            device: ``"desktop"``, ``"mobile"``, or ``"social"``.
+            dpi: Output resolution; lower values give faster draft frames.
+
+        Returns:
+            PNG image bytes.
+        """
+        # Keep this strict: create_figure silently falls back to DESKTOP for
+        # unknown device names, which would mask typos as wrong-looking charts.
+        if device not in {"desktop", "mobile", "social"}:
+            raise ValueError(f"Unsupported device: {device}")
+
+        _validated, ctx, view = self._render_context(config)
+        # Previews render at PREVIEW_DPI (or a draft dpi) for speed; a config's
+        # own `dpi` applies only on `generate`. Drop it so an explicit dpi can't
+        # collide with the dpi kwarg below (duplicate-kwarg TypeError).
+        # create_figure freezes the parameters, so the cached data behind
+        # them is shared rather than copied.
+        params = {key: value for key, value in ctx.resolved_params.items() if key != "dpi"}
         fig = view.create_figure(
             metadata=ctx.resolved_metadata,
             device=device,
-            dpi=150,
+            body_cache=self._body_cache,
+            dpi=dpi,
             **params,
         )
         try:
@@ -489,6 +592,56 @@ class EditorSession:
         finally:
             plt.close(fig)
 
+    def render_animation_preview(
+        self,
+        config: dict[str, Any],
+        fmt: str = "square",
+        *,
+        dpi: int = ANIMATION_PREVIEW_DPI,
+        max_fps: int = PREVIEW_MAX_FPS,
+    ) -> Iterator[Keyframe]:
+        """Render a fast draft of the chart's animation, one keyframe at a time.
+
+        The config's ``animation:`` block is resolved as ``tpsplots animate``
+        would, but frames are drawn at ``dpi`` and at most ``max_fps`` frames
+        per second, and each still stretch is drawn once. The figure is closed
+        when the iterator is exhausted or closed.
+
+        Args:
+            config: Full ``{data: {...}, chart: {...}}`` config dict.
+            fmt: ``"square"``, ``"landscape"``, or ``"portrait"``.
+            dpi: Output resolution (video styles are laid out at 150 dpi).
+            max_fps: Frame-rate ceiling, applied when below the config's fps.
+
+        Yields:
+            Keyframes (:class:`~tpsplots.animation.preview.Keyframe`) in
+            playback order.
+        """
+        # Strict for the same reason as render_preview's device check.
+        if fmt not in {"square", "landscape", "portrait"}:
+            raise ValueError(f"Unsupported video format: {fmt}")
+
+        validated, ctx, view = self._render_context(config)
+        animator_cls = get_animator(ctx.chart_type_v1)  # raises UnsupportedChartAnimation
+        anim = resolve_animation(validated.animation, formats=(fmt,))
+
+        # As in `animate`, the video device style fixes the frame size. No
+        # body cache: the animator rewrites the figure's artists.
+        params = {
+            key: value
+            for key, value in ctx.resolved_params.items()
+            if key not in ("figsize", "dpi")
+        }
+        fig = view.create_figure(
+            metadata=ctx.resolved_metadata, device=f"video_{fmt}", dpi=dpi, **params
+        )
+        try:
+            animator = animator_cls(fig, anim, CHOREOGRAPHY[ctx.chart_type_v1])
+            animator.prepare()
+            yield from keyframes(fig, animator, fps=min(anim.fps, max_fps))
+        finally:
+            plt.close(fig)
+
     # ------------------------------------------------------------------
     # File I/O
     # ------------------------------------------------------------------
@@ -726,6 +879,8 @@ class EditorSession:
         """Clear the data cache (e.g. after data source changes)."""
         self._data_cache.clear()
         self._profile_cache.clear()
+        self._body_cache.clear()
+        self._data_generation += 1
 
 
 # ------------------------------------------------------------------
@@ -37,20 +37,92 @@ export async function fetchColors() {
   return request("/api/colors");
 }
 
-export async function fetchPreview(config, device, signal) {
-  const resp = await fetch("/api/preview", {
+// Identifies this tab to the preview scheduler, which keeps only the newest
+// pending render per (client, device) and reports superseded ones as 409s.
+const PREVIEW_CLIENT_ID = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+
+function base64Blob(base64, type) {
+  const bytes = Uint8Array.from(atob(base64), (c) => c.charCodeAt(0));
+  return new Blob([bytes], { type });
+}
+
+/**
+ * POST a JSON body and yield the server-sent events of the response as
+ * { event, data } (read with fetch, since EventSource cannot POST). Throws
+ * the server's message on an error event or a failed request.
+ */
+async function* postEvents(url, body, signal) {
+  const resp = await fetch(url, {
     method: "POST",
     headers: { "Content-Type": "application/json" },
-    body: JSON.stringify({ config, device }),
+    body: JSON.stringify(body),
     signal,
   });
   if (!resp.ok) {
-    // Error responses are JSON with a detail field
     const err = await resp.json().catch(() => ({ detail: `Request failed: ${resp.status}` }));
     throw new Error(err.detail || `Request failed: ${resp.status}`);
   }
-  const blob = await resp.blob();
-  return URL.createObjectURL(blob);
+
+  const reader = resp.body.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) return;
+    buffer += value;
+    let end;
+    while ((end = buffer.indexOf("\n\n")) !== -1) {
+      const block = buffer.slice(0, end);
+      buffer = buffer.slice(end + 2);
+      const event = /^event: (.*)$/m.exec(block)?.[1];
+      const data = JSON.parse(/^data: (.*)$/m.exec(block)?.[1] ?? "{}");
+      if (event === "error") {
+        const err = new Error(data.detail || `Request failed: ${data.status}`);
+        err.status = data.status;
+        throw err;
+      }
+      yield { event, data };
+    }
+  }
+}
+
+/**
+ * Progressive preview over /api/preview/stream. Calls onFrame for each frame:
+ * { phase: "draft" | "final", hash, blob, density } with the PNG and its
+ * pixels per full-resolution pixel, or blob: null when the frame matches
+ * knownHash. Resolves after the final frame; rejects with
+ * the server's message on an error event.
+ */
+export async function streamPreview(config, device, { knownHash = null, signal, onFrame }) {
+  const body = { config, device, client_id: PREVIEW_CLIENT_ID, known_hash: knownHash };
+  for await (const { event, data } of postEvents("/api/preview/stream", body, signal)) {
+    const phase = event === "unchanged" ? data.phase : event;
+    onFrame({
+      phase,
+      hash: data.hash,
+      blob: data.png ? base64Blob(data.png, "image/png") : null,
+      density: data.density ?? 1,
+    });
+    if (phase === "final") return;
+  }
+  throw new Error("Preview stream ended before the final frame");
+}
+
+/**
+ * Draft animation preview over /api/preview/animation. Calls onFrame with
+ * { index, count, blob } for each distinct frame as soon as it is drawn and
+ * resolves with the finished looping GIF blob. A newer call from this tab
+ * (or aborting signal) stops the server-side render.
+ */
+export async function streamAnimationPreview(config, format, { signal, onFrame }) {
+  const body = { config, format, client_id: PREVIEW_CLIENT_ID };
+  for await (const { event, data } of postEvents("/api/preview/animation", body, signal)) {
+    if (event === "frame") {
+      onFrame({ index: data.index, count: data.count, blob: base64Blob(data.png, "image/png") });
+    } else if (event === "final") {
+      return base64Blob(data.gif, "image/gif");
+    }
+  }
+  throw new Error("Animation preview ended before the final frame");
 }
 
 export async function fetchDataProfile(dataConfig) {
@@ -1,6 +1,16 @@
 /**
  * Preview panel: device toggle + live PNG preview with debounced rendering.
  *
+ * Renders are progressive: a low-resolution draft frame is shown as soon as
+ * it arrives and replaced by the full-resolution frame on the same stream.
+ * A full frame identical to the one already shown (by content hash) is not
+ * re-sent; the panel re-displays the PNG it kept.
+ *
+ * With Animate on, the panel previews the config's `animation:` block
+ * instead: a fast low-resolution draft in a video format, shown frame by
+ * frame as it renders and then as a looping GIF. Any edit restarts it, and
+ * the server stops the superseded render.
+ *
  * The last successful render stays visible when the config breaks — a banner
  * overlays it and the image desaturates slightly, instead of the chart
  * vanishing mid-edit. The StatusStrip in the header is the single home for
@@ -9,12 +19,14 @@
 import { useState, useEffect, useRef, useCallback } from "react";
 import { html } from "../lib/html.js";
 
-import { fetchPreview } from "../api.js";
+import { streamAnimationPreview, streamPreview } from "../api.js";
 import { StatusStrip } from "./StatusStrip.js";
 
 const DEBOUNCE_MS = 200;
 const DEVICES = ["desktop", "mobile", "social"];
 const DEVICE_LABELS = { desktop: "Desktop", mobile: "Mobile", social: "Social" };
+const VIDEO_FORMATS = ["square", "landscape", "portrait"];
+const VIDEO_FORMAT_LABELS = { square: "Square", landscape: "Landscape", portrait: "Portrait" };
 
 export function PreviewPanel({
   buildFullConfig,
@@ -29,10 +41,17 @@ export function PreviewPanel({
   const [status, setStatus] = useState("idle");
   const [statusDetail, setStatusDetail] = useState(null);
   const [renderedAt, setRenderedAt] = useState(null);
+  // Pixel density of the shown frame: below 1 for a draft, which the img
+  // srcset density descriptor scales up to the full-resolution size.
+  const [previewDensity, setPreviewDensity] = useState(1);
+  const [animate, setAnimate] = useState(false);
+  const [videoFormat, setVideoFormat] = useState("square");
 
   const timerRef = useRef(null);
   const controllerRef = useRef(null);
   const requestIdRef = useRef(0);
+  // Last full-resolution frame: { hash, blob, density }.
+  const finalFrameRef = useRef(null);
 
   // Blob URL lifecycle: revoke the previous URL whenever it is replaced, and
   // the final one on unmount. Kept out of setState updaters so revocation is
@@ -77,34 +96,66 @@ export function PreviewPanel({
 
       const currentId = ++requestIdRef.current;
       setStatus("rendering");
+      setStatusDetail(null);
       const startTime = performance.now();
 
+      const showFrame = ({ blob, density }) => {
+        setPreviewUrl(URL.createObjectURL(blob));
+        setPreviewDensity(density);
+      };
+      let showingDraft = false;
+      const onFrame = (frame) => {
+        if (currentId !== requestIdRef.current) return;
+        if (frame.phase === "final") {
+          if (frame.blob) finalFrameRef.current = frame;
+          showFrame(finalFrameRef.current);
+        } else if (frame.blob) {
+          showFrame(frame);
+        }
+        showingDraft = frame.phase === "draft" && !!frame.blob;
+      };
+
       try {
-        const blobUrl = await fetchPreview(config, device, controllerRef.current.signal);
-        if (currentId !== requestIdRef.current) {
-          URL.revokeObjectURL(blobUrl);
-          return;
+        if (animate) {
+          const gif = await streamAnimationPreview(config, videoFormat, {
+            signal: controllerRef.current.signal,
+            onFrame: ({ index, count, blob }) => {
+              if (currentId !== requestIdRef.current) return;
+              showFrame({ blob, density: 1 });
+              setStatusDetail(`Frame ${index + 1}/${count}`);
+            },
+          });
+          if (currentId !== requestIdRef.current) return;
+          showFrame({ blob: gif, density: 1 });
+        } else {
+          await streamPreview(config, device, {
+            knownHash: finalFrameRef.current?.hash ?? null,
+            signal: controllerRef.current.signal,
+            onFrame,
+          });
         }
+        if (currentId !== requestIdRef.current) return;
 
         const elapsed = ((performance.now() - startTime) / 1000).toFixed(1);
-        setPreviewUrl(blobUrl);
         setStatus("updated");
         setStatusDetail(`${elapsed}s`);
         setRenderedAt(new Date().toLocaleTimeString([], { hour: "2-digit", minute: "2-digit" }));
       } catch (err) {
         if (err.name === "AbortError") return;
         if (currentId !== requestIdRef.current) return;
-        // Keep the last-good image; surface the message in the banner.
+        // Keep the last-good image (not a draft of the failed render);
+        // surface the message in the banner.
+        if (showingDraft && finalFrameRef.current) showFrame(finalFrameRef.current);
         setStatus("error");
         setStatusDetail(err.message || "Preview failed");
       }
     }, DEBOUNCE_MS);
-  }, [buildFullConfig, device, preflight]);
+  }, [buildFullConfig, device, preflight, animate, videoFormat]);
 
   useEffect(() => {
     scheduleRender();
     return () => clearTimeout(timerRef.current);
-  }, [formData, dataConfig, device, preflight, renderTick, scheduleRender]);
+  }, [formData, dataConfig, device, preflight, renderTick, animate, videoFormat, scheduleRender]);
 
   const hasSource = !!dataConfig?.source;
   const showStale = status === "stale" || status === "error";
@@ -115,24 +166,47 @@ export function PreviewPanel({
         <h2 class="preview-title">Preview</h2>
 
         <div class="device-toggle">
-          ${DEVICES.map(
-            (d) => html`
-              <button
-                key=${d}
-                type="button"
-                class="device-btn ${device === d ? "active" : ""}"
-                aria-pressed=${device === d}
-                title=${d === "social" ? "Social card (no header/footer — rendered for link previews)" : DEVICE_LABELS[d]}
-                onClick=${() => onDeviceChange(d)}
-              >${DEVICE_LABELS[d]}</button>
-            `
-          )}
+          ${animate
+            ? VIDEO_FORMATS.map(
+                (f) => html`
+                  <button
+                    key=${f}
+                    type="button"
+                    class="device-btn ${videoFormat === f ? "active" : ""}"
+                    aria-pressed=${videoFormat === f}
+                    onClick=${() => setVideoFormat(f)}
+                  >${VIDEO_FORMAT_LABELS[f]}</button>
+                `
+              )
+            : DEVICES.map(
+                (d) => html`
+                  <button
+                    key=${d}
+                    type="button"
+                    class="device-btn ${device === d ? "active" : ""}"
+                    aria-pressed=${device === d}
+                    title=${d === "social" ? "Social card (no header/footer — rendered for link previews)" : DEVICE_LABELS[d]}
+                    onClick=${() => onDeviceChange(d)}
+                  >${DEVICE_LABELS[d]}</button>
+                `
+              )}
+        </div>
+
+        <div class="device-toggle">
+          <button
+            type="button"
+            class="device-btn ${animate ? "active" : ""}"
+            aria-pressed=${animate}
+            title="Preview the animation: a fast low-resolution draft of tpsplots animate"
+            onClick=${() => setAnimate((on) => !on)}
+          >Animate</button>
         </div>
 
         <${StatusStrip} preflight=${preflight} />
 
         <div class="render-status">
           ${status === "rendering" && html`<span class="spinner-sm"></span>`}
+          ${status === "rendering" && statusDetail}
           ${status === "updated" && statusDetail && `Updated ${statusDetail}`}
         </div>
       </div>
@@ -141,8 +215,13 @@ export function PreviewPanel({
         ${previewUrl
           ? html`
               <div class="preview-stage ${showStale ? "is-stale" : ""}">
-                <img class="preview-img" src=${previewUrl} alt="Chart preview" />
-                ${device === "social" &&
+                <img
+                  class="preview-img ${previewDensity < 1 ? "is-draft" : ""}"
+                  src=${previewUrl}
+                  srcset=${`${previewUrl} ${previewDensity}x`}
+                  alt=${animate ? "Animation preview" : "Chart preview"}
+                />
+                ${!animate && device === "social" &&
                 html`<div class="preview-device-note">Social card — no header/footer</div>`}
                 ${showStale &&
                 html`
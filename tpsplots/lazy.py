@@ -0,0 +1,107 @@
+"""Deferred imports for heavy modules.
+
+``import tpsplots`` and the CLI should start in milliseconds: ``tpsplots
+--version`` or ``validate`` never draw anything, so they should not pay for
+pyplot, pandas' plotting stack, every chart view, or optional dependencies
+such as pywaffle, squarify, geopandas, python-pptx, FastAPI or boto3. Those
+modules are named here as ``"module:attribute"`` strings and imported the
+first time they are used.
+
+* :func:`lazy_exports` builds a PEP 562 module ``__getattr__``/``__dir__``
+  pair so a package can keep its public names while importing them on first
+  access.
+* :class:`LazyRegistry` is a read-only mapping whose keys are known up front
+  and whose values are imported on lookup, used for ``VIEW_REGISTRY``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def import_target(target: str) -> Any:
+    """Import ``"package.module:attribute"`` and return the attribute."""
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute) if attribute else module
+
+
+def lazy_exports(
+    module_name: str, exports: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return ``(__getattr__, __dir__)`` resolving ``exports`` on first access.
+
+    Resolved values are stored in the module's globals, so each name is
+    imported once and later lookups are ordinary attribute access.
+
+    Example:
+        >>> __getattr__, __dir__ = lazy_exports(__name__, {"generate": "tpsplots.api:generate"})
+    """
+    import sys
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = import_target(target)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+class LazyRegistry(Mapping[str, T]):
+    """Read-only name -> object mapping that imports each object on first lookup.
+
+    Listing the keys (``list(registry)``, ``name in registry``) imports
+    nothing; ``registry[name]`` imports just that entry. ``values()`` and
+    ``items()`` import everything.
+
+    Example:
+        >>> views = LazyRegistry({"bar_plot": "tpsplots.views.bar_chart:BarChartView"})
+        >>> "bar_plot" in views  # no import yet
+        True
+        >>> views["bar_plot"].__name__
+        'BarChartView'
+    """
+
+    def __init__(self, targets: Mapping[str, str]) -> None:
+        self._targets = dict(targets)
+        self._loaded: dict[str, T] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> T:
+        try:
+            return self._loaded[name]
+        except KeyError:
+            pass
+        target = self._targets[name]
+        with self._lock:
+            if name not in self._loaded:
+                self._loaded[name] = import_target(target)
+            return self._loaded[name]
+
+    def __contains__(self, name: object) -> bool:
+        # Mapping's default would look the value up, importing it.
+        return name in self._targets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._targets)!r})"
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether ``name`` has already been imported."""
+        return name in self._loaded
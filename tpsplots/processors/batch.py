@@ -0,0 +1,349 @@
+"""Batch chart generation shared by ``tpsplots generate`` and :func:`tpsplots.generate`.
+
+Each YAML file is one independent job. :func:`run_chart_job` runs a job
+in-process and folds any exception into a picklable :class:`ChartJobOutcome`,
+so serial and process-pool batches report through exactly the same code path.
+:func:`iter_chart_jobs` yields outcomes in input order either way, which keeps
+``[index/total]`` status lines and summaries identical whatever ``jobs`` is.
+
+Charts of one run share a :class:`ResolutionCache`, so twenty files pointing
+at the same sheet or controller method resolve it once. In a process pool
+each worker keeps its own cache for the lifetime of the pool.
+
+Given a :class:`BuildManifest`, runs are incremental: each job fingerprints
+its chart and skips rendering when the recorded fingerprint still matches.
+
+A :class:`ChartPool` keeps the worker processes, and with them their
+resolution caches, alive across batches (``generate --watch``).
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import traceback
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Literal
+
+from tpsplots import ensure_matplotlib
+from tpsplots.data_sources.http_cache import CacheStats, configure_http_cache, get_http_cache
+from tpsplots.exceptions import ConfigurationError, DataSourceError, RenderingError
+from tpsplots.processors.build_manifest import BuildManifest, ManifestEntry
+from tpsplots.processors.resolvers import ResolutionCache
+
+logger = logging.getLogger(__name__)
+
+# Per-process cache used by pool workers (set by _init_worker).
+_worker_cache: ResolutionCache | None = None
+# Latest ChartPool invalidation this worker has applied to its cache.
+_worker_generation = 0
+
+JobStatus = Literal["ok", "unchanged", "no_output", "config_error", "error", "unexpected"]
+
+
+@dataclass
+class ChartJobOutcome:
+    """Result of generating one YAML file, safe to send across processes.
+
+    ``status`` classifies the outcome the way the CLI exit codes need it:
+    ``config_error`` for :class:`ConfigurationError`, ``error`` for data or
+    rendering failures, ``unexpected`` for anything else; ``unchanged`` means
+    an incremental run skipped the chart and ``result`` lists its previously
+    recorded files. Exceptions are reduced to their message and formatted
+    traceback because arbitrary exception types do not always survive
+    pickling. ``http_stats`` holds the HTTP cache activity of this job alone,
+    so pool workers can report it.
+    """
+
+    yaml_path: Path
+    status: JobStatus
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    traceback: str | None = None
+    http_stats: CacheStats | None = None
+    fingerprint: str | None = None
+
+    @property
+    def files(self) -> list[str]:
+        """Output paths reported by the view (empty unless the job succeeded)."""
+        if isinstance(self.result, dict) and "files" in self.result:
+            return [str(path) for path in self.result["files"]]
+        return []
+
+
+def run_chart_job(
+    yaml_path: Path,
+    outdir: Path,
+    processor_cls: type | None = None,
+    data_cache: ResolutionCache | None = None,
+    *,
+    incremental: bool = False,
+    recorded: ManifestEntry | None = None,
+) -> ChartJobOutcome:
+    """Generate one chart and capture the outcome instead of raising.
+
+    Args:
+        yaml_path: YAML configuration file to render.
+        outdir: Output directory for the generated files.
+        processor_cls: Processor class to use; defaults to
+            :class:`~tpsplots.processors.yaml_chart_processor.YAMLChartProcessor`.
+        data_cache: Resolution cache shared with the rest of the batch.
+        incremental: Fingerprint the chart (when the processor supports it)
+            so the caller can record it.
+        recorded: Manifest entry from the previous run; rendering is skipped
+            when it is still current.
+    """
+    if processor_cls is None:
+        from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+
+        processor_cls = YAMLChartProcessor
+
+    http_cache = get_http_cache()
+    stats_before = replace(http_cache.stats)
+    fingerprint = None
+    unchanged = False
+    try:
+        processor = processor_cls(yaml_path, outdir=outdir, data_cache=data_cache)
+        if incremental and hasattr(processor, "fingerprint"):
+            fingerprint = processor.fingerprint()
+            unchanged = recorded is not None and recorded.is_current(fingerprint)
+        result = {"files": list(recorded.files)} if unchanged else processor.generate_chart()
+    except ConfigurationError as e:
+        outcome = _failed(yaml_path, "config_error", e)
+    except (DataSourceError, RenderingError) as e:
+        outcome = _failed(yaml_path, "error", e)
+    except Exception as e:  # Boundary: any other failure is reported, not raised
+        outcome = _failed(yaml_path, "unexpected", e)
+    else:
+        outcome = ChartJobOutcome(
+            yaml_path=yaml_path,
+            status="unchanged" if unchanged else "ok" if result else "no_output",
+            result=result if isinstance(result, dict) else None,
+            fingerprint=fingerprint,
+        )
+
+    outcome.http_stats = http_cache.stats - stats_before
+    return outcome
+
+
+def _failed(yaml_path: Path, status: JobStatus, exc: BaseException) -> ChartJobOutcome:
+    return ChartJobOutcome(
+        yaml_path=yaml_path,
+        status=status,
+        error=str(exc),
+        traceback="".join(traceback.format_exception(exc)),
+    )
+
+
+def resolve_jobs(jobs: int, total: int) -> int:
+    """Clamp a requested worker count; ``0`` means one worker per CPU."""
+    if jobs < 0:
+        raise ConfigurationError(f"jobs must be >= 0, got {jobs}")
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, total))
+
+
+def _init_worker(log_level: int | None, http_settings: dict[str, Any]) -> None:
+    """Prepare a freshly spawned worker interpreter.
+
+    Workers are spawned rather than forked so none of the parent's pyplot
+    figures or font cache state leaks in. Each one selects the Agg backend,
+    registers the Poppins fonts, and sets up logging, the parent's HTTP cache
+    settings and its own resolution cache.
+    """
+    global _worker_cache
+    ensure_matplotlib()
+    _worker_cache = ResolutionCache()
+    configure_http_cache(**http_settings)
+    if log_level is not None:
+        logging.basicConfig(level=log_level, format="%(message)s", force=True)
+        logging.getLogger("matplotlib.category").setLevel(logging.WARNING)
+
+
+def _run_in_worker(
+    yaml_path: Path,
+    outdir: Path,
+    incremental: bool,
+    recorded: ManifestEntry | None,
+    changed_files: dict[Path, int] | None = None,
+) -> ChartJobOutcome:
+    global _worker_generation
+    if changed_files:
+        # Catch up on every invalidation since this worker's last job, including
+        # batches in which it rendered nothing.
+        stale = [
+            path for path, generation in changed_files.items() if generation > _worker_generation
+        ]
+        if stale:
+            _worker_cache.invalidate_files(stale)
+        _worker_generation = max(changed_files.values())
+    return run_chart_job(
+        yaml_path, outdir, data_cache=_worker_cache, incremental=incremental, recorded=recorded
+    )
+
+
+def _record(manifest: BuildManifest | None, outcome: ChartJobOutcome) -> ChartJobOutcome:
+    """Update ``manifest`` from a finished job; failed charts are forgotten."""
+    if manifest is None:
+        return outcome
+    if outcome.status in ("ok", "unchanged") and outcome.fingerprint and outcome.files:
+        manifest.record(outcome.yaml_path, outcome.fingerprint, outcome.files)
+    else:
+        manifest.forget(outcome.yaml_path)
+    return outcome
+
+
+class ChartPool:
+    """Spawned worker processes that outlive a single batch.
+
+    Each worker keeps its resolution cache between batches, so with
+    ``generate --watch --jobs N`` a rebuild neither respawns interpreters nor
+    re-resolves unchanged data. :meth:`invalidate` records local data files
+    that changed; every job carries that record, so the worker picking it up
+    drops the affected cache entries first, even if it rendered nothing in
+    the batch where the file changed.
+
+    Example:
+        >>> with ChartPool(workers=4) as pool:
+        ...     for outcome in iter_chart_jobs(yaml_files, outdir, pool=pool):
+        ...         ...
+    """
+
+    def __init__(self, workers: int, log_level: int | None = None) -> None:
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(log_level, get_http_cache().settings()),
+        )
+        # Changed file -> invalidation generation it was last reported in.
+        self._changed_files: dict[Path, int] = {}
+        self._generation = 0
+
+    def __enter__(self) -> ChartPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def invalidate(self, paths: Iterable[Path]) -> None:
+        """Have workers drop cached data read from any of ``paths``."""
+        paths = [Path(path).resolve() for path in paths]
+        if not paths:
+            return
+        self._generation += 1
+        for path in paths:
+            self._changed_files[path] = self._generation
+
+    def submit(
+        self, yaml_path: Path, outdir: Path, incremental: bool, recorded: ManifestEntry | None
+    ) -> Future:
+        return self._executor.submit(
+            _run_in_worker, yaml_path, outdir, incremental, recorded, dict(self._changed_files)
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown()
+
+
+def iter_chart_jobs(
+    yaml_files: Sequence[Path],
+    outdir: Path,
+    *,
+    jobs: int = 1,
+    processor_cls: type | None = None,
+    log_level: int | None = None,
+    on_start: Callable[[Path], None] | None = None,
+    data_cache: ResolutionCache | None = None,
+    manifest: BuildManifest | None = None,
+    force: bool = False,
+    pool: ChartPool | None = None,
+) -> Iterator[ChartJobOutcome]:
+    """Generate every YAML file, yielding outcomes in input order.
+
+    With ``jobs == 1`` each file is rendered in this process as the caller
+    iterates, so ``processor_cls`` (and monkeypatched processors in tests) is
+    honoured. With more workers, files are rendered in a spawned process pool;
+    ``processor_cls`` cannot cross the process boundary and is ignored, and
+    each worker uses the default processor.
+
+    Args:
+        yaml_files: YAML configuration files to render.
+        outdir: Output directory shared by every job.
+        jobs: Worker processes to use (``0`` = one per CPU).
+        processor_cls: Processor class for in-process rendering.
+        log_level: Logging level to configure in worker processes.
+        on_start: Optional callback invoked with each file as its job starts
+            (serial) or is submitted to the pool (parallel).
+        data_cache: Resolution cache for in-process rendering; a fresh one is
+            created for the run when omitted.
+        manifest: Build manifest for an incremental run. Unchanged charts
+            are skipped, and the manifest is updated and saved once the
+            iteration finishes (or is abandoned).
+        force: With a manifest, re-render every chart but still record the
+            new fingerprints.
+        pool: Long-lived worker pool to render on instead of a pool created
+            for this call; ``jobs`` is then ignored.
+    """
+    workers = resolve_jobs(jobs, len(yaml_files)) if yaml_files else 1
+    incremental = manifest is not None
+
+    def recorded_for(yaml_file: Path) -> ManifestEntry | None:
+        return manifest.entry_for(yaml_file) if incremental and not force else None
+
+    try:
+        if pool is not None:
+            yield from _iter_pool(yaml_files, outdir, pool, on_start, manifest, recorded_for)
+        elif workers == 1:
+            cache = data_cache if data_cache is not None else ResolutionCache()
+            for yaml_file in yaml_files:
+                if on_start is not None:
+                    on_start(yaml_file)
+                outcome = run_chart_job(
+                    yaml_file,
+                    outdir,
+                    processor_cls,
+                    cache,
+                    incremental=incremental,
+                    recorded=recorded_for(yaml_file),
+                )
+                yield _record(manifest, outcome)
+        else:
+            logger.info("Rendering %d file(s) with %d worker processes", len(yaml_files), workers)
+            with ChartPool(workers, log_level) as batch_pool:
+                yield from _iter_pool(
+                    yaml_files, outdir, batch_pool, on_start, manifest, recorded_for
+                )
+    finally:
+        if manifest is not None:
+            manifest.save()
+
+
+def _iter_pool(
+    yaml_files: Sequence[Path],
+    outdir: Path,
+    pool: ChartPool,
+    on_start: Callable[[Path], None] | None,
+    manifest: BuildManifest | None,
+    recorded_for: Callable[[Path], ManifestEntry | None],
+) -> Iterator[ChartJobOutcome]:
+    """Render ``yaml_files`` on ``pool``, yielding in input order."""
+    futures = []
+    for yaml_file in yaml_files:
+        if on_start is not None:
+            on_start(yaml_file)
+        futures.append(
+            pool.submit(yaml_file, outdir, manifest is not None, recorded_for(yaml_file))
+        )
+    for yaml_file, future in zip(yaml_files, futures, strict=True):
+        try:
+            outcome = future.result()
+        except Exception as e:  # Boundary: a crashed worker fails only its own file
+            outcome = _failed(yaml_file, "unexpected", e)
+        yield _record(manifest, outcome)
@@ -0,0 +1,181 @@
+"""Build manifest for incremental ``tpsplots generate`` runs.
+
+The manifest lives in the output directory (``.tpsplots-manifest.json``) and
+records, for every YAML file rendered there, a fingerprint of everything that
+determines the chart's output and the files it produced. The fingerprint
+covers:
+
+* the validated (template-resolved) YAML configuration,
+* a hash of the resolved data, so CSV edits, new sheet revisions (fetched
+  through the revalidating HTTP cache) and changed controller results all
+  count as changes,
+* the matplotlib style file, and
+* the tpsplots version.
+
+A chart whose fingerprint matches its recorded entry, and whose recorded
+files all still exist, is skipped and its previous outputs are reported.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = ".tpsplots-manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """Recorded fingerprint and output files for one YAML file."""
+
+    fingerprint: str
+    files: list[str] = field(default_factory=list)
+
+    def is_current(self, fingerprint: str) -> bool:
+        """True when ``fingerprint`` matches and every recorded file exists."""
+        return (
+            fingerprint == self.fingerprint
+            and bool(self.files)
+            and all(Path(path).exists() for path in self.files)
+        )
+
+
+class BuildManifest:
+    """Fingerprints and outputs of the charts rendered into one directory.
+
+    Example:
+        >>> manifest = BuildManifest.load(Path("charts"))
+        >>> entry = manifest.entry_for(Path("yaml/budget.yaml"))
+        >>> manifest.record(Path("yaml/budget.yaml"), fingerprint, files)
+        >>> manifest.save()
+    """
+
+    def __init__(self, path: Path, entries: dict[str, ManifestEntry] | None = None) -> None:
+        self.path = path
+        self.entries: dict[str, ManifestEntry] = entries or {}
+
+    @classmethod
+    def load(cls, outdir: Path) -> BuildManifest:
+        """Read the manifest in ``outdir``; a missing or unreadable one is empty."""
+        path = Path(outdir) / MANIFEST_NAME
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable build manifest {path}: {e}")
+            return cls(path)
+
+        if payload.get("version") != MANIFEST_VERSION:
+            return cls(path)
+        entries = {
+            key: ManifestEntry(fingerprint=value["fingerprint"], files=list(value["files"]))
+            for key, value in payload.get("charts", {}).items()
+        }
+        return cls(path, entries)
+
+    @staticmethod
+    def key_for(yaml_path: Path) -> str:
+        return str(Path(yaml_path).resolve())
+
+    def entry_for(self, yaml_path: Path) -> ManifestEntry | None:
+        return self.entries.get(self.key_for(yaml_path))
+
+    def record(self, yaml_path: Path, fingerprint: str, files: list[str]) -> None:
+        self.entries[self.key_for(yaml_path)] = ManifestEntry(fingerprint, list(files))
+
+    def forget(self, yaml_path: Path) -> None:
+        self.entries.pop(self.key_for(yaml_path), None)
+
+    def save(self) -> None:
+        """Write the manifest atomically; failures are logged, never raised."""
+        if not self.entries and not self.path.exists():
+            return
+        payload = {
+            "version": MANIFEST_VERSION,
+            "charts": {key: asdict(entry) for key, entry in sorted(self.entries.items())},
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning(f"Could not write build manifest {self.path}: {e}")
+
+
+def chart_fingerprint(config: Any, data: dict[str, Any]) -> str:
+    """Hash a validated chart config and its resolved data with the build environment.
+
+    Args:
+        config: The validated Pydantic chart configuration.
+        data: The resolved data dict the chart renders from.
+
+    Returns:
+        A hex digest that changes whenever the rendered output could change.
+    """
+    from tpsplots import TPS_STYLE_FILE, __version__
+
+    digest = hashlib.sha256()
+    digest.update(f"tpsplots {__version__}\0".encode())
+    digest.update(f"style {_file_digest(str(TPS_STYLE_FILE))}\0".encode())
+    # Python-mode dump: resolved templates may have put arrays in the config.
+    _hash_value(digest, config.model_dump())
+    _hash_value(digest, data)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _file_digest(path: str) -> str:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _hash_value(digest: Any, value: Any) -> None:
+    """Feed a stable representation of ``value`` into ``digest``."""
+    if isinstance(value, pd.DataFrame):
+        digest.update(b"frame")
+        digest.update(repr([(str(c), str(t)) for c, t in value.dtypes.items()]).encode())
+        _hash_pandas(digest, value)
+    elif isinstance(value, (pd.Series, pd.Index)):
+        digest.update(f"series {value.name!s} {value.dtype}".encode())
+        _hash_pandas(digest, value)
+    elif isinstance(value, np.ndarray):
+        digest.update(f"array {value.dtype} {value.shape}".encode())
+        if value.dtype.hasobject:
+            digest.update(repr(value.tolist()).encode())
+        else:
+            digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b"dict")
+        for key in sorted(value, key=str):
+            digest.update(f"{key!s}\0".encode())
+            _hash_value(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"seq {len(value)}".encode())
+        for item in value:
+            _hash_value(digest, item)
+    else:
+        digest.update(f"{type(value).__name__} {value!r}\0".encode())
+
+
+def _hash_pandas(digest: Any, value: pd.DataFrame | pd.Series | pd.Index) -> None:
+    try:
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+    except TypeError:
+        # Unhashable cells (lists, dicts); fall back to the full text form.
+        digest.update(repr(pd.DataFrame(value).to_dict("split")).encode())
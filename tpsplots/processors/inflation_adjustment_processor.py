@@ -119,33 +119,36 @@ class InflationAdjustmentProcessor:
         df = df.copy()
         fy_col = self.config.fiscal_year_column
 
-        # Apply NNSI adjustments
-        if self._nnsi and self.config.nnsi_columns:
-            for col in self.config.nnsi_columns:
-                if col not in df.columns:
-                    continue
-                output_col = f"{col}_adjusted_nnsi"
-                df[output_col] = df.apply(
-                    lambda row, c=col: (
-                        self._nnsi.calc(row[fy_col], row[c]) if pd.notna(row[c]) else np.nan
-                    ),
-                    axis=1,
-                )
-
-        # Apply GDP adjustments
-        if self._gdp and self.config.gdp_columns:
-            for col in self.config.gdp_columns:
-                if col not in df.columns:
-                    continue
-                output_col = f"{col}_adjusted_gdp"
-                df[output_col] = df.apply(
-                    lambda row, c=col: (
-                        self._gdp.calc(row[fy_col], row[c]) if pd.notna(row[c]) else np.nan
-                    ),
-                    axis=1,
-                )
+        adjustments = (
+            (self._nnsi, self.config.nnsi_columns, "nnsi"),
+            (self._gdp, self.config.gdp_columns, "gdp"),
+        )
+        for adjuster, columns, suffix in adjustments:
+            if adjuster is None:
+                continue
+            present = [col for col in columns if col in df.columns]
+            if not present:
+                continue
+            df[[f"{col}_adjusted_{suffix}" for col in present]] = self._adjust_columns(
+                adjuster, df[fy_col], df[present]
+            )
 
         # Store metadata in attrs for downstream processors
         df.attrs["inflation_target_year"] = self.config.target_year
 
         return df
+
+    @staticmethod
+    def _adjust_columns(
+        adjuster: NNSI | GDP, fiscal_years: pd.Series, values: pd.DataFrame
+    ) -> np.ndarray:
+        """Multiply every column of *values* by its row's multiplier in one pass.
+
+        Fiscal years are only looked up for rows with at least one value, so
+        missing-year warnings fire for exactly the rows ``calc`` would see.
+        """
+        block = values.to_numpy(dtype=float)
+        needed = ~np.isnan(block).all(axis=1)
+        multipliers = np.ones(len(block))
+        multipliers[needed] = adjuster.multipliers(fiscal_years[needed])
+        return block * multipliers[:, np.newaxis]
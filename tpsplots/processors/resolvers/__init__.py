@@ -5,6 +5,7 @@ from tpsplots.processors.resolvers.data_resolver import DataResolver
 from tpsplots.processors.resolvers.metadata_resolver import MetadataResolver
 from tpsplots.processors.resolvers.parameter_resolver import ParameterResolver
 from tpsplots.processors.resolvers.reference_resolver import ReferenceResolver
+from tpsplots.processors.resolvers.resolution_cache import ResolutionCache
 
 __all__ = [
     "ColorResolver",
@@ -12,4 +13,5 @@ __all__ = [
     "MetadataResolver",
     "ParameterResolver",
     "ReferenceResolver",
+    "ResolutionCache",
 ]
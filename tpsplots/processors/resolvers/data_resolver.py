@@ -7,7 +7,7 @@ import importlib.util
 import inspect
 import logging
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
@@ -21,6 +21,9 @@ from tpsplots.processors.inflation_adjustment_processor import (
     InflationAdjustmentProcessor,
 )
 
+if TYPE_CHECKING:
+    from tpsplots.processors.resolvers.resolution_cache import ResolutionCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,12 +31,16 @@ class DataResolver:
     """Resolves data sources from YAML configuration."""
 
     @staticmethod
-    def resolve(data_source: DataSourceConfig) -> dict[str, Any]:
+    def resolve(
+        data_source: DataSourceConfig, cache: ResolutionCache | None = None
+    ) -> dict[str, Any]:
         """
         Resolve the data source and return the processed data.
 
         Args:
             data_source: The data source configuration from YAML
+            cache: Optional batch-scoped cache; identical data sections in the
+                same run are then fetched and processed only once
 
         Returns:
             Dictionary containing the resolved data
@@ -41,6 +48,9 @@ class DataResolver:
         Raises:
             DataSourceError: If data cannot be loaded from the source
         """
+        if cache is not None:
+            return cache.get_or_resolve(data_source, DataResolver.resolve)
+
         source = data_source.source.strip()
         if not source:
             raise DataSourceError("Data source 'source' must not be empty")
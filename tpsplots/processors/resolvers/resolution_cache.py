@@ -0,0 +1,159 @@
+"""Batch-scoped cache of resolved data sources.
+
+A batch run (``tpsplots generate yaml/``, ``tpsplots animate``,
+:func:`tpsplots.generate`) often points many YAML files at the same Google
+Sheet or controller method. :class:`ResolutionCache` lets every chart in the
+run share one :meth:`DataResolver.resolve` call per distinct data section.
+
+Entries are never handed out directly. Each lookup returns a fresh
+copy-on-write view of the cached result: DataFrames and Series are shallow
+copies under pandas copy-on-write, NumPy arrays are read-only views, and
+plain containers are rebuilt. One chart can therefore reshape its data
+without another chart ever seeing the change.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable, Iterable
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from tpsplots.models.data_sources import DataSourceConfig
+from tpsplots.views.render_params import PANDAS_COW
+
+logger = logging.getLogger(__name__)
+
+
+class ResolutionCache:
+    """Share resolved data sources across the charts of one batch run.
+
+    Keys are built from the normalized data section (parsed source kind and
+    target, ``params`` and ``calculate_inflation``), so spelling differences
+    such as ``controller:module.method`` vs ``module.method`` or an explicit
+    default value resolve to the same entry. Failed resolutions are not
+    cached; the next chart retries the source.
+
+    Example:
+        >>> cache = ResolutionCache()
+        >>> data = DataResolver.resolve(config, cache=cache)
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, data_source: DataSourceConfig) -> bool:
+        return self.key_for(data_source) in self._entries
+
+    @staticmethod
+    def key_for(data_source: DataSourceConfig) -> str:
+        """Return the normalized cache key for a data section."""
+        from tpsplots.processors.resolvers.data_resolver import DataResolver
+
+        kind, target, method = DataResolver._parse_source(data_source.source)
+        if kind in ("csv", "controller_path"):
+            target = str(Path(target).expanduser().resolve())
+        payload = {
+            "kind": kind,
+            "target": target,
+            "method": method,
+            "params": _dump(data_source.params),
+            "calculate_inflation": _dump(data_source.calculate_inflation),
+        }
+        return json.dumps(payload, sort_keys=True, default=str)
+
+    def get_or_resolve(
+        self,
+        data_source: DataSourceConfig,
+        resolve: Callable[[DataSourceConfig], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return a private view of the cached result, resolving on a miss.
+
+        Args:
+            data_source: The data section to resolve.
+            resolve: Called with ``data_source`` on a cache miss.
+
+        Returns:
+            A copy-on-write view of the resolved data dict.
+        """
+        key = self.key_for(data_source)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = resolve(data_source)
+            self._entries[key] = entry
+        else:
+            self.hits += 1
+            logger.info("Reusing resolved data for %s", data_source.source)
+        return share(entry)
+
+    def invalidate(self, data_source: DataSourceConfig | None = None) -> None:
+        """Drop one entry, or every entry when ``data_source`` is ``None``."""
+        if data_source is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(self.key_for(data_source), None)
+
+    def invalidate_files(self, paths: Iterable[Path]) -> int:
+        """Drop the entries read from any of the local files ``paths``.
+
+        Covers ``csv:`` files and ``controller:/path.py:method`` modules;
+        entries for remote or built-in sources are kept.
+
+        Returns:
+            The number of entries dropped.
+        """
+        stale = {str(Path(path).expanduser().resolve()) for path in paths}
+        keys = [
+            key
+            for key in self._entries
+            if (source := json.loads(key))["kind"] in ("csv", "controller_path")
+            and source["target"] in stale
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+
+def _dump(model: Any) -> Any:
+    return None if model is None else model.model_dump(mode="json", exclude_defaults=True)
+
+
+def share(value: Any) -> Any:
+    """Return a view of ``value`` that cannot mutate the original.
+
+    DataFrames and Series become copy-on-write shallow copies, NumPy arrays
+    become read-only views (pandas 3 already returns read-only arrays from
+    ``.values``), dicts/lists/tuples are rebuilt recursively, and immutable
+    values (scalars, pandas Indexes) pass through. Anything else is
+    deep-copied.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=not PANDAS_COW)
+    if isinstance(value, pd.Index):
+        return value
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(value, dict):
+        return {key: share(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [share(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(share(item) for item in value)
+    if value is None or isinstance(
+        value, (str, bytes, int, float, complex, bool, np.generic, pd.Timestamp)
+    ):
+        return value
+    return deepcopy(value)
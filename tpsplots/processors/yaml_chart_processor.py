@@ -1,6 +1,7 @@
 """YAML-driven chart generation processor (v2.0 spec)."""
 
 import logging
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, ClassVar
 
@@ -9,8 +10,9 @@ import yaml
 from tpsplots.exceptions import ConfigurationError, DataSourceError
 from tpsplots.models import YAMLChartConfig
 from tpsplots.models.data_sources import DataSourceConfig
-from tpsplots.processors.render_pipeline import build_render_context
-from tpsplots.processors.resolvers import DataResolver
+from tpsplots.processors.build_manifest import chart_fingerprint
+from tpsplots.processors.render_pipeline import RenderContext, build_render_context
+from tpsplots.processors.resolvers import DataResolver, ResolutionCache
 from tpsplots.processors.resolvers.reference_resolver import ReferenceResolver
 from tpsplots.views import VIEW_REGISTRY
 
@@ -18,31 +20,49 @@ logger = logging.getLogger(__name__)
 
 
 class YAMLChartProcessor:
-    """Processes YAML configuration files to generate charts (v2.0 spec)."""
+    """Processes YAML configuration files to generate charts (v2.0 spec).
 
-    # Use the centralized registry from views module
-    VIEW_REGISTRY: ClassVar[dict[str, type]] = VIEW_REGISTRY
+    Each step of the pipeline is a public method — :meth:`load_yaml`,
+    :meth:`resolve_data`, :meth:`resolve_templates`, :meth:`validate_config`
+    and :meth:`render_context` — so callers such as the benchmarks can
+    observe them one at a time.
+    """
 
-    def __init__(self, yaml_path: str | Path, outdir: Path | None = None):
+    # Use the centralized registry from views module
+    VIEW_REGISTRY: ClassVar[Mapping[str, type]] = VIEW_REGISTRY
+
+    def __init__(
+        self,
+        yaml_path: str | Path,
+        outdir: Path | None = None,
+        data_cache: ResolutionCache | None = None,
+        parallel_variants: bool = False,
+    ):
         """
         Initialize the YAML chart processor.
 
         Args:
             yaml_path: Path to YAML configuration file
             outdir: Output directory for charts (default: charts/)
+            data_cache: Batch-scoped cache shared with the other charts of
+                the same run, so a common data source is resolved once
+            parallel_variants: Render the desktop/mobile/social variants in
+                worker processes (see ``ChartView.generate_chart``)
         """
         self.yaml_path = Path(yaml_path)
         self.outdir = outdir or Path("charts")
+        self.data_cache = data_cache
+        self.parallel_variants = parallel_variants
 
         # Load YAML, resolve any {{...}} template references, then validate
-        raw_config = self._load_yaml()
+        raw_config = self.load_yaml()
         self.data: dict[str, Any] | None = None
-        raw_config = self._resolve_templates(raw_config)
-        self.config = self._validate_config(raw_config)
+        raw_config = self.resolve_templates(raw_config)
+        self.config = self.validate_config(raw_config)
 
         self.view = None
 
-    def _load_yaml(self) -> dict[str, Any]:
+    def load_yaml(self) -> dict[str, Any]:
         """Load and parse YAML configuration file."""
         try:
             with open(self.yaml_path, encoding="utf-8") as f:
@@ -54,7 +74,7 @@ class YAMLChartProcessor:
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML syntax in {self.yaml_path}: {e}") from e
 
-    def _resolve_templates(self, raw_config: dict[str, Any]) -> dict[str, Any]:
+    def resolve_templates(self, raw_config: dict[str, Any]) -> dict[str, Any]:
         """Resolve {{...}} template references before Pydantic validation.
 
         Loads the data source and substitutes all ``{{...}}`` references in
@@ -84,7 +104,7 @@ class YAMLChartProcessor:
 
         # Load data
         try:
-            self.data = DataResolver.resolve(data_source)
+            self.resolve_data(data_source)
         except DataSourceError:
             raise
         except Exception as e:  # Boundary: wrap as ConfigurationError
@@ -96,7 +116,7 @@ class YAMLChartProcessor:
         resolved_chart = ReferenceResolver.resolve(dict(chart_section), self.data)
         return {**raw_config, "chart": resolved_chart}
 
-    def _validate_config(self, raw_config: dict[str, Any]) -> YAMLChartConfig:
+    def validate_config(self, raw_config: dict[str, Any]) -> YAMLChartConfig:
         """Validate the YAML configuration using Pydantic."""
         try:
             config = YAMLChartConfig(**raw_config)
@@ -131,6 +151,8 @@ class YAMLChartProcessor:
             raise ConfigurationError(
                 f"Unknown chart type: {chart_type}. Available types: {available}"
             )
+        if self.parallel_variants:
+            return view_class(outdir=self.outdir, parallel_variants=True)
         return view_class(outdir=self.outdir)
 
     def prepare_render(self):
@@ -144,17 +166,39 @@ class YAMLChartProcessor:
             tuple: ``(RenderContext, ChartView)`` — the render context and the
             instantiated view for ``ctx.chart_type_v1``.
         """
+        self.resolve_data()
+        ctx = self.render_context()
+
+        # Get view for the resolved chart type
+        self.view = self._get_view(ctx.chart_type_v1)
+        return ctx, self.view
+
+    def resolve_data(self, data_source: DataSourceConfig | None = None) -> dict[str, Any]:
+        """Resolve the chart's data source once; later calls return the same data.
+
+        Args:
+            data_source: Data section to resolve; defaults to the validated
+                config's. Template resolution passes it before validation.
+        """
         # Resolve data source (skip if already loaded during template resolution)
         if self.data is None:
             logger.info("Resolving data source...")
-            self.data = DataResolver.resolve(self.config.data)
+            source = data_source if data_source is not None else self.config.data
+            self.data = DataResolver.resolve(source, cache=self.data_cache)
+        return self.data
 
-        # Build render context (shared with editor preview)
-        ctx = build_render_context(self.config, self.data, log_conflicts=True)
+    def render_context(self) -> RenderContext:
+        """Build the render context (shared with editor preview), resolving data if needed."""
+        return build_render_context(self.config, self.resolve_data(), log_conflicts=True)
 
-        # Get view for the resolved chart type
-        self.view = self._get_view(ctx.chart_type_v1)
-        return ctx, self.view
+    def fingerprint(self) -> str:
+        """Content hash of this chart's config, resolved data and build environment.
+
+        Used by incremental ``generate`` runs to skip charts whose output
+        cannot have changed. Resolves the data source if needed; the result
+        is reused by a subsequent :meth:`generate_chart`.
+        """
+        return chart_fingerprint(self.config, self.resolve_data())
 
     def generate_chart(self) -> dict[str, Any]:
         """Generate the chart based on the YAML configuration."""
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import io
 import re
-from copy import deepcopy
 from pathlib import Path
 from typing import Any, Literal
 
@@ -25,6 +24,7 @@ from tpsplots.processors.resolvers import (
     ParameterResolver,
 )
 from tpsplots.processors.yaml_chart_processor import YAMLChartProcessor
+from tpsplots.views.body_cache import ChartBodyCache
 
 PreviewDevice = Literal["desktop", "mobile"]
 
@@ -41,6 +41,9 @@ class TextEditSession:
         self.metadata: dict[str, Any] = {}
         self.parameters: dict[str, Any] = {}
         self._view = None
+        # Text edits only change metadata, so every render after the first
+        # per device reuses the drawn chart body.
+        self._body_cache = ChartBodyCache()
         self._prepare_render_context()
 
     def _prepare_render_context(self) -> None:
@@ -94,7 +97,8 @@ class TextEditSession:
         fig = self._view.create_figure(
             metadata=metadata,
             device=device,
-            **deepcopy(self.parameters),
+            body_cache=self._body_cache,
+            **self.parameters,
         )
         try:
             svg_buffer = io.StringIO()
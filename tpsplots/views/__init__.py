@@ -1,36 +1,48 @@
-"""Chart views for the TPS Plots package."""
+"""Chart views for the TPS Plots package.
 
-from .area_chart import AreaChartView
-from .bar_chart import BarChartView
-from .chart_view import ChartView
-from .donut_chart import DonutChartView
-from .grouped_bar_chart import GroupedBarChartView
-from .line_chart import LineChartView
-from .line_subplots import LineSubplotsView
-from .lollipop_chart import LollipopChartView
-from .mixins import BarChartMixin
-from .scatter_chart import ScatterChartView
-from .stacked_bar_chart import StackedBarChartView
-from .treemap_chart import TreemapChartView
-from .us_map_pie_charts import USMapPieChartView
-from .waffle_chart import WaffleChartView
+View classes are imported on first use: ``VIEW_REGISTRY["waffle_plot"]``
+loads the waffle view (and pywaffle) without touching the other views.
+"""
+
+from tpsplots.lazy import LazyRegistry, lazy_exports
+
+_VIEW_CLASSES = {
+    "AreaChartView": "tpsplots.views.area_chart:AreaChartView",
+    "BarChartView": "tpsplots.views.bar_chart:BarChartView",
+    "ChartView": "tpsplots.views.chart_view:ChartView",
+    "DonutChartView": "tpsplots.views.donut_chart:DonutChartView",
+    "GroupedBarChartView": "tpsplots.views.grouped_bar_chart:GroupedBarChartView",
+    "LineChartView": "tpsplots.views.line_chart:LineChartView",
+    "LineSubplotsView": "tpsplots.views.line_subplots:LineSubplotsView",
+    "LollipopChartView": "tpsplots.views.lollipop_chart:LollipopChartView",
+    "BarChartMixin": "tpsplots.views.mixins:BarChartMixin",
+    "ScatterChartView": "tpsplots.views.scatter_chart:ScatterChartView",
+    "StackedBarChartView": "tpsplots.views.stacked_bar_chart:StackedBarChartView",
+    "TreemapChartView": "tpsplots.views.treemap_chart:TreemapChartView",
+    "USMapPieChartView": "tpsplots.views.us_map_pie_charts:USMapPieChartView",
+    "WaffleChartView": "tpsplots.views.waffle_chart:WaffleChartView",
+}
 
 # Centralized registry mapping chart type names to view classes
 # This is the single source of truth for available chart types
-VIEW_REGISTRY: dict[str, type[ChartView]] = {
-    "area_plot": AreaChartView,
-    "line_plot": LineChartView,
-    "scatter_plot": ScatterChartView,
-    "bar_plot": BarChartView,
-    "donut_plot": DonutChartView,
-    "lollipop_plot": LollipopChartView,
-    "stacked_bar_plot": StackedBarChartView,
-    "treemap_plot": TreemapChartView,
-    "waffle_plot": WaffleChartView,
-    "us_map_pie_plot": USMapPieChartView,
-    "line_subplots_plot": LineSubplotsView,
-    "grouped_bar_plot": GroupedBarChartView,
-}
+VIEW_REGISTRY: LazyRegistry[type] = LazyRegistry(
+    {
+        "area_plot": _VIEW_CLASSES["AreaChartView"],
+        "line_plot": _VIEW_CLASSES["LineChartView"],
+        "scatter_plot": _VIEW_CLASSES["ScatterChartView"],
+        "bar_plot": _VIEW_CLASSES["BarChartView"],
+        "donut_plot": _VIEW_CLASSES["DonutChartView"],
+        "lollipop_plot": _VIEW_CLASSES["LollipopChartView"],
+        "stacked_bar_plot": _VIEW_CLASSES["StackedBarChartView"],
+        "treemap_plot": _VIEW_CLASSES["TreemapChartView"],
+        "waffle_plot": _VIEW_CLASSES["WaffleChartView"],
+        "us_map_pie_plot": _VIEW_CLASSES["USMapPieChartView"],
+        "line_subplots_plot": _VIEW_CLASSES["LineSubplotsView"],
+        "grouped_bar_plot": _VIEW_CLASSES["GroupedBarChartView"],
+    }
+)
+
+__getattr__, __dir__ = lazy_exports(__name__, _VIEW_CLASSES)
 
 # Export these classes as the public API
 __all__ = [
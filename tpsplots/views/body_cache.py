@@ -0,0 +1,133 @@
+"""Reusable chart bodies for metadata-only preview re-renders.
+
+A view's ``_create_chart`` first draws the data — the chart *body* — and
+then calls ``_adjust_layout_for_header_footer``, which adds the header and
+footer and fits the axes between them; ``_create_chart_with_overlays``
+then places annotations. The body depends only on the chart parameters and
+the device style, never on the text in ``METADATA_FIELDS`` (title,
+subtitle, eyebrow, note, source, annotations). Editing one of those in a
+preview therefore does not need the data redrawn: ``ChartView.create_figure``
+with a :class:`ChartBodyCache` keeps a copy of each body as it was just
+before layout, and on the next render with the same parameters and device
+lays a fresh copy of it out with the new text.
+
+Views whose body depends on the final axes size (the treemap sizes its
+tiles to the laid-out axes) opt out with ``_REUSABLE_BODY = False``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import pickle
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from tpsplots.views.draw_stats import reset_draw_tracking
+
+if TYPE_CHECKING:
+    from tpsplots.views.chart_view import ChartView
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ChartBody:
+    """A pre-layout figure plus the metadata the body itself set.
+
+    ``metadata_updates`` holds entries ``_create_chart`` wrote into the
+    metadata dict (a ``title`` passed as a chart kwarg, say); they are
+    reapplied over the new metadata so a reused body renders exactly as a
+    fresh one would.
+    """
+
+    figure: Figure
+    metadata_updates: dict[str, Any]
+
+    @staticmethod
+    def snapshot(fig: Figure) -> Figure:
+        """Detached copy of ``fig`` as it is now."""
+        copy = deepcopy(fig)
+        # Copying a pyplot figure registers the copy with pyplot too.
+        plt.close(copy)
+        reset_draw_tracking(copy)
+        return copy
+
+    def restore(self) -> Figure:
+        """A new figure identical to the stored body, ready for layout."""
+        fig = deepcopy(self.figure)
+        FigureCanvasAgg(fig)
+        return fig
+
+
+class ChartBodyCache:
+    """Small LRU of chart bodies keyed by view, style, device and parameters.
+
+    Figures are large and their size is not cheaply measurable, so the
+    cache is bounded by entry count; a few entries cover the desktop,
+    mobile and social bodies of the chart being edited.
+
+    Example:
+        >>> cache = ChartBodyCache()
+        >>> fig = view.create_figure(metadata, device="mobile", body_cache=cache, **params)
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, ChartBody] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key_for(view: ChartView, device: str, params: dict[str, Any]) -> str | None:
+        """Hash of everything the body depends on, or ``None`` if not hashable.
+
+        Parameters are hashed by their pickled bytes; anything that cannot
+        be pickled (a callable formatter, say) makes the render uncacheable.
+        """
+        view_type = type(view)
+        try:
+            payload = pickle.dumps(
+                (view_type.__module__, view_type.__qualname__, view.style_file, device, params),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception as e:  # Boundary: any pickling failure means "do not cache"
+            logger.debug(f"Chart body not cached; parameters are not picklable: {e}")
+            return None
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> ChartBody | None:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: str, body: ChartBody) -> None:
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Entry count and hit/miss counters."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
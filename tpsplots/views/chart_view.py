@@ -6,7 +6,7 @@ import math
 import struct
 import textwrap
 import warnings
-from copy import deepcopy
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 from typing import ClassVar
@@ -15,16 +15,25 @@ import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.figure import Figure
 from matplotlib.ticker import FuncFormatter
 
-from tpsplots import TPS_STYLE_FILE
+from tpsplots import TPS_STYLE_FILE, ensure_matplotlib
 from tpsplots.colors import COLORS, TPS_COLORS, resolve_color
 from tpsplots.exceptions import RenderingError
+from tpsplots.views import variant_pool
+from tpsplots.views.body_cache import ChartBody
+from tpsplots.views.csv_export import CSV_CHUNK_ROWS, write_csv_rows
+from tpsplots.views.draw_stats import DrawStats, layout_pass, track_draws
 from tpsplots.views.mixins import AxisTickFormatMixin
+from tpsplots.views.render_params import RenderParams
 from tpsplots.views.style import tokens
 
 logger = logging.getLogger(__name__)
 
+# Agg backend and Poppins fonts; deferred from ``import tpsplots`` to the first view.
+ensure_matplotlib()
+
 
 class ChartView(AxisTickFormatMixin):
     """Base class for all chart views with shared functionality."""
@@ -270,20 +279,52 @@ class ChartView(AxisTickFormatMixin):
         "video_portrait": "VIDEO_PORTRAIT",
     }
 
-    def __init__(self, outdir: Path = Path("charts"), style_file=TPS_STYLE_FILE):
+    # Variants written by ``generate_chart``: (device, filename suffix, _save_chart options)
+    _VARIANTS: ClassVar[tuple[tuple[str, str, dict[str, bool]], ...]] = (
+        ("desktop", "_desktop", {"create_pptx": True}),
+        ("mobile", "_mobile", {"create_pptx": False}),
+        # Social card is PNG only, no header/footer
+        ("social", "_social", {"create_svg": False}),
+    )
+
+    # Whether everything _create_chart does before _adjust_layout_for_header_footer
+    # is independent of the header/footer size, so create_figure(body_cache=...)
+    # can lay a saved copy of it out again for new metadata text.
+    _REUSABLE_BODY: ClassVar[bool] = True
+    # Set by create_figure while capturing a body for its cache.
+    _body_capture: list[tuple[Figure, dict]] | None = None
+    # Rows of export data formatted and written at a time by _export_csv.
+    CSV_CHUNK_ROWS: ClassVar[int] = CSV_CHUNK_ROWS
+
+    def __init__(
+        self,
+        outdir: Path = Path("charts"),
+        style_file=TPS_STYLE_FILE,
+        parallel_variants: bool = False,
+    ):
         """
         Initialize the chart view with output directory and style.
 
         Args:
             outdir: Output directory for chart files
             style_file: Matplotlib style file path to use
+            parallel_variants: Render the desktop/mobile/social variants of
+                ``generate_chart`` in worker processes instead of one after
+                another
         """
         self.outdir = outdir
         self.outdir.mkdir(parents=True, exist_ok=True)
+        self.style_file = style_file
+        self.parallel_variants = parallel_variants
+        # Full and layout-only draws per device for the last in-process render
+        self.draw_stats: dict[str, DrawStats] = {}
+
+        self._apply_style()
 
-        # Apply style if provided
-        if style_file:
-            plt.style.use(style_file)
+    def _apply_style(self) -> None:
+        """Apply the view's matplotlib style file, if any."""
+        if self.style_file:
+            plt.style.use(self.style_file)
 
     def device_style(self, device: str) -> dict:
         """The style dict for ``device``, raising on unknown names.
@@ -298,7 +339,7 @@ class ChartView(AxisTickFormatMixin):
             raise ValueError(f"Unknown device {device!r}. Valid devices: {valid}.")
         return getattr(self, attr)
 
-    def create_figure(self, metadata, device="desktop", **kwargs):
+    def create_figure(self, metadata, device="desktop", body_cache=None, **kwargs):
         """Create a single chart figure for the given device.
 
         Unlike ``generate_chart``, this does not save files or create
@@ -309,6 +350,9 @@ class ChartView(AxisTickFormatMixin):
             metadata: Chart metadata dictionary
             device: ``"desktop"``, ``"mobile"``, ``"social"``,
                 ``"video_square"``, ``"video_landscape"``, or ``"video_portrait"``
+            body_cache: Optional ``ChartBodyCache``. When it holds the body for
+                these parameters and device, only the header, footer, layout
+                and annotations are redone for ``metadata``.
             **kwargs: Additional parameters for chart creation
 
         Returns:
@@ -316,9 +360,45 @@ class ChartView(AxisTickFormatMixin):
         """
         kwargs.pop("export_data", None)
         style = getattr(self, self._DEVICE_STYLES.get(device, "DESKTOP"))
-        chart_kwargs = self._clone_chart_kwargs(kwargs)
+        key = None
+        if body_cache is not None and self._REUSABLE_BODY:
+            key = body_cache.key_for(self, device, kwargs)
+        if key is not None and (body := body_cache.get(key)) is not None:
+            return self._layout_body(body, metadata, style)
+
+        chart_kwargs = RenderParams.of(kwargs).for_render()
         chart_kwargs["style"] = style
-        return self._create_chart_with_overlays(metadata, **chart_kwargs)
+        if key is None:
+            return self._create_chart_with_overlays(metadata, **chart_kwargs)
+
+        original_metadata = dict(metadata)
+        self._body_capture = []
+        try:
+            fig = self._create_chart_with_overlays(metadata, **chart_kwargs)
+        finally:
+            captured, self._body_capture = self._body_capture, None
+        if captured:
+            body_fig, body_metadata = captured[0]
+            updates = {
+                k: v
+                for k, v in body_metadata.items()
+                if k not in original_metadata or original_metadata[k] is not v
+            }
+            body_cache.put(key, ChartBody(body_fig, updates))
+        return fig
+
+    def _layout_body(self, body: ChartBody, metadata, style):
+        """Lay a cached chart body out with ``metadata``'s header, footer and annotations."""
+        fig = body.restore()
+        metadata = {**metadata, **body.metadata_updates}
+        track_draws(fig)
+        try:
+            self._adjust_layout_for_header_footer(fig, metadata, style)
+            self._apply_annotations(fig, metadata, style)
+            return fig
+        except Exception:
+            plt.close(fig)
+            raise
 
     def generate_chart(self, metadata, stem, **kwargs):
         """
@@ -338,29 +418,19 @@ class ChartView(AxisTickFormatMixin):
         generated_files: list[str] = []
 
         try:
-            # Create desktop version
-            desktop_kwargs = self._clone_chart_kwargs(kwargs)
-            desktop_kwargs["style"] = self.DESKTOP
-            desktop_fig = self._create_chart_with_overlays(metadata, **desktop_kwargs)
-            generated_files.extend(
-                self._save_chart(desktop_fig, f"{stem}_desktop", metadata, create_pptx=True)
-            )
-
-            # Create mobile version
-            mobile_kwargs = self._clone_chart_kwargs(kwargs)
-            mobile_kwargs["style"] = self.MOBILE
-            mobile_fig = self._create_chart_with_overlays(metadata, **mobile_kwargs)
-            generated_files.extend(
-                self._save_chart(mobile_fig, f"{stem}_mobile", metadata, create_pptx=False)
-            )
-
-            # Create social card version (PNG only, no header/footer)
-            social_kwargs = self._clone_chart_kwargs(kwargs)
-            social_kwargs["style"] = self.SOCIAL
-            social_fig = self._create_chart_with_overlays(metadata, **social_kwargs)
-            generated_files.extend(
-                self._save_chart(social_fig, f"{stem}_social", metadata, create_svg=False)
-            )
+            devices = [device for device, _, _ in self._VARIANTS]
+            params = RenderParams(kwargs)
+            if self.parallel_variants and variant_pool.picklable(self, metadata, params):
+                futures = variant_pool.submit_variants(self, metadata, stem, devices, params)
+                try:
+                    for future in futures:
+                        generated_files.extend(future.result())
+                except BrokenProcessPool:
+                    variant_pool.reset_variant_pool()
+                    raise
+            else:
+                for device in devices:
+                    generated_files.extend(self._render_variant(metadata, stem, device, params))
 
             # Export CSV if export_data is present
             if export_data is not None:
@@ -377,15 +447,18 @@ class ChartView(AxisTickFormatMixin):
         # ``_save_chart``; no caller consumes them, so only report the files.
         return {"files": generated_files}
 
-    @staticmethod
-    def _clone_chart_kwargs(kwargs: dict) -> dict:
-        """Clone nested container kwargs so desktop/mobile renders cannot mutate shared state."""
-        return {
-            key: deepcopy(value)
-            if isinstance(value, (pd.DataFrame, pd.Series, dict, list, tuple, set))
-            else value
-            for key, value in kwargs.items()
-        }
+    def _render_variant(self, metadata, stem, device, kwargs) -> list[str]:
+        """Build and save one ``generate_chart`` variant; returns its files."""
+        suffix, save_options = next(
+            (suffix, options) for name, suffix, options in self._VARIANTS if name == device
+        )
+        chart_kwargs = RenderParams.of(kwargs).for_render()
+        chart_kwargs["style"] = self.device_style(device)
+        fig = self._create_chart_with_overlays(metadata, **chart_kwargs)
+        files = self._save_chart(fig, f"{stem}{suffix}", metadata, **save_options)
+        if isinstance(fig, Figure):
+            self.draw_stats[device] = track_draws(fig)
+        return files
 
     def _create_chart(self, metadata, style, **kwargs):
         """
@@ -412,6 +485,9 @@ class ChartView(AxisTickFormatMixin):
         editor previews, right after the subclass builds the figure.
         """
         fig = self._create_chart(metadata, **chart_kwargs)
+        if isinstance(fig, Figure):
+            # Views that build their own figure are tracked from here on.
+            track_draws(fig)
         try:
             self._apply_annotations(fig, metadata, chart_kwargs.get("style"))
             return fig
@@ -590,9 +666,8 @@ class ChartView(AxisTickFormatMixin):
                 time_lim=0.4,
             )
 
-        # 3) One draw so bbox patches exist and every extent is final/exact.
-        fig.canvas.draw()
-        renderer = fig.canvas.get_renderer()
+        # 3) One layout pass so bbox patches exist and every extent is final/exact.
+        renderer = layout_pass(fig)
 
         # 4) Boxes + final box extents (used as arrow tails).
         dpi = fig.dpi
@@ -755,7 +830,9 @@ class ChartView(AxisTickFormatMixin):
         """
         figsize = kwargs.pop("figsize", style["figsize"])
         dpi = kwargs.pop("dpi", style["dpi"])
-        return plt.subplots(figsize=figsize, dpi=dpi)
+        fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
+        track_draws(fig)
+        return fig, ax
 
     def _export_csv(self, df, metadata, stem):
         """
@@ -772,9 +849,6 @@ class ChartView(AxisTickFormatMixin):
         if hasattr(df, "attrs"):
             export_note = df.attrs.get("export_note")
 
-        # Create a copy of the data to avoid modifying the original
-        csv_df = df.copy()
-
         # Prepare metadata rows
         meta_rows = []
 
@@ -797,7 +871,7 @@ class ChartView(AxisTickFormatMixin):
         meta_rows.append(["", ""])
 
         # Write metadata and data to CSV
-        with open(csv_path, "w", newline="") as f:
+        with open(csv_path, "w", newline="", buffering=1 << 20) as f:
             writer = csv.writer(f)
 
             # Write metadata rows
@@ -805,27 +879,9 @@ class ChartView(AxisTickFormatMixin):
                 writer.writerow(row)
 
             # Write column names and data, converting NaN to empty strings,
-            # formatting dates as YYYY-mm-dd, rounding floats to 2 significant
-            # digits, and ensuring integers export as integers
-            writer.writerow(csv_df.columns)
-            for _, row in csv_df.iterrows():
-                formatted_row = []
-                for val in row:
-                    if pd.isna(val):
-                        formatted_row.append("")
-                    elif hasattr(val, "strftime"):
-                        # Format datetime/date/Timestamp as YYYY-mm-dd (no time)
-                        formatted_row.append(val.strftime("%Y-%m-%d"))
-                    elif isinstance(val, (int, float, np.integer, np.floating)):
-                        if val == int(val):
-                            formatted_row.append(int(val))
-                        elif abs(val) > 1:
-                            formatted_row.append(round(val, 2))
-                        else:
-                            formatted_row.append(val)
-                    else:
-                        formatted_row.append(val)
-                writer.writerow(formatted_row)
+            # formatting dates as YYYY-mm-dd, rounding floats to 2 decimal
+            # places, and ensuring integers export as integers
+            write_csv_rows(writer, df, chunk_rows=self.CSV_CHUNK_ROWS)
 
         logger.debug(f"✓ saved {csv_path.name}")
         return csv_path
@@ -1251,7 +1307,7 @@ class ChartView(AxisTickFormatMixin):
 
         # Wrapping is deterministic in (text, size, weight, pixel width), and both
         # the header-measurement and header-render passes wrap the same strings —
-        # memoize so the second pass skips the full fig.canvas.draw() below.
+        # memoize so the second pass skips the probe measurements below.
         cache_key = (str(escaped_text), fontsize, fontweight, round(max_width_px, 3))
         if not hasattr(self, "_wrap_text_cache"):
             self._wrap_text_cache: dict = {}
@@ -1259,7 +1315,7 @@ class ChartView(AxisTickFormatMixin):
         if cached is not None:
             return cached
 
-        fig.canvas.draw()
+        # A probe's extent depends only on its text and font, so no draw is needed.
         renderer = fig.canvas.get_renderer()
         wrapped_lines: list[str] = []
         probe_kwargs = {"fontsize": fontsize, "alpha": 0.0}
@@ -1662,6 +1718,10 @@ class ChartView(AxisTickFormatMixin):
             metadata: Chart metadata dictionary
             style: Style dictionary (DESKTOP or MOBILE, etc)
         """
+        if self._body_capture == []:
+            # create_figure(body_cache=...) keeps the body as it is before layout.
+            self._body_capture.append((ChartBody.snapshot(fig), dict(metadata)))
+
         # Determine if header/footer should be displayed
         show_header = style.get("header") or metadata.get("header")
         show_footer = style.get("footer") or metadata.get("footer")
@@ -1727,8 +1787,7 @@ class ChartView(AxisTickFormatMixin):
             return
 
         for _ in range(2):
-            fig.canvas.draw()
-            renderer = fig.canvas.get_renderer()
+            renderer = layout_pass(fig)
             visual_bounds = self._visible_axes_fig_bboxes(fig, visible_axes, renderer)
             if not visual_bounds:
                 return
@@ -1777,8 +1836,7 @@ class ChartView(AxisTickFormatMixin):
         target_left, target_right = style.get("footer_extent", (0.01, 0.99))
 
         for _ in range(2):
-            fig.canvas.draw()
-            renderer = fig.canvas.get_renderer()
+            renderer = layout_pass(fig)
             visual_bounds = self._visible_axes_fig_bboxes(fig, visible_axes, renderer)
             if not visual_bounds:
                 return
@@ -0,0 +1,157 @@
+"""Column-wise formatting of chart data for CSV export.
+
+``ChartView._export_csv`` writes each cell as follows: missing values
+become empty, dates ``YYYY-mm-dd``, whole numbers integers, other numbers
+above 1 in magnitude are rounded to 2 decimals, and everything else is
+written as the csv module would. :func:`write_csv_rows` produces exactly
+those bytes a column at a time with NumPy and pandas, instead of
+inspecting every cell of every row in Python.
+
+Cells are typed the way ``DataFrame.iterrows`` sees them: a row takes the
+frame's common dtype, so in an all-numeric frame integer columns are
+formatted as floats, and a bool column next to a numeric one counts as
+the integers 1 and 0.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_extension_array_dtype
+
+# Rows formatted and written per step, bounding the memory held by
+# formatted strings for very large exports.
+CSV_CHUNK_ROWS = 100_000
+
+_DATE_FORMAT = "%Y-%m-%d"
+
+# Integers beyond int64 fall back to Python for their digits.
+_INT64_LIMIT = 2.0**63
+
+
+def _format_cell(value: Any) -> str:
+    """Format a single cell; the reference for every vectorized path."""
+    if pd.isna(value):
+        return ""
+    if hasattr(value, "strftime"):
+        return value.strftime(_DATE_FORMAT)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        if value == int(value):
+            return str(int(value))
+        if abs(value) > 1:
+            return str(round(value, 2))
+    return str(value)
+
+
+def _format_cells(values) -> np.ndarray:
+    return np.array([_format_cell(value) for value in values], dtype=object)
+
+
+def _format_ints(values: np.ndarray) -> np.ndarray:
+    return values.astype(str).astype(object)
+
+
+def _format_floats(values: np.ndarray) -> np.ndarray:
+    values = values.astype(np.float64, copy=False)
+    out = np.full(len(values), "", dtype=object)
+    finite = np.isfinite(values)
+    magnitude = np.abs(values)
+    whole = finite & (values == np.trunc(values))
+
+    small = whole & (magnitude < _INT64_LIMIT)
+    out[small] = values[small].astype(np.int64).astype(str)
+    large = whole & ~small
+    out[large] = [str(int(v)) for v in values[large].tolist()]
+
+    # Python's round() is correctly rounded; rint(x * 100) / 100 agrees with
+    # it unless x * 100 lands within a few ulps of a .5 tie, so only those
+    # go through Python.
+    fractional = finite & ~whole
+    rounding = fractional & (magnitude > 1)
+    scaled = values[rounding] * 100
+    exact = np.abs(scaled - np.floor(scaled) - 0.5) > 4 * np.abs(np.spacing(scaled))
+    rounded = np.rint(scaled) / 100
+    rounding_idx = np.flatnonzero(rounding)
+    out[rounding_idx[exact]] = rounded[exact].astype(str)
+    tie_idx = rounding_idx[~exact]
+    out[tie_idx] = [str(round(v, 2)) for v in values[tie_idx].tolist()]
+
+    kept = fractional & ~rounding
+    out[kept] = values[kept].astype(str)
+    infinite = np.isinf(values)
+    out[infinite] = values[infinite].astype(str)
+    return out
+
+
+def _format_dates(column: pd.Series) -> np.ndarray:
+    dates = column.dt
+    if column.notna().any() and dates.year.min() < 1000:
+        # strftime pads short years differently from Timestamp.strftime.
+        return _format_cells(column)
+    return dates.strftime(_DATE_FORMAT).to_numpy(dtype=object, na_value="")
+
+
+def _format_column(column: pd.Series) -> np.ndarray:
+    """Format one column whose cells iterrows sees in their own type."""
+    dtype = column.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iu":
+            return _format_ints(column.to_numpy())
+        if dtype.kind == "f":
+            return _format_floats(column.to_numpy())
+        if dtype.kind == "b":
+            return np.where(column.to_numpy(), "1", "0").astype(object)
+    if isinstance(dtype, pd.DatetimeTZDtype) or getattr(dtype, "kind", None) == "M":
+        return _format_dates(column)
+    if isinstance(dtype, pd.StringDtype):
+        return column.to_numpy(dtype=object, na_value="")
+    return _format_cells(column.to_numpy(dtype=object))
+
+
+def _row_dtype(df: pd.DataFrame) -> np.dtype:
+    """The dtype ``df.values`` (and so each ``iterrows`` row) has."""
+    dtype = df.iloc[:0].values.dtype
+    if dtype.kind != "O" and any(is_extension_array_dtype(d) for d in df.dtypes):
+        # Extension arrays with missing values convert to object; only the
+        # full conversion tells.
+        dtype = df.to_numpy().dtype
+    return dtype
+
+
+def _format_chunk(chunk: pd.DataFrame, row_dtype: np.dtype) -> list[np.ndarray]:
+    columns = [chunk.iloc[:, j] for j in range(chunk.shape[1])]
+    if row_dtype.kind == "O":
+        return [_format_column(column) for column in columns]
+    if row_dtype.kind == "M":
+        return [_format_dates(column.astype(row_dtype)) for column in columns]
+    if row_dtype.kind in "iu":
+        return [_format_ints(column.to_numpy(dtype=row_dtype)) for column in columns]
+    if row_dtype.kind == "f":
+        return [_format_floats(column.to_numpy(dtype=row_dtype)) for column in columns]
+    if row_dtype.kind == "b":
+        return [
+            np.where(column.to_numpy(dtype=row_dtype), "1", "0").astype(object)
+            for column in columns
+        ]
+    return [_format_cells(pd.Series(column.to_numpy(dtype=row_dtype))) for column in columns]
+
+
+def write_csv_rows(writer, df: pd.DataFrame, chunk_rows: int = CSV_CHUNK_ROWS) -> None:
+    """Write ``df``'s header and formatted rows through ``writer``.
+
+    Args:
+        writer: A ``csv.writer``.
+        df: The chart data.
+        chunk_rows: Rows formatted and written at a time.
+    """
+    writer.writerow(df.columns)
+    if not df.shape[1]:
+        writer.writerows([] for _ in range(len(df)))
+        return
+    row_dtype = _row_dtype(df)
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start : start + chunk_rows]
+        columns = [column.tolist() for column in _format_chunk(chunk, row_dtype)]
+        writer.writerows(zip(*columns, strict=True))
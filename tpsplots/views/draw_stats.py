@@ -0,0 +1,93 @@
+"""Draw accounting and layout-only draws for chart figures.
+
+Header wrapping, axes stretching/alignment and annotation placement need
+final text and tick extents, which matplotlib only computes while drawing.
+A full ``fig.canvas.draw()`` at 300 dpi rasterizes every artist just to
+read those extents, so layout code uses :func:`layout_pass` instead: it runs
+the same draw with the renderer's ``draw_*`` methods disabled
+(``Figure.draw_without_rendering``), which performs text layout, tick
+updates and bbox-patch sizing at the output dpi without painting pixels.
+The only full draws left are the ones ``savefig`` does per output format.
+
+:func:`track_draws` attaches a :class:`DrawStats` counter to a figure so the
+number of full and layout-only draws per render can be checked.
+:func:`layout_pass` counts its own draws; any other draw is classified by
+its renderer, since ``savefig`` and adjustText also run layout-only draws.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from matplotlib.backend_bases import RendererBase
+from matplotlib.figure import Figure
+
+_STATS_ATTR = "_tpsplots_draw_stats"
+
+
+@dataclass
+class DrawStats:
+    """Draw counts for one figure."""
+
+    full: int = 0
+    layout: int = 0
+    # Set while layout_pass draws, so the draw_event it fires is not full.
+    _in_layout_pass: bool = field(default=False, repr=False, compare=False)
+
+
+def _is_layout_only(renderer: RendererBase | None) -> bool:
+    # Disabled drawing swaps each draw_* method for a no-op wrapped (via
+    # functools.update_wrapper) around RendererBase's own. Vector backends'
+    # MixedModeRenderer proxies the attribute to the renderer it wraps.
+    draw_path = getattr(renderer, "draw_path", None)
+    return getattr(draw_path, "__wrapped__", None) is RendererBase.draw_path
+
+
+def track_draws(fig: Figure) -> DrawStats:
+    """Return ``fig``'s draw counter, attaching it on first use.
+
+    Counts every later draw, including the ones ``savefig`` performs.
+    Canvas callbacks live on the figure, so the counter survives the
+    temporary SVG/PDF canvases ``savefig`` switches to.
+    """
+    stats = getattr(fig, _STATS_ATTR, None)
+    if stats is None:
+        stats = DrawStats()
+        setattr(fig, _STATS_ATTR, stats)
+
+        def on_draw(event) -> None:
+            if stats._in_layout_pass:
+                return
+            if _is_layout_only(event.renderer):
+                stats.layout += 1
+            else:
+                stats.full += 1
+
+        fig.canvas.mpl_connect("draw_event", on_draw)
+    return stats
+
+
+def reset_draw_tracking(fig: Figure) -> None:
+    """Drop ``fig``'s counter so :func:`track_draws` starts a new one.
+
+    For copies of a tracked figure: the copy carries the counter attribute
+    but not the canvas callback that updates it.
+    """
+    vars(fig).pop(_STATS_ATTR, None)
+
+
+def layout_pass(fig: Figure) -> RendererBase:
+    """Lay ``fig`` out at its output dpi without rasterizing; return the renderer.
+
+    Afterwards text extents, tick labels and tight bboxes are what a full
+    draw would produce, so ``get_window_extent``/``get_tightbbox`` can be
+    read with the returned renderer.
+    """
+    stats = track_draws(fig)
+    stats._in_layout_pass = True
+    try:
+        fig.draw_without_rendering()
+    finally:
+        stats._in_layout_pass = False
+    stats.layout += 1
+    return fig.canvas.get_renderer()
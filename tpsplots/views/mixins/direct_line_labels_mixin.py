@@ -5,7 +5,6 @@ import math
 from datetime import date, datetime
 
 import matplotlib.dates as mdates
-import matplotlib.path as mpath
 import matplotlib.transforms
 import numpy as np
 from matplotlib.transforms import Bbox
@@ -13,6 +12,7 @@ from matplotlib.transforms import Bbox
 from ..anim_tags import Roles, tag_artist
 from ..style import tokens
 from .param_utils import broadcast_param
+from .segment_index import SegmentIndex
 
 logger = logging.getLogger(__name__)
 
@@ -275,6 +275,8 @@ class DirectLineLabelsMixin:
                 if points:
                     pixels = ax.transData.transform(points)
                     all_line_data_display.append(pixels)
+        # Index the segments once; every candidate box of every label queries it.
+        line_index = SegmentIndex(all_line_data_display)
 
         # Collect endpoint information and find optimal positions
         existing_labels_bboxes = []
@@ -351,7 +353,7 @@ class DirectLineLabelsMixin:
                     last_x,
                     last_y,
                     text_bbox,
-                    all_line_data_display,
+                    line_index,
                     existing_labels_bboxes,
                     ax,
                     label_clearance_points,
@@ -501,7 +503,7 @@ class DirectLineLabelsMixin:
         x_data,
         y_data,
         text_bbox,
-        all_line_data_display,
+        line_index,
         existing_labels_bboxes,
         ax,
         markersize_points,
@@ -541,6 +543,11 @@ class DirectLineLabelsMixin:
             (45, "left", "bottom"),  # Top-right
         ]
 
+        # Extents of the labels placed so far, scored against all at once.
+        existing_extents = np.array(
+            [b.extents for b in existing_labels_bboxes], dtype=float
+        ).reshape(-1, 4)
+
         best_position = None
         best_score = float("inf")
 
@@ -569,7 +576,7 @@ class DirectLineLabelsMixin:
             label_bbox = Bbox.from_extents(bbox_x1, bbox_y1, bbox_x2, bbox_y2)
 
             score = self._score_label_position_display(
-                label_bbox, pref_order, all_line_data_display, existing_labels_bboxes, ax_bbox
+                label_bbox, pref_order, line_index, existing_extents, ax_bbox
             )
 
             if score < best_score:
@@ -598,7 +605,7 @@ class DirectLineLabelsMixin:
         return best_position
 
     def _score_label_position_display(
-        self, label_bbox, pref_order, all_line_data_display, existing_labels_bboxes, ax_bbox
+        self, label_bbox, pref_order, line_index, existing_extents, ax_bbox
     ):
         """Scores the label position in pixel coordinates. Lower is better."""
         score = 0
@@ -624,35 +631,21 @@ class DirectLineLabelsMixin:
                 1 + buffer / label_bbox.width, 1 + buffer / label_bbox.height
             )
 
-        for existing_bbox in existing_labels_bboxes:
-            if buffered_bbox.overlaps(existing_bbox):
-                score += 100
+        x0, y0, x1, y1 = buffered_bbox.extents
+        overlaps = (
+            (existing_extents[:, 0] < x1)
+            & (x0 < existing_extents[:, 2])
+            & (existing_extents[:, 1] < y1)
+            & (y0 < existing_extents[:, 3])
+        )
+        score += 100 * int(np.count_nonzero(overlaps))
 
         # Penalty for overlapping with line segments.
-        if self._label_intersects_line_display(label_bbox, all_line_data_display):
+        if self._label_intersects_line_display(label_bbox, line_index):
             score += 50
 
         return score
 
-    def _label_intersects_line_display(self, bbox, all_line_data_display):
-        """Checks whether the bounding box intersects any lines."""
-        try:
-            bbox_path = mpath.Path(bbox.corners(), closed=True)
-        except Exception as e:
-            logger.warning(f"Could not create bbox path for intersection check: {e}")
-            return False
-
-        for line_pixels in all_line_data_display:
-            if len(line_pixels) < 2:
-                continue
-
-            try:
-                line_path = mpath.Path(line_pixels)
-                if bbox_path.intersects_path(line_path, filled=True):
-                    return True
-                if bbox.contains_points(line_pixels).any():
-                    return True
-            except Exception as e:
-                logger.debug(f"Line path intersection check failed: {e}")
-
-        return False
+    def _label_intersects_line_display(self, bbox, line_index):
+        """Checks whether the bounding box intersects any line in ``line_index``."""
+        return line_index.intersects_box(bbox.x0, bbox.y0, bbox.x1, bbox.y1)
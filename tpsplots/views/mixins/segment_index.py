@@ -0,0 +1,144 @@
+"""Uniform-grid index of line segments for direct-label collision tests.
+
+Direct labels try up to eight candidate boxes per series, and every box must
+be tested against every line on the axes. :class:`SegmentIndex` converts the
+lines to display-space segments once per axes, buckets them into square grid
+cells, and answers "does this box touch any line?" by testing only the
+segments in the cells the box covers, all at once with NumPy. A segment
+whose bounding box spans more than :data:`MAX_CELLS_PER_SEGMENT` cells (a
+long diagonal, or a line running far off the axes) is kept out of the grid
+and tested against every box instead.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+# Grid cell edge in display pixels: around the height of a label box, so a
+# query touches a handful of cells and each cell holds few segments.
+DEFAULT_CELL_PX = 48.0
+
+# Grid entries one segment may occupy. Its bounding box covers nx * ny cells,
+# so a long diagonal would otherwise fill millions of them.
+MAX_CELLS_PER_SEGMENT = 256
+
+
+class SegmentIndex:
+    """Line segments in display coordinates, bucketed into a uniform grid.
+
+    Args:
+        lines: Polylines as ``(n, 2)`` arrays of display coordinates; lines
+            with fewer than two points have no segments and are ignored.
+        cell_px: Grid cell edge in pixels.
+
+    Example:
+        >>> index = SegmentIndex([ax.transData.transform(points)])
+        >>> index.intersects_box(x0, y0, x1, y1)
+        False
+    """
+
+    def __init__(self, lines: Iterable[np.ndarray], cell_px: float = DEFAULT_CELL_PX) -> None:
+        self.cell_px = float(cell_px)
+        parts = [
+            np.hstack([line[:-1], line[1:]])
+            for line in (np.asarray(line, dtype=float).reshape(-1, 2) for line in lines)
+            if len(line) >= 2
+        ]
+        # (n, 4) rows of x0, y0, x1, y1; segments with a non-finite end
+        # (a non-positive value on a log axis, say) are never drawn.
+        segments = np.vstack(parts) if parts else np.empty((0, 4))
+        self.segments = segments[np.isfinite(segments).all(axis=1)]
+        self._build_grid()
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def _cells(self, lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return (
+            np.floor(lo / self.cell_px).astype(np.int64),
+            np.floor(hi / self.cell_px).astype(np.int64),
+        )
+
+    def _build_grid(self) -> None:
+        """Sort (cell, segment) pairs by cell so each cell is a contiguous slice."""
+        seg = self.segments
+        self._keys = np.empty(0, dtype=np.int64)
+        self._members = np.empty(0, dtype=np.int64)
+        lo = np.minimum(seg[:, :2], seg[:, 2:])
+        hi = np.maximum(seg[:, :2], seg[:, 2:])
+        (cx0, cy0), (cx1, cy1) = (c.T for c in self._cells(lo, hi))
+        nx = cx1 - cx0 + 1
+        ny = cy1 - cy0 + 1
+        # Floats: the product of two huge spans must not overflow int64.
+        wide = nx.astype(float) * ny > MAX_CELLS_PER_SEGMENT
+        self._wide = np.flatnonzero(wide)
+        gridded = np.flatnonzero(~wide)
+        if not len(gridded):
+            return
+        cx0, cy0, cx1, cy1, nx, ny = (a[gridded] for a in (cx0, cy0, cx1, cy1, nx, ny))
+        self._origin = (int(cx0.min()), int(cy0.min()))
+        self._stride = int(cy1.max()) - self._origin[1] + 1
+        self._cx_max = int(cx1.max())
+
+        # Every other segment is registered in each cell of its bounding box.
+        counts = nx * ny
+        owner = np.repeat(gridded, counts)
+        local = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        slot = np.repeat(np.arange(len(gridded)), counts)
+        cx = cx0[slot] + local % nx[slot]
+        cy = cy0[slot] + local // nx[slot]
+        keys = self._key(cx, cy)
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._members = owner[order]
+
+    def _key(self, cx, cy):
+        return (cx - self._origin[0]) * self._stride + (cy - self._origin[1])
+
+    def candidates(self, x0: float, y0: float, x1: float, y1: float) -> np.ndarray:
+        """Indices of segments sharing a grid cell with the box, possibly repeated.
+
+        A superset of the segments that touch the box; a segment spanning
+        several of the box's cells appears once per cell, and segments too
+        large for the grid are always included.
+        """
+        if not len(self._keys):
+            return self._wide
+        (cx0, cy0), (cx1, cy1) = self._cells(np.array([x0, y0]), np.array([x1, y1]))
+        # Clamp to the occupied grid; cells outside it hold no segments.
+        cx0, cx1 = max(cx0, self._origin[0]), min(cx1, self._cx_max)
+        cy0, cy1 = max(cy0, self._origin[1]), min(cy1, self._origin[1] + self._stride - 1)
+        if cx0 > cx1 or cy0 > cy1:
+            return self._wide
+        # Within one grid column the box's cells are consecutive keys.
+        columns = np.arange(cx0, cx1 + 1)
+        starts = np.searchsorted(self._keys, self._key(columns, cy0), side="left")
+        stops = np.searchsorted(self._keys, self._key(columns, cy1), side="right")
+        found = [self._members[a:b] for a, b in zip(starts, stops, strict=True)]
+        return np.concatenate([*found, self._wide])
+
+    def intersects_box(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        """Whether any segment touches the box ``[x0, x1] x [y0, y1]``.
+
+        Liang-Barsky clipping of all nearby segments at once: a segment hits
+        the box if some part of it survives clipping to all four edges.
+        """
+        idx = self.candidates(x0, y0, x1, y1)
+        if not len(idx):
+            return False
+        seg = self.segments[idx]
+        px, py = seg[:, 0], seg[:, 1]
+        dx, dy = seg[:, 2] - px, seg[:, 3] - py
+        t_enter = np.zeros(len(seg))
+        t_exit = np.ones(len(seg))
+        inside = np.ones(len(seg), dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for p, q in ((-dx, px - x0), (dx, x1 - px), (-dy, py - y0), (dy, y1 - py)):
+                parallel = p == 0
+                inside &= ~(parallel & (q < 0))
+                ratio = q / p
+                t_enter = np.where(~parallel & (p < 0), np.maximum(t_enter, ratio), t_enter)
+                t_exit = np.where(~parallel & (p > 0), np.minimum(t_exit, ratio), t_exit)
+        return bool(np.any(inside & (t_enter <= t_exit)))
@@ -0,0 +1,161 @@
+"""Immutable chart parameters shared by every device render.
+
+``generate_chart`` draws the same parameters three times (desktop, mobile,
+social), and the editor and animation paths draw them again per preview or
+format. Instead of deep-copying them for each render, :class:`RenderParams`
+freezes them once:
+
+- NumPy arrays become read-only views of the same buffer;
+- dicts and lists become :class:`FrozenDict` / :class:`FrozenList`, which
+  still pass ``isinstance(value, dict)`` / ``isinstance(value, list)`` but
+  raise ``TypeError`` on any in-place change; tuples are rebuilt and sets
+  become frozensets;
+- DataFrames and Series are shallow copies under pandas copy-on-write, and
+  :meth:`RenderParams.for_render` hands each render its own shallow copy,
+  including frames nested in dicts, lists and tuples, so a view may reshape
+  a frame without another render seeing it.
+
+A view that needs to change a list or mapping it was given works on its
+own copy (``list(colors)``, ``dict(legend)``); writing into the frozen
+input fails loudly instead of leaking into the next device's render.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any, NoReturn
+
+import numpy as np
+import pandas as pd
+
+# pandas 3 always uses copy-on-write; pandas 2 only when opted in. Without it
+# a shallow copy shares column buffers, so fall back to a deep copy.
+PANDAS_COW = (
+    int(pd.__version__.split(".", 1)[0]) >= 3
+    or getattr(pd.options.mode, "copy_on_write", False) is True
+)
+
+
+def _read_only(self, *args, **kwargs) -> NoReturn:
+    raise TypeError(
+        f"{type(self).__name__} is read-only; copy it before modifying "
+        "(render parameters are shared across device renders)"
+    )
+
+
+class FrozenDict(dict):
+    """A ``dict`` whose contents cannot be changed in place."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Rebuilt through freeze() so unpickled arrays are read-only again.
+        return (freeze, (dict(self),))
+
+
+class FrozenList(list):
+    """A ``list`` whose contents cannot be changed in place."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (freeze, (list(self),))
+
+
+# Element types that need no freezing; long y-series are made of these, so
+# lists of them are wrapped without a freeze() call per element.
+_SCALAR_TYPES = frozenset(
+    {type(None), bool, int, float, complex, str, bytes, np.float64, np.float32, np.int64}
+)
+
+
+def _share_frame(value: pd.DataFrame | pd.Series) -> pd.DataFrame | pd.Series:
+    return value.copy(deep=not PANDAS_COW)
+
+
+def _holds_frame(value: Any) -> bool:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return True
+    if isinstance(value, dict):
+        return any(_holds_frame(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_holds_frame(item) for item in value)
+    return False
+
+
+def _fresh_frames(value: Any) -> Any:
+    """``value`` with every DataFrame and Series in it replaced by its own copy."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return _share_frame(value)
+    if isinstance(value, dict):
+        return FrozenDict({key: _fresh_frames(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList([_fresh_frames(item) for item in value])
+    if isinstance(value, tuple):
+        return tuple(_fresh_frames(item) for item in value)
+    return value
+
+
+def freeze(value: Any) -> Any:
+    """Return an immutable view of ``value`` that shares its data.
+
+    Containers are rebuilt recursively (the elements themselves are not
+    copied), arrays become read-only views and frames shallow copies.
+    Scalars and any other objects are returned as they are.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return _share_frame(value)
+    if isinstance(value, np.ndarray):
+        view = value.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        if all(type(item) in _SCALAR_TYPES for item in value):
+            return FrozenList(value)
+        return FrozenList([freeze(item) for item in value])
+    if isinstance(value, tuple):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+class RenderParams(FrozenDict):
+    """Frozen chart keyword arguments, safe to share between renders.
+
+    Example:
+        >>> params = RenderParams.of(kwargs)
+        >>> for style in (view.DESKTOP, view.MOBILE):
+        ...     fig = view._create_chart(metadata, style=style, **params.for_render())
+    """
+
+    def __init__(self, kwargs: Mapping[str, Any] | Iterable[tuple[str, Any]] = ()) -> None:
+        super().__init__({key: freeze(value) for key, value in dict(kwargs).items()})
+        # Keys whose value is or contains a frame; for_render copies those.
+        self._frame_keys = frozenset(key for key, value in self.items() if _holds_frame(value))
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+    @classmethod
+    def of(cls, kwargs: Mapping[str, Any]) -> RenderParams:
+        """``kwargs`` frozen, or ``kwargs`` itself when it already is."""
+        return kwargs if isinstance(kwargs, cls) else cls(kwargs)
+
+    def for_render(self) -> dict[str, Any]:
+        """A fresh kwargs dict for one render.
+
+        Everything is shared except DataFrames and Series, which get their
+        own copy-on-write shallow copy wherever they sit; the containers
+        holding them are rebuilt around the copies.
+        """
+        return {
+            key: _fresh_frames(value) if key in self._frame_keys else value
+            for key, value in self.items()
+        }
@@ -13,6 +13,7 @@ from matplotlib.patches import Rectangle
 
 from tpsplots.models.charts.treemap import TreemapChartConfig, raise_for_geometry_overrides
 from tpsplots.views.chart_view import ChartView
+from tpsplots.views.draw_stats import layout_pass
 from tpsplots.views.mixins.color_cycle_mixin import ColorCycleMixin
 from tpsplots.views.style import tokens
 
@@ -30,6 +31,8 @@ class TreemapChartView(ColorCycleMixin, ChartView):
     """Render flat treemaps for desktop, mobile, and social outputs."""
 
     CONFIG_CLASS: ClassVar[type] = TreemapChartConfig
+    # Tiles are sized to the axes after the header/footer layout.
+    _REUSABLE_BODY: ClassVar[bool] = False
 
     def treemap_plot(self, metadata, stem, **kwargs):
         """Generate desktop, mobile, and social treemap outputs."""
@@ -240,9 +243,8 @@ class TreemapChartView(ColorCycleMixin, ChartView):
         if not candidates:
             return
 
+        renderer = layout_pass(ax.figure)
         figure = ax.figure
-        figure.canvas.draw()
-        renderer = figure.canvas.get_renderer()
         inset = 4 * figure.dpi / 72
         for patch, text in candidates:
             corners = ax.transData.transform(
@@ -296,8 +298,7 @@ class TreemapChartView(ColorCycleMixin, ChartView):
             ax.set_axis_off()
 
             self._adjust_layout_for_header_footer(fig, metadata, style)
-            fig.canvas.draw()
-            renderer = fig.canvas.get_renderer()
+            renderer = layout_pass(fig)
             axes_bbox = ax.get_window_extent(renderer)
             layout_height = 100.0
             layout_width = layout_height * axes_bbox.width / axes_bbox.height
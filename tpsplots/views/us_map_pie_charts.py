@@ -1,13 +1,19 @@
 """Improved US Map with pie charts visualization with expanded offset functionality."""
 
+import functools
 import itertools
+import json
 import logging
 from typing import ClassVar
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.collections import PathCollection
+from matplotlib.path import Path
+from matplotlib.transforms import IdentityTransform
 
+from tpsplots import PACKAGE_ROOT
 from tpsplots.models.charts.us_map_pie import USMapPieChartConfig
 
 from .chart_view import ChartView
@@ -15,6 +21,101 @@ from .mixins import ColorCycleMixin
 
 logger = logging.getLogger(__name__)
 
+STATES_GEOJSON = PACKAGE_ROOT / "data_sources" / "us-states.geojson"
+_EXCLUDED_STATES = frozenset({"AK", "HI"})
+
+
+@functools.cache
+def _lower48_state_paths() -> tuple[Path, ...]:
+    """Lower-48 state outlines from the bundled GeoJSON, parsed once per process.
+
+    One compound, read-only path per state (each polygon's exterior and
+    interior rings, for every part of a MultiPolygon), in lon/lat data
+    coordinates — the same paths GeoDataFrame.plot would build, without
+    importing geopandas or re-reading the file for every chart.
+    """
+    with STATES_GEOJSON.open(encoding="utf-8") as f:
+        features = json.load(f)["features"]
+
+    paths = []
+    for feature in features:
+        if feature.get("id") in _EXCLUDED_STATES:
+            continue
+        geometry = feature["geometry"]
+        polygons = (
+            [geometry["coordinates"]] if geometry["type"] == "Polygon" else geometry["coordinates"]
+        )
+        rings = [
+            Path(np.asarray(ring, dtype=float)[:, :2], closed=True)
+            for polygon in polygons
+            for ring in polygon
+        ]
+        compound = Path.make_compound_path(*rings)
+        paths.append(Path(compound.vertices, compound.codes, readonly=True))
+    return tuple(paths)
+
+
+class _PieWedges:
+    """Pie wedges for many pies, drawn as a single collection.
+
+    Each wedge is a scatter-style marker: a filled arc polygon normalized
+    like a custom ``scatter`` marker, sized in points² and placed at its pie's
+    data position. Wedges keep the order they were added in, so overlapping
+    pies stack as they would with one ``scatter`` call per wedge.
+    """
+
+    # Points per wedge arc.
+    ARC_POINTS = 50
+
+    def __init__(self) -> None:
+        self.paths: list[Path] = []
+        self.offsets: list[tuple[float, float]] = []
+        self.sizes: list[float] = []
+        self.facecolors: list = []
+        self.edgecolors: list = []
+        self.linewidths: list[float] = []
+
+    def add_pie(self, angles, position, size, colors, *, edgecolor, linewidth) -> None:
+        """Add one pie's wedges between consecutive ``angles`` (radians)."""
+        starts = np.asarray(angles[:-1], dtype=float)
+        stops = np.asarray(angles[1:], dtype=float)
+        # np.linspace(start, stop, ARC_POINTS) for every wedge at once, with
+        # the same arithmetic so the arcs match it bit for bit.
+        step = (stops - starts) / (self.ARC_POINTS - 1)
+        arcs = np.arange(self.ARC_POINTS) * step[:, None] + starts[:, None]
+        arcs[:, -1] = stops
+        vertices = np.zeros((len(starts), self.ARC_POINTS + 1, 2))
+        vertices[:, 1:, 0] = np.cos(arcs)
+        vertices[:, 1:, 1] = np.sin(arcs)
+        # Custom markers are scaled so their largest coordinate is 0.5.
+        vertices *= (0.5 / np.abs(vertices).max(axis=(1, 2)))[:, None, None]
+
+        self.paths.extend(Path(v) for v in vertices)
+        self.offsets.extend([position] * len(starts))
+        self.sizes.extend([size] * len(starts))
+        self.facecolors.extend(colors)
+        self.edgecolors.extend([edgecolor] * len(starts))
+        self.linewidths.extend([linewidth] * len(starts))
+
+    def draw(self, ax) -> PathCollection | None:
+        """Add the wedges to ``ax`` as one collection."""
+        if not self.paths:
+            return None
+        collection = PathCollection(
+            self.paths,
+            self.sizes,
+            facecolors=self.facecolors,
+            edgecolors=self.edgecolors,
+            linewidths=self.linewidths,
+            offsets=self.offsets,
+            offset_transform=ax.transData,
+            alpha=0.85,
+            zorder=10,
+        )
+        collection.set_transform(IdentityTransform())
+        ax.add_collection(collection)
+        return collection
+
 
 class USMapPieChartView(ColorCycleMixin, ChartView):
     """Specialized view for displaying pie charts overlaid on a US map at specific locations."""
@@ -123,33 +224,23 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
         return self.generate_chart(metadata, stem, **kwargs)
 
     def _load_states_map(self, ax, show_state_boundaries):
-        """Load and draw the US states base map, with fallback geometry."""
+        """Draw the lower-48 states base map, with fallback geometry."""
         try:
-            import geopandas as gpd
-
-            try:
-                from tpsplots import PACKAGE_ROOT
-
-                states_file = PACKAGE_ROOT / "data_sources" / "us-states.geojson"
-                states = gpd.read_file(states_file)
-                states = states[~states["id"].isin(["AK", "HI"])]
-            except Exception:
-                states = gpd.read_file(
-                    "https://raw.githubusercontent.com/nvkelso/natural-earth-vector/master/geojson/ne_110m_admin_1_states_provinces.geojson"
-                ).query(
-                    "iso_3166_2.str.startswith('US-') and iso_3166_2 != 'US-AK' and iso_3166_2 != 'US-HI'"
-                )
-
-            states.plot(
-                ax=ax,
-                facecolor="lightgray",
-                edgecolor="white" if show_state_boundaries else "lightgray",
-                linewidth=0.5 if show_state_boundaries else 0.1,
-                alpha=0.7,
-            )
+            paths = _lower48_state_paths()
         except Exception as e:
             logger.warning(f"Could not load US states data: {e}, using fallback map")
             self._create_fallback_map(ax)
+            return
+
+        states = PathCollection(
+            paths,
+            facecolor="lightgray",
+            edgecolor="white" if show_state_boundaries else "lightgray",
+            linewidth=0.5 if show_state_boundaries else 0.1,
+            alpha=0.7,
+        )
+        ax.add_collection(states)
+        ax.autoscale_view()
 
     @staticmethod
     def _scale_pie_size_params(style, base_pie_size, min_pie_size, max_pie_size):
@@ -206,6 +297,7 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
         """Draw pie charts for all centers and collect unique legend entries."""
         legend_elements = []
         legend_labels = set()
+        wedges = _PieWedges()
 
         for location_name, data in pie_data.items():
             if location_name not in all_locations:
@@ -252,6 +344,7 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
                 style,
                 pie_edge_color,
                 pie_edge_width,
+                wedges=wedges,
             )
 
             font_size = 12 if style and style.get("type") == "desktop" else 10.5
@@ -276,6 +369,7 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
                     )
                     legend_labels.add(label)
 
+        wedges.draw(ax)
         return legend_elements, legend_labels
 
     def _add_map_legend(
@@ -581,9 +675,10 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
         style=None,
         pie_edge_color="white",
         pie_edge_width=0.5,
+        wedges=None,
     ):
         """
-        Draw a pie chart using scatter plots with improved percentage positioning.
+        Draw a pie chart as scatter-style wedge markers with percentage labels.
 
         Args:
             values: List of values for pie segments
@@ -599,6 +694,8 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
             style: Style dictionary to determine if desktop or mobile
             pie_edge_color: Edge color for pie wedges (default: 'white')
             pie_edge_width: Edge line width for pie wedges (default: 0.5)
+            wedges: Optional ``_PieWedges`` batch to add the wedges to; the
+                caller draws it. By default the wedges are drawn immediately.
         """
         # Normalize values for pie slices
         total = sum(values)
@@ -621,48 +718,37 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
             # Fallback for invalid input
             show_percentages_list = [False] * len(values)
 
-        # Calculate cumulative proportions
-        cumsum = np.cumsum(values)
-        cumsum = cumsum / cumsum[-1]
-        pie = [0, *cumsum.tolist()]
-
-        # Start angle offset to align all pies the same way (90 degrees = 12 o'clock)
-        start_angle_offset = np.pi / 2  # 90 degrees in radians
+        # Wedge boundaries as fractions of the pie, then as angles measured
+        # from 12 o'clock (so all pies align the same way).
+        bounds = np.concatenate([[0.0], np.cumsum(values, dtype=float)])
+        bounds /= bounds[-1]
+        start_angle_offset = np.pi / 2
+        angles = start_angle_offset + 2 * np.pi * bounds
 
         # Calculate consistent pie radius in data coordinates
         # Use a simpler, position-independent approach
         pie_radius_data = self._calculate_pie_radius_data(size)
 
-        # Draw each pie segment
-        for i, (r1, r2) in enumerate(itertools.pairwise(pie)):
-            # Create angles for this segment, starting from 12 o'clock
-            angles = np.linspace(
-                2 * np.pi * r1 + start_angle_offset, 2 * np.pi * r2 + start_angle_offset, 50
-            )
-
-            # Create pie wedge coordinates
-            x = [0, *np.cos(angles).tolist()]
-            y = [0, *np.sin(angles).tolist()]
-
-            # Create marker from coordinates
-            xy = np.column_stack([x, y])
-
-            # Use color from provided list or default
-            color = colors[i] if i < len(colors) else self._get_cycled_colors(1)[0]
-
-            # Draw the pie segment with exact positioning
-            ax.scatter(
-                [xpos],
-                [ypos],
-                marker=xy,
-                s=size,
-                color=color,
-                alpha=0.85,
-                edgecolors=pie_edge_color,
-                linewidths=pie_edge_width,
-                zorder=10,
-            )
+        # Colors from the provided list, then the color cycle
+        wedge_colors = [
+            colors[i] if i < len(colors) else self._get_cycled_colors(1)[0]
+            for i in range(len(values))
+        ]
+
+        batch = _PieWedges() if wedges is None else wedges
+        batch.add_pie(
+            angles,
+            (xpos, ypos),
+            size,
+            wedge_colors,
+            edgecolor=pie_edge_color,
+            linewidth=pie_edge_width,
+        )
+        if wedges is None:
+            batch.draw(ax)
 
+        for i, (a1, a2) in enumerate(itertools.pairwise(angles)):
+            color = wedge_colors[i]
             # Add percentage label if requested for this specific segment
             if show_percentages_list[i]:
                 # Calculate percentage
@@ -671,7 +757,7 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
                 # Show percentages for segments >= 1%
                 if percentage >= 1:
                     # Calculate the middle angle of this segment for label positioning
-                    mid_angle = (2 * np.pi * r1 + 2 * np.pi * r2) / 2 + start_angle_offset
+                    mid_angle = (a1 + a2) / 2
 
                     # Adjust label radius based on segment size for better visual balance
                     # Smaller segments get labels closer to center, larger segments farther out
@@ -891,7 +977,7 @@ class USMapPieChartView(ColorCycleMixin, ChartView):
         return offset_positions
 
     def _create_fallback_map(self, ax):
-        """Create a simple fallback map when geopandas is not available."""
+        """Create a simple fallback map when the states geometry cannot be loaded."""
         # Simple rectangular map bounds (approximate continental US)
         ax.set_xlim(-125, -66.5)
         ax.set_ylim(20, 50)
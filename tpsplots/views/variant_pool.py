@@ -0,0 +1,99 @@
+"""Process pool for rendering a chart's device variants concurrently.
+
+``ChartView.generate_chart`` builds desktop, mobile and social figures from
+the same inputs and saves each one independently, so with
+``parallel_variants`` enabled the three variants are built *and* encoded
+(SVG/PNG/PPTX) in separate worker processes. Per-chart latency then tracks
+the slowest variant instead of the sum of all three, which matters for heavy
+charts such as ``us_map_pie_plot``.
+
+The pool is created on first use and reused for the rest of the process, so
+the cost of spawning interpreters (and importing matplotlib in them) is paid
+once per run, not once per chart. Workers are spawned rather than forked for
+the same reason as the ``generate --jobs`` pool: no pyplot or font-cache state
+is inherited from the parent.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from tpsplots import ensure_matplotlib
+
+if TYPE_CHECKING:
+    from tpsplots.views.chart_view import ChartView
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(logging.getLogger().level,),
+            )
+        return _pool
+
+
+def _init_worker(log_level: int) -> None:
+    ensure_matplotlib()
+    logging.basicConfig(level=log_level, format="%(message)s", force=True)
+    logging.getLogger("matplotlib.category").setLevel(logging.WARNING)
+
+
+def _render_in_worker(
+    view: ChartView, metadata: dict, stem: str, device: str, kwargs: dict
+) -> list[str]:
+    # Unpickling skips ChartView.__init__, so re-apply the view's style here.
+    view._apply_style()
+    return view._render_variant(metadata, stem, device, kwargs)
+
+
+def picklable(*payload: Any) -> bool:
+    """Return True when ``payload`` can be sent to a worker process."""
+    try:
+        pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:  # Boundary: any pickling failure means "render in-process"
+        logger.debug(f"Rendering variants in-process; inputs are not picklable: {e}")
+        return False
+    return True
+
+
+def submit_variants(
+    view: ChartView, metadata: dict, stem: str, devices: list[str], kwargs: dict
+) -> list[Future]:
+    """Submit one render job per device and return the futures in order."""
+    pool = _get_pool(len(devices))
+    return [
+        pool.submit(_render_in_worker, view, metadata, stem, device, kwargs) for device in devices
+    ]
+
+
+def reset_variant_pool() -> None:
+    """Shut the pool down; the next parallel render starts a fresh one.
+
+    Called after a worker crashed (the executor is unusable from then on)
+    and available for callers that want to release the worker processes.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def variant_pool_active() -> bool:
+    """Whether worker processes are currently running."""
+    return _pool is not None